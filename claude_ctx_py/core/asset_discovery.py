@@ -19,7 +19,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-from .base import _extract_front_matter
+from .base import _extract_front_matter, _yaml_safe_load
 
 
 class AssetCategory(Enum):
@@ -241,8 +241,7 @@ def _parse_command_file(path: Path, namespace: Optional[str]) -> Optional[Asset]
         front_matter: Dict[str, Any] = {}
         if front_matter_str:
             try:
-                import yaml
-                front_matter = yaml.safe_load(front_matter_str) or {}
+                front_matter = _yaml_safe_load(front_matter_str) or {}
             except Exception:
                 pass
 
@@ -289,8 +288,7 @@ def _discover_agents(plugin_root: Path) -> List[Asset]:
             front_matter: Dict[str, Any] = {}
             if front_matter_str:
                 try:
-                    import yaml
-                    front_matter = yaml.safe_load(front_matter_str) or {}
+                    front_matter = _yaml_safe_load(front_matter_str) or {}
                 except Exception:
                     pass
 
@@ -339,8 +337,7 @@ def _discover_skills(plugin_root: Path) -> List[Asset]:
             front_matter: Dict[str, Any] = {}
             if front_matter_str:
                 try:
-                    import yaml
-                    front_matter = yaml.safe_load(front_matter_str) or {}
+                    front_matter = _yaml_safe_load(front_matter_str) or {}
                 except Exception:
                     pass
 
@@ -424,9 +421,8 @@ def _discover_workflows(plugin_root: Path) -> List[Asset]:
 
     for path in workflows_dir.glob("*.yaml"):
         try:
-            import yaml
             content = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
+            data = _yaml_safe_load(content)
 
             if not isinstance(data, dict):
                 continue
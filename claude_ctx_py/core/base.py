@@ -35,6 +35,16 @@ try:  # pragma: no cover - dependency availability exercised in tests
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore[assignment]
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", None) or getattr(
+    yaml, "SafeLoader", None
+)
+
+
+def _yaml_safe_load(text: str) -> Any:
+    """``yaml.safe_load`` equivalent that uses libyaml when available."""
+    return yaml.load(text, Loader=_YamlLoader)
+
 
 def _resolve_claude_dir(home: Path | None = None) -> Path:
     """Resolve the working Claude directory.
@@ -166,16 +176,32 @@ def _is_disabled(path: Path) -> bool:
     return "/disabled/" in text or "/inactive/" in text
 
 
-def _iter_md_files(directory: Path) -> List[Path]:
-    if not directory.is_dir():
+def _iter_files(directory: Path, suffix: str = "") -> List[Path]:
+    """Return the sorted files directly inside ``directory`` ending in ``suffix``.
+
+    Uses ``os.scandir`` so the name filter and file-type check come from the
+    directory listing instead of a stat per entry, and only matching entries
+    become ``Path`` objects.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            ]
+    except OSError:
         return []
-    return sorted(p for p in directory.glob("*.md") if p.is_file())
+    names.sort()
+    return [Path(name) for name in names]
+
+
+def _iter_md_files(directory: Path) -> List[Path]:
+    return _iter_files(directory, ".md")
 
 
 def _iter_all_files(directory: Path) -> List[Path]:
-    if not directory.is_dir():
-        return []
-    return sorted(p for p in directory.iterdir() if p.is_file())
+    return _iter_files(directory)
 
 
 def _parse_active_entries(path: Path) -> List[str]:
@@ -582,7 +608,7 @@ def _load_yaml(path: Path) -> Tuple[bool, Any, str]:
     except OSError as exc:
         return False, None, f"Failed to read {path}: {exc}"
     try:
-        data = yaml.safe_load(text)
+        data = _yaml_safe_load(text)
     except yaml.YAMLError as exc:
         return False, None, f"YAML parse error - {exc}"
     return True, data, ""
@@ -6,6 +6,7 @@ predict needs, and auto-manage the framework without manual intervention.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import time
 from dataclasses import dataclass, asdict
@@ -15,6 +16,15 @@ from typing import List, Dict, Optional, Set, Tuple, Any
 from collections import defaultdict, Counter
 
 
+# Bit flags packed into SessionContext.flags
+CONTEXT_FRONTEND = 1 << 0
+CONTEXT_BACKEND = 1 << 1
+CONTEXT_DATABASE = 1 << 2
+CONTEXT_TESTS = 1 << 3
+CONTEXT_AUTH = 1 << 4
+CONTEXT_API = 1 << 5
+
+
 @dataclass
 class SessionContext:
     """Represents the current session context for intelligent decision-making."""
@@ -46,6 +56,18 @@ class SessionContext:
     active_modes: List[str]
     active_rules: List[str]
 
+    @property
+    def flags(self) -> int:
+        """Detected code contexts packed as ``CONTEXT_*`` bit flags."""
+        return (
+            (CONTEXT_FRONTEND if self.has_frontend else 0)
+            | (CONTEXT_BACKEND if self.has_backend else 0)
+            | (CONTEXT_DATABASE if self.has_database else 0)
+            | (CONTEXT_TESTS if self.has_tests else 0)
+            | (CONTEXT_AUTH if self.has_auth else 0)
+            | (CONTEXT_API if self.has_api else 0)
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -599,6 +621,15 @@ class IntelligentAgent:
         self.recommendations: List[AgentRecommendation] = []
         self.auto_activated: Set[str] = set()
 
+        # Predictions persisted across runs, keyed by a context signature
+        self.prediction_cache_file = data_dir / "prediction_cache.json"
+        self._prediction_cache: Optional[Dict[str, Any]] = None
+
+        # Bumped by analyze_context; auto-activation candidates are reused
+        # until the context is analyzed again
+        self._context_generation = 0
+        self._auto_candidates: Optional[Tuple[int, List[str]]] = None
+
     def analyze_context(self, files: Optional[List[Path]] = None) -> SessionContext:
         """Analyze current context.
 
@@ -612,6 +643,7 @@ class IntelligentAgent:
             files = self.context_detector.detect_from_git()
 
         self.current_context = self.context_detector.detect_from_files(files)
+        self._context_generation += 1
         return self.current_context
 
     def get_recommendations(self) -> List[AgentRecommendation]:
@@ -624,7 +656,18 @@ class IntelligentAgent:
             self.analyze_context()
 
         assert self.current_context is not None
+        cache = self._prediction_entry()
+        cached = cache.get("recommendations")
+        if cached is not None:
+            try:
+                self.recommendations = [AgentRecommendation(**item) for item in cached]
+                return self.recommendations
+            except TypeError:
+                pass  # Stale cache layout; recompute
+
         self.recommendations = self.learner.predict_agents(self.current_context)
+        cache["recommendations"] = [asdict(rec) for rec in self.recommendations]
+        self._save_prediction_cache()
         return self.recommendations
 
     def get_auto_activations(self) -> List[str]:
@@ -633,12 +676,18 @@ class IntelligentAgent:
         Returns:
             List of agent names to activate
         """
-        recommendations = self.get_recommendations()
-        return [
-            rec.agent_name
-            for rec in recommendations
-            if rec.auto_activate and rec.agent_name not in self.auto_activated
-        ]
+        cached = self._auto_candidates
+        if cached is not None and cached[0] == self._context_generation:
+            candidates = cached[1]
+        else:
+            candidates = [
+                rec.agent_name
+                for rec in self.get_recommendations()
+                if rec.auto_activate
+            ]
+            self._auto_candidates = (self._context_generation, candidates)
+
+        return [name for name in candidates if name not in self.auto_activated]
 
     def mark_auto_activated(self, agent_name: str) -> None:
         """Mark an agent as auto-activated.
@@ -658,7 +707,72 @@ class IntelligentAgent:
             self.analyze_context()
 
         assert self.current_context is not None
-        return self.learner.predict_workflow(self.current_context)
+        cache = self._prediction_entry()
+        if "workflow" in cache:
+            cached = cache["workflow"]
+            try:
+                return WorkflowPrediction(**cached) if cached is not None else None
+            except TypeError:
+                pass  # Stale cache layout; recompute
+
+        workflow = self.learner.predict_workflow(self.current_context)
+        cache["workflow"] = asdict(workflow) if workflow is not None else None
+        self._save_prediction_cache()
+        return workflow
+
+    def _prediction_signature(self) -> str:
+        """Fingerprint the inputs that predictions are derived from.
+
+        Covers the working directory, the changed files and the state of the
+        session history, so cached predictions are reused only while all of
+        them are unchanged.
+        """
+        assert self.current_context is not None
+        try:
+            stat = self.learner.history_file.stat()
+            history_key: Optional[List[int]] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            history_key = None
+
+        payload = json.dumps(
+            [
+                str(Path.cwd()),
+                sorted(self.current_context.files_changed),
+                history_key,
+                len(self.learner.agent_sequences),
+                len(self.learner.success_contexts),
+                self.learner.semantic_matcher is not None,
+            ]
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _prediction_entry(self) -> Dict[str, Any]:
+        """Return the cached predictions for the current context signature."""
+        signature = self._prediction_signature()
+        cache = self._prediction_cache
+        if cache is None:
+            try:
+                with open(self.prediction_cache_file, "r") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = None
+            if not isinstance(cache, dict):
+                cache = {}
+
+        if cache.get("signature") != signature:
+            cache = {"signature": signature}
+        self._prediction_cache = cache
+        return cache
+
+    def _save_prediction_cache(self) -> None:
+        """Persist cached predictions; failures only cost a recompute."""
+        if self._prediction_cache is None:
+            return
+        try:
+            with open(self.prediction_cache_file, "w") as f:
+                json.dump(self._prediction_cache, f)
+        except OSError:
+            pass
 
     def record_session_success(
         self, agents_used: List[str], duration: int, outcome: str = "success"
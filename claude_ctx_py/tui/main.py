@@ -2,30 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import json
 import os
 import shutil
 import subprocess
 import tempfile
 import time
-import yaml
 import re
 import sys
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TypedDict
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Horizontal
+from textual.containers import Container, Horizontal, VerticalScroll
+from textual.coordinate import Coordinate
+from textual.notifications import SeverityLevel
+from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import ContentSwitcher, DataTable, Header, Static
 
 from .widgets import AdaptiveFooter
 
-AnyDataTable = DataTable[Any]
-from textual.reactive import reactive
-
 from .types import (
     RuleNode, AgentTask, WorkflowInfo, ModeInfo, ScenarioInfo, ScenarioRuntimeState,
     AssetInfo, MemoryNote, WatchModeState,
@@ -41,7 +57,6 @@ from ..core import (
     agent_deactivate,
     AgentGraphNode,
     _resolve_claude_dir,
-    _iter_all_files,
     _is_disabled,
     _extract_agent_name,
     _read_agent_front_matter_lines,
@@ -87,15 +102,23 @@ from ..core import (
     _inactive_dir_candidates,
     _inactive_category_dir,
 )
-from ..core.rules import rules_activate, rules_deactivate
+from ..core.rules import rules_activate
+from ..core.components import component_activate, component_deactivate
 from ..core.modes import (
     mode_activate,
     mode_deactivate,
     mode_activate_intelligent,
     mode_deactivate_intelligent,
 )
-from ..core.base import _iter_md_files, _parse_active_entries, _strip_ansi_codes
+from ..core.base import (
+    _iter_files,
+    _iter_md_files,
+    _parse_active_entries,
+    _strip_ansi_codes,
+    _yaml_safe_load,
+)
 from ..core.mcp import (
+    _get_claude_config_path,
     discover_servers,
     validate_server_config,
     generate_config_snippet,
@@ -114,7 +137,6 @@ from ..core.asset_discovery import (
     Asset, ClaudeDir, AssetCategory, InstallStatus,
     discover_plugin_assets, find_claude_directories, check_installation_status,
 )
-from ..core.asset_installer import install_asset, uninstall_asset, get_asset_diff
 from .dialogs import (
     TargetSelectorDialog,
     AssetDetailDialog,
@@ -128,10 +150,10 @@ from .dialogs import (
     ProfileConfig,
     HooksManagerDialog,
     BackupManagerDialog,
+    MemoryNoteDialog,
 )
 from ..core.mcp_installer import install_and_configure
 from ..core.mcp_registry import get_server
-from ..core import _resolve_claude_dir
 from ..tui_icons import Icons, StatusIcon
 from ..tui_format import Format
 from ..tui_progress import ProgressBar
@@ -141,13 +163,26 @@ from ..tui_dashboard import MetricsCollector
 from ..tui_performance import PerformanceMonitor
 from ..tui_workflow_viz import WorkflowNode, DependencyVisualizer
 from ..tui_overview_enhanced import EnhancedOverview
-from ..token_counter import get_active_context_tokens, count_category_tokens
+from ..token_counter import (
+    TokenStats,
+    count_category_tokens,
+    get_active_context_tokens,
+)
+from ..memory import NoteType, get_vault_stats, list_notes, read_note
 from ..intelligence import (
     AgentRecommendation,
     IntelligentAgent,
     SessionContext,
     WorkflowPrediction,
 )
+from ..intelligence.base import (
+    CONTEXT_API,
+    CONTEXT_AUTH,
+    CONTEXT_BACKEND,
+    CONTEXT_DATABASE,
+    CONTEXT_FRONTEND,
+    CONTEXT_TESTS,
+)
 from ..tui_supersaiyan import SuperSaiyanStatusBar
 from ..tui_dialogs import (
     MCPServerData,
@@ -166,8 +201,243 @@ from ..slash_commands import SlashCommandInfo, scan_slash_commands
 from ..watch import WatchMode
 import threading
 
+orjson: Optional[ModuleType]
+try:  # pragma: no cover - optional dependency
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+else:
+    orjson = _orjson
+
+AnyDataTable = DataTable[Any]
+_T = TypeVar("_T")
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+# Expected types of the optional top-level fields of a workflow YAML file
+_WORKFLOW_FIELD_TYPES: Tuple[Tuple[str, type], ...] = (
+    ("name", str),
+    ("description", str),
+    ("steps", list),
+)
+# Saved-profile list entries, e.g. AGENTS="a b c"
+_PROFILE_LIST_RES = {
+    key: re.compile(rf'{key}="([^"]*)"') for key in ("AGENTS", "MODES", "RULES")
+}
+
+
+def _find_git_root(path: Path) -> Optional[Path]:
+    """Return the enclosing git work tree root of ``path``, if any."""
+    for candidate in (path, *path.parents):
+        if os.path.exists(os.path.join(candidate, ".git")):
+            return candidate
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _global_excludes_file(git_root: Path) -> Optional[Path]:
+    """Return git's ``core.excludesFile`` for ``git_root``, looked up once.
+
+    Falls back to git's default ``$XDG_CONFIG_HOME/git/ignore``. Changing the
+    setting itself (not the file's contents) needs a restart to be noticed.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "config", "--path", "--get", "core.excludesFile"],
+            cwd=git_root,
+            capture_output=True,
+        )
+    except Exception:
+        return None
+    configured = result.stdout.decode("utf-8").strip()
+    if configured:
+        return git_root / configured
+    config_home = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(config_home) / "git" / "ignore"
+
+
+def _ignore_files_signature(
+    git_root: Path, directory: Path, paths: Sequence[Path]
+) -> Tuple[int, ...]:
+    """mtimes of the files git's ignore answers for ``paths`` depend on.
+
+    Covers the index (tracked files are never reported as ignored),
+    ``.git/info/exclude``, the global excludes file, every ``.gitignore`` from
+    ``git_root`` down to ``directory`` and the one beside each path; missing
+    files count as 0.
+    """
+    git_dir = git_root / ".git"
+    candidates = [git_dir / "index", git_dir / "info" / "exclude"]
+    excludes_file = _global_excludes_file(git_root)
+    if excludes_file is not None:
+        candidates.append(excludes_file)
+    # directory lies inside git_root, so its first `depth` ancestors reach it
+    depth = len(directory.parts) - len(git_root.parts)
+    ancestors = (directory, *list(directory.parents)[:depth])
+    candidates.extend(parent / ".gitignore" for parent in ancestors)
+    candidates.extend(path.parent / ".gitignore" for path in paths)
+    mtimes: List[int] = []
+    for candidate in candidates:
+        try:
+            mtimes.append(os.stat(candidate).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return tuple(mtimes)
+
+
+# Rule filename keywords -> category; one group per _RULE_CATEGORIES entry.
+# The alternatives are lookaheads so priority follows this order, not the
+# keyword's position in the name.
+_RULE_CATEGORY_RE = re.compile(
+    r"^(?:(?=.*(workflow))|(?=.*(quality))|(?=.*(parallel|execution))"
+    r"|(?=.*(efficiency)))",
+    re.IGNORECASE | re.DOTALL,
+)
+_RULE_CATEGORIES = ("workflow", "quality", "execution", "efficiency")
+
+# Files whose presence marks a tasks/current directory as in use
+_TASK_STATE_FILES = (
+    "active_agents.json",
+    "active_workflow",
+    "workflow_status",
+    "workflow_started",
+)
+
+# Lines of a mode file that can hold its title, purpose, subtitle or h2
+_MODE_MARKER_LINE_RE = re.compile(r"^[^\S\n]*(?:#|\*\*).*$", re.MULTILINE)
+
+# Characters read from the top of a rule file to find its title/description
+_RULE_HEAD_CHARS = 4096
+
+# Below this many files the thread pool costs more than it saves.
+_PARALLEL_PARSE_MIN_ITEMS = 8
+
+
+def _parallel_map(func: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+    """Map ``func`` over ``items``, using a small thread pool for larger batches."""
+    if len(items) < _PARALLEL_PARSE_MIN_ITEMS:
+        return [func(item) for item in items]
+    workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _stat_cached(
+    cache: Dict[Any, Tuple[Tuple[int, int], _T]],
+    path: Path,
+    parse: Callable[[], _T],
+    key: Any = None,
+) -> _T:
+    """Return ``parse()``, memoized in ``cache`` while ``path`` is unchanged.
+
+    Entries are stored under ``key`` (``path`` by default) together with the
+    file's ``(st_mtime_ns, st_size)`` and reused until either changes. Errors
+    from ``stat`` or ``parse`` propagate and leave the cache untouched.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_key = path if key is None else key
+    cached = cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = parse()
+    cache[cache_key] = (stamp, value)
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_ago_for_minutes(elapsed_minutes: int) -> str:
+    return Format.time_ago(datetime.now() - timedelta(minutes=elapsed_minutes))
+
+
+def _time_ago(timestamp: float) -> str:
+    """Format a POSIX timestamp like ``Format.time_ago``.
+
+    The output only changes per elapsed minute, so results are memoized on
+    that instead of building a datetime for every row.
+    """
+    return _time_ago_for_minutes(int((time.time() - timestamp) // 60))
 
 
+@functools.lru_cache(maxsize=512)
+def _progress_bar(progress: int, width: int) -> str:
+    """``ProgressBar.simple_bar`` out of 100, memoized; rows share few values."""
+    return ProgressBar.simple_bar(progress, 100, width=width)
+
+
+# Labels for the context flags detected by the AI assistant, in display order
+_AI_CONTEXT_LABELS = (
+    (CONTEXT_FRONTEND, "[blue]Frontend[/blue]"),
+    (CONTEXT_BACKEND, "[green]Backend[/green]"),
+    (CONTEXT_DATABASE, "[magenta]Database[/magenta]"),
+    (CONTEXT_TESTS, "[yellow]Tests[/yellow]"),
+    (CONTEXT_AUTH, "[red]Auth[/red]"),
+    (CONTEXT_API, "[cyan]API[/cyan]"),
+)
+
+# Static rows of the AI assistant view. Spacing between sections is folded
+# into the header rows as leading/trailing newlines, which the view renders
+# as taller rows instead of separate blank rows.
+_AI_SEPARATOR_ROW = (
+    "[dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]\n",
+    "",
+    "",
+    "",
+)
+_AI_RECOMMENDATIONS_HEADER = (
+    ("[bold cyan]🤖 AI Recommendations[/bold cyan]", "", "", ""),
+    ("[dim]━━━━━━━━━━━━━━━━━━━[/dim]\n", "", "", ""),
+)
+_AI_SKILLS_HEADER = (
+    ("\n[bold green]✨ Skills[/bold green]", "", "", ""),
+    ("[dim]━━━━━━━━━━[/dim]\n", "", "", ""),
+)
+_AI_WORKFLOW_HEADER = (
+    ("\n[bold magenta]🎯 WORKFLOW PREDICTION[/bold magenta]", "", "", ""),
+    _AI_SEPARATOR_ROW,
+)
+_AI_CONTEXT_HEADER = (
+    ("\n[bold yellow]📊 CONTEXT ANALYSIS[/bold yellow]", "", "", ""),
+    _AI_SEPARATOR_ROW,
+)
+_AI_QUICK_ACTIONS = (
+    ("\n[bold green]⚡ QUICK ACTIONS[/bold green]", "", "", ""),
+    _AI_SEPARATOR_ROW,
+    (
+        "",
+        "[dim cyan]Press [white]A[/white] → Auto-activate recommended agents[/dim cyan]",
+        "",
+        "",
+    ),
+    (
+        "",
+        "[dim cyan]Press [white]R[/white] → Refresh recommendations[/dim cyan]",
+        "",
+        "",
+    ),
+)
+
+
+def _rows_with_heights(
+    rows: List[Tuple[str, str, str, str]],
+) -> List[Tuple[Tuple[str, str, str, str], int]]:
+    """Pair table rows with the height their tallest multi-line cell needs."""
+    return [(row, max(cell.count("\n") for cell in row) + 1) for row in rows]
+
+
+def _dump_json_bytes(payload: Any) -> bytes:
+    """Serialize ``payload`` as indented JSON bytes, using orjson when present."""
+    if orjson is not None:
+        data: bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        return data
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _load_json_bytes(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when present."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class AgentTUI(App[None]):
@@ -197,13 +467,96 @@ class AgentTUI(App[None]):
         "orange3",
     ]
 
+    STATUS_ACTIVE_MARKUP = sys.intern("[bold green]● ACTIVE[/bold green]")
+    STATUS_INACTIVE_MARKUP = sys.intern("[dim]○ inactive[/dim]")
+
+    # Workflow/task status -> StatusIcon markup; anything else renders as pending
+    STATUS_ICON_MARKUP = {
+        "complete": StatusIcon.active(),
+        "running": StatusIcon.running(),
+        "error": StatusIcon.error(),
+    }
+    STATUS_ICON_DEFAULT = StatusIcon.pending()
+
+    # Tier -> markup template; fill with str.format(tier=...)
+    TIER_MARKUP = {
+        tier: f"[{color}]{{tier}}[/{color}]"
+        for tier, color in {
+            "essential": "bold green",
+            "standard": "cyan",
+            "premium": "yellow",
+            "experimental": "magenta",
+        }.items()
+    }
+    TIER_MARKUP_DEFAULT = "[white]{tier}[/white]"
+
+    # Skill and rule category -> markup template; fill with str.format(category=...)
+    SKILL_CATEGORY_MARKUP = {
+        category: f"[{color}]{{category}}[/{color}]"
+        for category, color in {
+            "api-design": "cyan",
+            "security": "red",
+            "performance": "yellow",
+            "testing": "green",
+            "architecture": "blue",
+            "deployment": "magenta",
+        }.items()
+    }
+    RULE_CATEGORY_MARKUP = {
+        category: f"[{color}]{{category}}[/{color}]"
+        for category, color in {
+            "execution": "cyan",
+            "quality": "green",
+            "workflow": "yellow",
+            "parallel": "magenta",
+            "efficiency": "blue",
+        }.items()
+    }
+    CATEGORY_MARKUP_DEFAULT = "[white]{category}[/white]"
+
+    # AI assistant styling: urgency -> type cell, confidence tiers -> templates
+    AI_URGENCY_LABELS = {
+        "critical": "[red]🔴 Agent[/red]",
+        "high": "[yellow]🟡 Agent[/yellow]",
+        "medium": "[cyan]🔵 Agent[/cyan]",
+    }
+    AI_URGENCY_DEFAULT_LABEL = "[dim]⚪ Agent[/dim]"
+    # (min confidence, confidence template, skill type cell), highest first
+    AI_CONFIDENCE_TIERS = (
+        (0.8, "[bold green]{}%[/bold green]", "[green]✓ Skill[/green]"),
+        (0.6, "[yellow]{}%[/yellow]", "[yellow]• Skill[/yellow]"),
+        (0.0, "[dim]{}%[/dim]", "[dim]○ Skill[/dim]"),
+    )
+    AI_AUTO_BADGE = " [bold cyan]AUTO[/bold cyan]"
+    # Data sets loaded lazily on a view's first visit, by load_<key>. Views
+    # not listed either show agents/tasks (loaded at mount) or reload their
+    # data in their action_view_* handler.
+    VIEW_DATA: Dict[str, Tuple[str, ...]] = {
+        "overview": ("rules", "modes", "skills", "workflows"),
+        "rules": ("rules",),
+        "modes": ("modes",),
+        "skills": ("skills",),
+        "workflows": ("workflows",),
+    }
+    # Rows added per frame when a large view is populated progressively
+    TABLE_ROW_BATCH = 64
+    # Seconds a collect_context_components() scan is reused by the export view
+    COMPONENTS_CACHE_TTL = 2.0
+    # Seconds within which a repeated identical toast is dropped
+    NOTIFY_COALESCE_WINDOW = 0.2
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self.claude_home: Path = _resolve_claude_dir()
+        self.claude_home: Path = self._claude_dir
         self.agents: List[AgentGraphNode] = []
         self.rules: List[RuleNode] = []
         self.modes: List[ModeInfo] = []
         self.workflows: List[WorkflowInfo] = []
+        self.agent_tasks: List[AgentTask] = []
+        self.agent_slug_lookup: Dict[str, str] = {}
+        self.agent_category_lookup: Dict[str, str] = {}
+        # Task id index rebuilt by _set_agent_tasks for O(1) lookups
+        self._tasks_by_id: Dict[str, AgentTask] = {}
         self.profiles: List[Dict[str, Optional[str]]] = []
         self.mcp_servers: List[MCPServerInfo] = []
         self.mcp_error: Optional[str] = None
@@ -211,12 +564,92 @@ class AgentTUI(App[None]):
         self.export_agent_generic: bool = True
         self.export_row_meta: List[Tuple[str, Optional[str]]] = []
         self.scenarios: List[ScenarioInfo] = []
+        # Last transient toast as (message, monotonic time) for coalescing
+        self._last_notification: Tuple[str, float] = ("", 0.0)
+        # Command palette action name -> bound action method (None if unknown)
+        self._command_handlers: Dict[str, Optional[Callable[[], Any]]] = {}
+        # Resolved on first use by _main_table()
+        self._main_table_widget: Optional[AnyDataTable] = None
+        # Available clipboard writers, probed on first copy (None until then)
+        self._clipboard_backends: Optional[List[Callable[[str], None]]] = None
+        # Created in on_mount; None until the AI assistant is initialized
+        self.intelligent_agent: Optional[IntelligentAgent] = None
         self.skills: List[Dict[str, Any]] = []
         self.slash_commands: List[SlashCommandInfo] = []
         self.skill_rating_collector: Optional[SkillRatingCollector] = None
         self.skill_rating_error: Optional[str] = None
         self.skill_prompt_manager: Optional[SkillRatingPromptManager] = None
         self._tasks_state_signature: Optional[str] = None
+        self._token_cache: str = ""
+        self._token_cache_time: float = 0.0
+        # ((CLAUDE_TASKS_HOME, cwd), tasks/current candidate roots)
+        self._tasks_dir_candidates_cache: Optional[
+            Tuple[Tuple[Optional[str], str], List[Path]]
+        ] = None
+        # active_agents.json bytes last read or written, for the dirty check
+        self._tasks_payload: Optional[bytes] = None
+        # Active/running counts maintained by the loaders for the overview
+        self._status_counts: Dict[str, int] = {}
+        # Category colour assignments and the rendered markup per category
+        self._dynamic_category_palette: Dict[str, str] = {}
+        self._fallback_category_index = 0
+        self._category_markup_cache: Dict[str, str] = {}
+        self._tier_markup_cache: Dict[str, str] = {}
+        # Bumped whenever the intelligent agent re-analyzes the session
+        self._ai_generation = 0
+        # Recommendations and workflow prediction for one generation
+        self._ai_insights_cache: Optional[
+            Tuple[int, List[AgentRecommendation], Optional[WorkflowPrediction]]
+        ] = None
+        # Last AI assistant agent and workflow rows (with row heights), keyed by
+        # their input signature
+        self._ai_view_cache: Optional[
+            Tuple[
+                Tuple[Any, ...],
+                List[Tuple[Tuple[str, str, str, str], int]],
+                List[Tuple[Tuple[str, str, str, str], int]],
+            ]
+        ] = None
+        # View whose columns the main table currently holds
+        self._table_schema_for: Optional[str] = None
+        self._reuse_table_columns = False
+        # Bumped per render so stale progressive row batches are dropped
+        self._render_generation = 0
+        # Deferred render coalescing rapid view switches into one update
+        self._pending_view_timer: Optional[Timer] = None
+        # Lazily loaded data sets (keys of VIEW_DATA values) already loaded
+        self._loaded_data: Set[str] = set()
+        # Performance text last pushed to the status bar
+        self._status_perf_text = ""
+        # Last galaxy render as (agent fingerprint, graph text, stats text)
+        self._galaxy_render_cache: Optional[Tuple[int, str, str]] = None
+        # Resolved _validate_path base directories keyed by the unresolved path
+        self._resolved_bases: Dict[Path, Path] = {}
+        # Parsed file caches keyed by path -> (mtime_ns, parsed value)
+        self._workflow_cache: Dict[
+            Path, Tuple[int, Optional[Tuple[str, str, List[str], Dict[str, int]]]]
+        ] = {}
+        # _stat_cached caches keyed by path -> ((mtime_ns, size), parsed value)
+        self._rule_cache: Dict[Path, Tuple[Tuple[int, int], RuleNode]] = {}
+        self._mode_cache: Dict[Path, Tuple[Tuple[int, int], ModeInfo]] = {}
+        self._agent_cache: Dict[
+            Path, Tuple[Tuple[int, int], Optional[AgentGraphNode]]
+        ] = {}
+        self._skill_cache: Dict[
+            Path, Tuple[Tuple[int, int], Optional[Dict[str, str]]]
+        ] = {}
+        # (monotonic time, .claude mtime_ns, components) of the last export scan
+        self._components_cache: Optional[
+            Tuple[float, int, Dict[str, Dict[str, Path]]]
+        ] = None
+        # str(path) -> ignored, refreshed for all skills by load_skills
+        self._gitignore_cache: Dict[str, bool] = {}
+        # (checked paths, ignore-file mtimes) the cache was built for
+        self._gitignore_signature: Optional[Tuple[Any, ...]] = None
+        # Server name -> ((config mtime_ns, size), validate_server_config result)
+        self._mcp_validation_cache: Dict[
+            str, Tuple[Tuple[int, int], Tuple[bool, List[str], List[str]]]
+        ] = {}
         # Asset manager state
         self.available_assets: Dict[str, List[Asset]] = {}
         self.claude_directories: List[ClaudeDir] = []
@@ -314,6 +747,8 @@ class AgentTUI(App[None]):
         with Container(id="main-container"):
             with ContentSwitcher(id="view-switcher"):
                 yield DataTable(id="main-table")
+                with VerticalScroll(id="overview-view"):
+                    yield Static("", id="overview-panel")
                 with Container(id="galaxy-view"):
                     yield Static("✦ Agent Galaxy ✦", id="galaxy-header")
                     with Horizontal(id="galaxy-layout"):
@@ -322,22 +757,13 @@ class AgentTUI(App[None]):
         yield SuperSaiyanStatusBar(id="status-bar")
         yield AdaptiveFooter(id="adaptive-footer")
 
-    def _selected_agent(self) -> Optional[AgentGraphNode]:
-        index = self._table_cursor_index()
-        agents = self.agents
-        if index is None or not agents:
-            return None
-        if index < 0 or index >= len(agents):
-            return None
-        return agents[index]
-
     def action_edit_item(self) -> None:
         """Open the selected item's source file in the default editor."""
         file_path: Optional[Path] = None
         item_name: Optional[str] = None
 
         if self.current_view == "agents":
-            agent = self._selected_agent()
+            agent = self._selected(self.agents)
             if agent:
                 file_path = agent.path
                 item_name = agent.name
@@ -356,12 +782,12 @@ class AgentTUI(App[None]):
                 file_path = mode.path
                 item_name = mode.name
         elif self.current_view == "skills":
-            skill = self._selected_skill()
+            skill = self._selected(self.skills)
             if skill and "path" in skill:
                 file_path = Path(skill["path"])
                 item_name = skill["name"]
         elif self.current_view == "commands":
-            command = self._selected_command()
+            command = self._selected(self.slash_commands)
             if command:
                 file_path = command.path
                 item_name = command.command
@@ -400,24 +826,13 @@ class AgentTUI(App[None]):
         self.metrics_collector = MetricsCollector()
 
         # Initialize intelligent agent for auto-activation and recommendations
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         self.claude_home = claude_dir
         self.intelligent_agent = IntelligentAgent(claude_dir / "intelligence")
 
-        # Analyze context and get initial recommendations
-        self.intelligent_agent.analyze_context()
-
-        # Load data
+        # Load what the first frame needs: the default view and the status bar
         self.load_agents()
-        self.load_rules()
-        self.load_modes()
-        self.load_skills()
-        self.load_slash_commands()
         self.load_agent_tasks()
-        self.load_workflows()
-        self.load_scenarios()
-        self.load_profiles()
-        self.load_mcp_servers()
         self.update_view()
 
         # Start performance monitoring timer
@@ -427,40 +842,78 @@ class AgentTUI(App[None]):
         # Force initial status bar update
         self.watch_status_message(self.status_message)
 
-        # Show AI recommendations if high confidence
-        self._check_auto_activations()
+        # Other views load their data on first visit (see VIEW_DATA). After
+        # the first frame, analyze the context and show AI recommendations if
+        # high confidence.
+        self.call_after_refresh(
+            self._run_deferred_loaders,
+            [
+                (self._analyze_ai_context, ("ai_assistant",)),
+                (self._check_auto_activations, ()),
+            ],
+        )
 
         # Schedule background check for pending skill rating prompts
         self.call_after_refresh(self._maybe_prompt_for_skill_ratings)
 
+    def _run_deferred_loaders(
+        self, loaders: List[Tuple[Callable[[], None], Tuple[str, ...]]]
+    ) -> None:
+        """Run the next startup loader and schedule the rest after a repaint.
+
+        Each loader re-renders the current view only if that view shows its
+        data, so the UI stays interactive while data arrives.
+        """
+        if not loaders:
+            return
+        loader, views = loaders[0]
+        loader()
+        if self.current_view in views:
+            self.update_view()
+        if len(loaders) > 1:
+            self.call_after_refresh(self._run_deferred_loaders, loaders[1:])
+
     def watch_status_message(self, _message: str) -> None:
         """Update status bar when message changes."""
         self.refresh_status_bar()
 
     def update_performance_status(self) -> None:
-        """Update performance metrics in status bar (called by timer)."""
-        self.refresh_status_bar()
+        """Update performance metrics in status bar (called by timer).
+
+        Everything else in the status bar is pushed by the events that change
+        it, so a tick only refreshes when the metrics text or the token count
+        is stale.
+        """
+        if not hasattr(self, "performance_monitor"):
+            return
+        perf_text = self.performance_monitor.get_status_bar(compact=True)
+        tokens_stale = (time.time() - self._token_cache_time) > 30
+        if perf_text == self._status_perf_text and not tokens_stale:
+            return
+        self.refresh_status_bar(perf_text)
 
-    def refresh_status_bar(self) -> None:
+    def refresh_status_bar(self, perf_text: Optional[str] = None) -> None:
         """Push latest UI/metric info into the neon status bar."""
         try:
             status_bar = self.query_one(SuperSaiyanStatusBar)
         except Exception:
             return
 
-        agents = getattr(self, "agents", [])
-        agent_total = len(agents)
-        agent_active = sum(1 for a in agents if getattr(a, "status", "") == "active")
-        tasks = getattr(self, "agent_tasks", [])
-        task_active = sum(1 for t in tasks if getattr(t, "status", "") == "running")
-        perf_text = ""
-        if hasattr(self, "performance_monitor"):
-            perf_text = self.performance_monitor.get_status_bar(compact=True)
+        # Counts are maintained by the loaders, so no list scans are needed here
+        counts = self._status_counts
+        agent_total = len(self.agents)
+        agent_active = counts.get("agents", 0)
+        task_active = counts.get("tasks", 0)
+        if perf_text is None:
+            perf_text = ""
+            if hasattr(self, "performance_monitor"):
+                perf_text = self.performance_monitor.get_status_bar(compact=True)
+        self._status_perf_text = perf_text
 
         # Get token count (cached to avoid repeated file reads)
         token_text = ""
         try:
-            if not hasattr(self, "_token_cache") or (time.time() - getattr(self, "_token_cache_time", 0)) > 30:
+            if not self._token_cache or (time.time() - self._token_cache_time) > 30:
                 _, total_stats = get_active_context_tokens()
                 self._token_cache = total_stats.tokens_formatted
                 self._token_cache_time = time.time()
@@ -478,9 +931,17 @@ class AgentTUI(App[None]):
             token_count=token_text,
         )
 
+    def _ensure_view_data(self, view: str) -> None:
+        """Load the data a view shows the first time it is visited."""
+        for key in self.VIEW_DATA.get(view, ()):
+            if key not in self._loaded_data:
+                self._loaded_data.add(key)
+                getattr(self, f"load_{key}")()
+
     def watch_current_view(self, view: str) -> None:
         """Update display when view changes."""
-        self.update_view()
+        self._ensure_view_data(view)
+        self._schedule_update_view()
         self.refresh_status_bar()
 
         # Dynamically update footer bindings based on context
@@ -528,6 +989,16 @@ class AgentTUI(App[None]):
 
         self.refresh(layout=True)
 
+    @functools.cached_property
+    def _claude_dir(self) -> Path:
+        """Claude directory for this session, resolved once."""
+        return _resolve_claude_dir()
+
+    @functools.cached_property
+    def _home_claude_prefix(self) -> str:
+        """``~/.claude`` as a path prefix with trailing separator, resolved once."""
+        return os.path.join(str(Path.home() / ".claude"), "")
+
     def _validate_path(self, base_dir: Path, subpath: Path) -> Path:
         """
         Validate that a path stays within the base directory.
@@ -542,7 +1013,12 @@ class AgentTUI(App[None]):
         Raises:
             ValueError: If path escapes base directory
         """
-        base_resolved = base_dir.resolve()
+        # Only the trusted base is memoized; subpath is resolved on every call
+        # so a symlink retargeted outside the base is caught
+        base_resolved = self._resolved_bases.get(base_dir)
+        if base_resolved is None:
+            base_resolved = base_dir.resolve()
+            self._resolved_bases[base_dir] = base_resolved
         subpath_resolved = subpath.resolve()
 
         # Check if subpath is within base_dir
@@ -567,26 +1043,15 @@ class AgentTUI(App[None]):
         if not isinstance(workflow_data, dict):
             return False
 
-        # Optional fields (can be missing or wrong type without failing)
-        # Just ensure they're the right type if present
-        if "name" in workflow_data and not isinstance(workflow_data["name"], str):
-            return False
-
-        if "description" in workflow_data and not isinstance(
-            workflow_data["description"], str
-        ):
-            return False
-
-        # Steps array is expected but can be empty
-        if "steps" in workflow_data:
-            if not isinstance(workflow_data["steps"], list):
+        # Optional fields only need the right type when present; steps may be
+        # empty but each one must be a mapping
+        for field_name, field_type in _WORKFLOW_FIELD_TYPES:
+            if field_name in workflow_data and not isinstance(
+                workflow_data[field_name], field_type
+            ):
                 return False
-            # Each step should be a dict with at least a name
-            for step in workflow_data["steps"]:
-                if not isinstance(step, dict):
-                    return False
 
-        return True
+        return all(isinstance(step, dict) for step in workflow_data.get("steps", ()))
 
     def _parse_iso_datetime(self, value: Optional[str]) -> Optional[datetime]:
         """Parse ISO8601 timestamps produced by scenario state files."""
@@ -605,56 +1070,26 @@ class AgentTUI(App[None]):
         except Exception:
             return None
 
+    def _main_table(self) -> AnyDataTable:
+        """Return the main DataTable, looked up once and then reused."""
+        table = self._main_table_widget
+        if table is None:
+            table = self.query_one("#main-table", DataTable)
+            self._main_table_widget = table
+        return table
+
     def _table_cursor_index(self) -> Optional[int]:
         """Return the current row index in the main DataTable."""
+        self._render_pending_view()
         try:
-            table = self.query_one("#main-table", DataTable)
+            table = self._main_table()
         except Exception:
             return None
         return table.cursor_row
 
-    def _selected_profile(self) -> Optional[Dict[str, Optional[str]]]:
-        index = self._table_cursor_index()
-        if index is None or not self.profiles:
-            return None
-        if index < 0 or index >= len(self.profiles):
-            return None
-        return self.profiles[index]
-
-    def _selected_export_meta(self) -> Optional[Tuple[str, Optional[str]]]:
-        index = self._table_cursor_index()
-        if index is None:
-            return None
-        if index < 0 or index >= len(self.export_row_meta):
-            return None
-        return self.export_row_meta[index]
-
-    def _selected_mcp_server(self) -> Optional[MCPServerInfo]:
-        index = self._table_cursor_index()
-        if index is None:
-            return None
-        servers = self.mcp_servers
-        if index < 0 or index >= len(servers):
-            return None
-        return servers[index]
-
-    def _selected_skill(self) -> Optional[Dict[str, Any]]:
-        index = self._table_cursor_index()
-        skills = self.skills
-        if index is None or not skills:
-            return None
-        if index < 0 or index >= len(skills):
-            return None
-        return skills[index]
-
-    def _selected_command(self) -> Optional[SlashCommandInfo]:
-        index = self._table_cursor_index()
-        commands = self.slash_commands
-        if index is None or not commands:
-            return None
-        if index < 0 or index >= len(commands):
-            return None
-        return commands[index]
+    def _selected(self, items: Sequence[_T]) -> Optional[_T]:
+        """Return the item under the cursor of a list-ordered view, if any."""
+        return self._item_at_row(items, self._table_cursor_index())
 
     def _normalize_slug(self, value: str) -> str:
         """Normalize a slug for comparison (lowercase, no .md, POSIX separators)."""
@@ -700,24 +1135,6 @@ class AgentTUI(App[None]):
             return False
         return True
 
-    def _selected_workflow(self) -> Optional[WorkflowInfo]:
-        index = self._table_cursor_index()
-        workflows = self.workflows
-        if index is None or not workflows:
-            return None
-        if index < 0 or index >= len(workflows):
-            return None
-        return workflows[index]
-
-    def _selected_scenario(self) -> Optional[ScenarioInfo]:
-        index = self._table_cursor_index()
-        scenarios = self.scenarios
-        if index is None or not scenarios:
-            return None
-        if index < 0 or index >= len(scenarios):
-            return None
-        return scenarios[index]
-
     def _format_command_stack(self, command: SlashCommandInfo) -> str:
         """Summarize linked assets for a slash command."""
         sections: List[str] = []
@@ -742,51 +1159,62 @@ class AgentTUI(App[None]):
         return "  |  ".join(sections)
 
     def _skill_slug(self, skill: Dict[str, Any]) -> str:
-        path_value = skill.get("path")
+        path_value = str(skill.get("path") or "")
         if not path_value:
             name_value = str(skill.get("name", ""))
             return name_value.replace(" ", "-")
-        skill_path = Path(path_value)
+        # String ops only: this runs per skill row, a Path per call adds up
+        file_name = os.path.basename(path_value)
         # SKILL.md lives inside the skill directory; use parent directory name
-        if skill_path.name.lower() == "skill.md":
-            return skill_path.parent.name
-        return skill_path.stem
+        if file_name.lower() == "skill.md":
+            return os.path.basename(os.path.dirname(path_value))
+        return os.path.splitext(file_name)[0]
 
     async def _get_skill_slug(self, prompt_title: str = "Skill Name") -> Optional[str]:
         if self.current_view == "skills":
-            skill = self._selected_skill()
+            skill = self._selected(self.skills)
             if skill:
                 return self._skill_slug(skill)
         return await self._prompt_text(
             prompt_title, "Enter skill name", placeholder="e.g. observability/alerts"
         )
 
-    def _copy_to_clipboard(self, text: str) -> bool:
-        """Attempt to copy text to the system clipboard."""
+    @staticmethod
+    def _detect_clipboard_backends() -> List[Callable[[str], None]]:
+        """Return the clipboard writers available here, in preference order."""
+        backends: List[Callable[[str], None]] = []
         try:
             import pyperclip  # type: ignore
 
-            pyperclip.copy(text)
-            return True
-        except Exception:
-            pass
-
-        try:
-            subprocess.run(["pbcopy"], check=True, input=text.encode("utf-8"))
-            return True
+            backends.append(pyperclip.copy)
         except Exception:
             pass
 
-        try:
-            if shutil.which("xclip"):
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"],
-                    check=True,
-                    input=text.encode("utf-8"),
+        commands = (["pbcopy"], ["xclip", "-selection", "clipboard"])
+        for command in commands:
+            if shutil.which(command[0]):
+                backends.append(
+                    functools.partial(AgentTUI._run_clipboard_command, command)
                 )
+        return backends
+
+    @staticmethod
+    def _run_clipboard_command(command: List[str], text: str) -> None:
+        subprocess.run(command, check=True, input=text.encode("utf-8"))
+
+    def _copy_to_clipboard(self, text: str) -> bool:
+        """Attempt to copy text to the system clipboard."""
+        if self._clipboard_backends is None:
+            self._clipboard_backends = self._detect_clipboard_backends()
+
+        # Only detection is cached; a failure may be transient, so every
+        # backend is tried again on each copy
+        for backend in self._clipboard_backends:
+            try:
+                backend(text)
                 return True
-        except Exception:
-            pass
+            except Exception:
+                continue
 
         return False
 
@@ -798,7 +1226,8 @@ class AgentTUI(App[None]):
             return 1, f"Failed to read profile: {exc}"
 
         agents = [
-            Path(entry).stem for entry in self._extract_profile_list(content, "AGENTS")
+            os.path.splitext(os.path.basename(entry))[0]
+            for entry in self._extract_profile_list(content, "AGENTS")
         ]
         modes = self._extract_profile_list(content, "MODES")
         rules = self._extract_profile_list(content, "RULES")
@@ -836,7 +1265,9 @@ class AgentTUI(App[None]):
 
     def _extract_profile_list(self, content: str, key: str) -> List[str]:
         """Extract a space-delimited list from profile metadata."""
-        pattern = re.compile(rf'{key}="([^"]*)"')
+        pattern = _PROFILE_LIST_RES.get(key)
+        if pattern is None:
+            pattern = re.compile(rf'{key}="([^"]*)"')
         match = pattern.search(content)
         if not match:
             return []
@@ -847,9 +1278,7 @@ class AgentTUI(App[None]):
 
     def _clean_ansi(self, text: str | None) -> str:
         """Remove ANSI escape codes for clean status messages."""
-        if not text:
-            return ""
-        return re.sub(r"\x1b\[[0-9;]*m", "", text)
+        return _ANSI_RE.sub("", text) if text else ""
 
     async def _show_text_dialog(self, title: str, body: str) -> None:
         """Display multi-line text in a modal dialog."""
@@ -898,50 +1327,67 @@ class AgentTUI(App[None]):
         try:
             agents = []
             seen_names = set()  # Track agent names to avoid duplicates
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             self.agent_slug_lookup = {}
             self.agent_category_lookup = {}
 
+            pending: List[Tuple[Path, str]] = []
+
             # Check active agents
             agents_dir = claude_dir / "agents"
             if agents_dir.is_dir():
-                for path in _iter_all_files(agents_dir):
-                    if not path.name.endswith(".md") or _is_disabled(path):
+                for path in _iter_md_files(agents_dir):
+                    if _is_disabled(path):
                         continue
-                    node = self._parse_agent_file(path, "active")
-                    if node and node.name not in seen_names:
-                        agents.append(node)
-                        seen_names.add(node.name)
+                    pending.append((path, "active"))
 
             # Check disabled agents
             for disabled_dir in _inactive_dir_candidates(claude_dir, "agents"):
                 if disabled_dir and disabled_dir.is_dir():
-                    for path in _iter_all_files(disabled_dir):
-                        if not path.name.endswith(".md"):
-                            continue
-                        node = self._parse_agent_file(path, "disabled")
-                        if node and node.name not in seen_names:
-                            agents.append(node)
-                            seen_names.add(node.name)
+                    for path in _iter_md_files(disabled_dir):
+                        pending.append((path, "disabled"))
+
+            # Parse concurrently; dedupe in discovery order so active wins
+            parsed = _parallel_map(lambda item: self._parse_agent_file(*item), pending)
+            for node in parsed:
+                if node and node.name not in seen_names:
+                    agents.append(node)
+                    seen_names.add(node.name)
 
             # Sort by category and name
             agents.sort(key=lambda a: (a.category, a.name.lower()))
 
+            # Give every agent category its colour up front, in sorted order,
+            # so fallback colours don't depend on which row renders first
+            palette = self._dynamic_category_palette
+            for key in sorted({a.category.lower() for a in agents}):
+                if key not in palette:
+                    self._assign_category_color(key)
+
             self.agents = agents
+            self._invalidate_agent_derived()
+            slug_lookup = self.agent_slug_lookup
+            category_lookup = self.agent_category_lookup
             for agent in agents:
-                variants = {
-                    agent.name.lower(),
-                    agent.slug.lower(),
-                    agent.name.lower().replace(" ", "-"),
-                    agent.name.lower().replace(" ", "_"),
-                    agent.slug.lower().replace("_", "-"),
-                    f"{agent.slug.lower()}.md",
-                }
-                for variant in variants:
-                    self.agent_slug_lookup[variant] = agent.slug
-                self.agent_category_lookup[agent.slug.lower()] = agent.category
-                self.agent_category_lookup[agent.name.lower()] = agent.category
+                name_lower = agent.name.lower()
+                slug_lower = agent.slug.lower()
+                slug_lookup.update(
+                    dict.fromkeys(
+                        (
+                            name_lower,
+                            slug_lower,
+                            name_lower.replace(" ", "-"),
+                            name_lower.replace(" ", "_"),
+                            slug_lower.replace("_", "-"),
+                            f"{slug_lower}.md",
+                        ),
+                        agent.slug,
+                    )
+                )
+                category_lookup[slug_lower] = agent.category
+                category_lookup[name_lower] = agent.category
             active_count = sum(1 for a in agents if a.status == "active")
+            self._status_counts["agents"] = active_count
             inactive_count = len(agents) - active_count
             self.status_message = f"Loaded {len(agents)} agents ({active_count} active, {inactive_count} inactive)"
             if hasattr(self, "metrics_collector"):
@@ -951,9 +1397,23 @@ class AgentTUI(App[None]):
         except Exception as e:
             self.status_message = f"Error loading agents: {e}"
             self.agents = []
+            self._invalidate_agent_derived()
+            self._status_counts["agents"] = 0
 
     def _parse_agent_file(self, path: Path, status: str) -> Optional[AgentGraphNode]:
         """Parse an agent file and return an AgentGraphNode."""
+        try:
+            node = _stat_cached(
+                self._agent_cache, path, lambda: self._read_agent_node(path, status)
+            )
+        except OSError:
+            return None
+
+        if node is None or node.status == status:
+            return node
+        return replace(node, status=status)
+
+    def _read_agent_node(self, path: Path, status: str) -> Optional[AgentGraphNode]:
         try:
             lines = _read_agent_front_matter_lines(path)
             if not lines:
@@ -1005,24 +1465,33 @@ class AgentTUI(App[None]):
         """Load skills from the system."""
         try:
             skills = []
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
 
             # Load skills from skills directory
             skills_dir = self._validate_path(claude_dir, claude_dir / "skills")
+            skill_files: List[Path] = []
             if skills_dir.is_dir():
                 for skill_path in sorted(skills_dir.iterdir()):
                     if not skill_path.is_dir():
                         continue
 
-                    # Validate each skill subdirectory
-                    skill_path = self._validate_path(claude_dir, skill_path)
+                    # Direct children of the resolved skills dir are already
+                    # inside it; only symlinks can point elsewhere
+                    if skill_path.is_symlink():
+                        skill_path = self._validate_path(claude_dir, skill_path)
                     skill_file = skill_path / "SKILL.md"
                     if not skill_file.is_file():
                         continue
+                    skill_files.append(skill_file)
+
+            # Answer every skill's git-ignore check with one subprocess
+            self._prime_gitignore_cache(skill_files, skills_dir)
 
-                    skill_data = self._parse_skill_file(skill_file, claude_dir)
-                    if skill_data:
-                        skills.append(skill_data)
+            # Parsing is I/O bound; run concurrently
+            parsed = _parallel_map(
+                lambda path: self._parse_skill_file(path, claude_dir), skill_files
+            )
+            skills = [skill_data for skill_data in parsed if skill_data]
 
             # Sort by category then name
             skills.sort(key=lambda s: (s["category"].lower(), s["name"].lower()))
@@ -1043,10 +1512,10 @@ class AgentTUI(App[None]):
     def load_slash_commands(self) -> None:
         """Load slash command metadata from the commands directory."""
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             commands_dir = self._validate_path(claude_dir, claude_dir / "commands")
         except ValueError:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             commands_dir = claude_dir / "commands"
 
         if not commands_dir.exists():
@@ -1075,7 +1544,34 @@ class AgentTUI(App[None]):
     def _parse_skill_file(
         self, skill_file: Path, claude_dir: Path
     ) -> Optional[Dict[str, Any]]:
-        """Parse a skill file and return skill data dictionary."""
+        """Parse a skill file and return skill data dictionary.
+
+        Only the front-matter metadata is cached; git status is checked on
+        every load.
+        """
+        try:
+            metadata = _stat_cached(
+                self._skill_cache,
+                skill_file,
+                lambda: self._read_skill_metadata(skill_file),
+            )
+        except OSError:
+            return None
+        if metadata is None:
+            return None
+
+        # Check if gitignored
+        gitignored = self._is_gitignored(skill_file)
+        status = "gitignored" if gitignored else "tracked"
+
+        return {
+            **metadata,
+            "status": status,
+            "path": str(skill_file),
+            "rating_metrics": None,
+        }
+
+    def _read_skill_metadata(self, skill_file: Path) -> Optional[Dict[str, str]]:
         try:
             content = skill_file.read_text(encoding="utf-8")
             front_matter = _extract_front_matter(content)
@@ -1099,16 +1595,11 @@ class AgentTUI(App[None]):
 
             # Determine location (user vs project)
             # If skill is in user's home .claude dir, it's a user skill
-            home_claude = Path.home() / ".claude"
-            if home_claude in skill_file.parents:
+            if str(skill_file).startswith(self._home_claude_prefix):
                 location = "user"
             else:
                 location = "project"
 
-            # Check if gitignored
-            gitignored = self._is_gitignored(skill_file)
-            status = "gitignored" if gitignored else "tracked"
-
             # Truncate description if too long
             max_desc_len = 80
             if len(description) > max_desc_len:
@@ -1120,18 +1611,58 @@ class AgentTUI(App[None]):
                 "description": description,
                 "category": category,
                 "location": location,
-                "status": status,
-                "path": str(skill_file),
-                "rating_metrics": None,
             }
         except Exception:
             return None
 
+    def _prime_gitignore_cache(self, paths: Sequence[Path], cwd: Path) -> None:
+        """Check ``paths`` with a single ``git check-ignore`` call.
+
+        Replaces the cached answers used by _is_gitignored. When the batched
+        call fails the cache is left empty and paths are checked one by one.
+        Outside a git work tree no subprocess is started, and the previous
+        answers are kept while the paths and ignore files are unchanged.
+        """
+        names = [str(path) for path in paths]
+        git_root = _find_git_root(cwd)
+        if git_root is None:
+            self._gitignore_cache = dict.fromkeys(names, False)
+            self._gitignore_signature = None
+            return
+
+        signature = (tuple(names), _ignore_files_signature(git_root, cwd, paths))
+        if signature == self._gitignore_signature and self._gitignore_cache:
+            return
+        self._gitignore_signature = signature
+        self._gitignore_cache = {}
+        if not paths:
+            return
+        try:
+            result = subprocess.run(
+                ["git", "check-ignore", "--stdin", "-z"],
+                cwd=cwd,
+                input="\0".join(names).encode("utf-8"),
+                capture_output=True,
+            )
+        except Exception:
+            # git is not available: nothing is ignored
+            self._gitignore_cache = dict.fromkeys(names, False)
+            return
+
+        # 0: some paths ignored, 1: none ignored, 128: fatal error
+        if result.returncode == 128:
+            if b"not a git repository" in result.stderr:
+                self._gitignore_cache = dict.fromkeys(names, False)
+            return
+        ignored = set(result.stdout.decode("utf-8").split("\0"))
+        self._gitignore_cache = {name: name in ignored for name in names}
+
     def _is_gitignored(self, path: Path) -> bool:
         """Check if a path is gitignored using git check-ignore."""
+        cached = self._gitignore_cache.get(str(path))
+        if cached is not None:
+            return cached
         try:
-            import subprocess
-
             result = subprocess.run(
                 ["git", "check-ignore", "-q", str(path)],
                 cwd=path.parent,
@@ -1233,33 +1764,28 @@ class AgentTUI(App[None]):
 
     def show_skills_view(self, table: DataTable[Any]) -> None:
         """Show skills table with enhanced colors (READ-ONLY)."""
-        table.add_column("Name", key="name", width=25)
-        table.add_column("Rating", key="rating", width=18)
-        table.add_column("Category", key="category", width=15)
-        table.add_column("Location", key="location", width=10)
-        table.add_column("Description", key="description")
-
-        if not hasattr(self, "skills") or not self.skills:
+        if not self._reuse_table_columns:
+            table.add_column("Name", key="name", width=25)
+            table.add_column("Rating", key="rating", width=18)
+            table.add_column("Category", key="category", width=15)
+            table.add_column("Location", key="location", width=10)
+            table.add_column("Description", key="description")
+
+        if not self.skills:
             table.add_row("[dim]No skills found[/dim]", "", "", "", "")
             return
 
-        category_colors = {
-            "api-design": "cyan",
-            "security": "red",
-            "performance": "yellow",
-            "testing": "green",
-            "architecture": "blue",
-            "deployment": "magenta",
-        }
+        # Color-coded category markup, built once per distinct category
+        category_markup = self._category_markup_for(
+            {skill["category"] for skill in self.skills}, self.SKILL_CATEGORY_MARKUP
+        )
 
+        rows: List[Tuple[str, str, str, str, str]] = []
         for skill in self.skills:
             # Color-coded name with icon
             name = f"[bold green]{Icons.CODE} {skill['name']}[/bold green]"
 
-            # Color-coded category
-            category = skill["category"]
-            cat_color = category_colors.get(category.lower(), "white")
-            category_text = f"[{cat_color}]{category}[/{cat_color}]"
+            category_text = category_markup[skill["category"]]
 
             # Format location with status indicator
             location = skill["location"]
@@ -1276,30 +1802,26 @@ class AgentTUI(App[None]):
 
             rating_text = self._format_skill_rating(skill)
 
-            table.add_row(
-                name,
-                rating_text,
-                category_text,
-                location_text,
-                description,
+            rows.append(
+                (name, rating_text, category_text, location_text, description)
             )
 
+        self._add_rows_progressively(table, rows)
+
     def show_commands_view(self, table: AnyDataTable) -> None:
         """Render slash command catalog."""
-        table.add_column("Command", width=32)
-        table.add_column("Category", width=16)
-        table.add_column("Complexity", width=12)
-        table.add_column("Stack", width=32)
-        table.add_column("Description")
+        if not self._reuse_table_columns:
+            table.add_column("Command", width=32)
+            table.add_column("Category", width=16)
+            table.add_column("Complexity", width=12)
+            table.add_column("Stack", width=32)
+            table.add_column("Description")
 
-        commands = getattr(self, "slash_commands", [])
+        commands = self.slash_commands
         if not commands:
             table.add_row("[dim]No slash commands found[/dim]", "", "", "", "")
             return
 
-        category_colors: Dict[str, str] = {}
-        fallback_colors = self.CATEGORY_FALLBACK_COLORS
-
         complexity_palette = {
             "basic": "green",
             "standard": "cyan",
@@ -1308,6 +1830,24 @@ class AgentTUI(App[None]):
             "over9000": "bright_magenta",
         }
 
+        # Resolve each category's colour and markup once, in first-seen order,
+        # before building the rows
+        fallback_colors = self.CATEGORY_FALLBACK_COLORS
+        category_colors: Dict[str, str] = {}
+        category_markup: Dict[str, str] = {}
+        for cmd in commands:
+            if cmd.category in category_markup:
+                continue
+            cat_key = cmd.category.lower()
+            color = category_colors.get(cat_key)
+            if not color:
+                color = self.CATEGORY_PALETTE.get(cat_key) or fallback_colors[
+                    len(category_colors) % len(fallback_colors)
+                ]
+                category_colors[cat_key] = color
+            category_markup[cmd.category] = f"[{color}]{cmd.category.title()}[/{color}]"
+
+        rows: List[Tuple[str, str, str, str, str]] = []
         for cmd in commands:
             icon = Icons.CODE if cmd.location == "user" else Icons.DOC
             icon_color = "cyan" if cmd.location == "user" else "magenta"
@@ -1315,15 +1855,6 @@ class AgentTUI(App[None]):
                 f"[{icon_color}]{icon}[/{icon_color}] /{cmd.namespace}:{cmd.name}"
             )
 
-            cat_key = cmd.category.lower()
-            color = category_colors.get(cat_key)
-            if not color:
-                color = self.CATEGORY_PALETTE.get(cat_key)
-                if not color:
-                    color = fallback_colors[len(category_colors) % len(fallback_colors)]
-                category_colors[cat_key] = color
-            category_text = f"[{color}]{cmd.category.title()}[/{color}]"
-
             comp_color = complexity_palette.get(cmd.complexity.lower(), "white")
             complexity_text = f"[{comp_color}]{cmd.complexity.title()}[/{comp_color}]"
 
@@ -1331,25 +1862,30 @@ class AgentTUI(App[None]):
             desc_text = Format.truncate(cmd.description, 110).replace("[", "\\[")
             description = f"[dim]{desc_text}[/dim]"
 
-            table.add_row(
-                command_text,
-                category_text,
-                complexity_text,
-                stack_text,
-                description,
+            rows.append(
+                (
+                    command_text,
+                    category_markup[cmd.category],
+                    complexity_text,
+                    stack_text,
+                    description,
+                )
             )
+        table.add_rows(rows)
 
     def show_profiles_view(self, table: DataTable[Any]) -> None:
         """Render profile management view."""
-        table.add_column("Profile", width=28)
-        table.add_column("Type", width=12)
-        table.add_column("Description")
-        table.add_column("Updated", width=18)
+        if not self._reuse_table_columns:
+            table.add_column("Profile", width=28)
+            table.add_column("Type", width=12)
+            table.add_column("Description")
+            table.add_column("Updated", width=18)
 
         if not self.profiles:
             table.add_row("[dim]No profiles found[/dim]", "", "", "")
             return
 
+        rows: List[Tuple[str, str, str, str]] = []
         for profile in self.profiles:
             name = profile.get("name", "unknown")
             ptype = profile.get("type", "built-in")
@@ -1362,22 +1898,26 @@ class AgentTUI(App[None]):
             else:
                 type_text = "[magenta]Saved[/magenta]"
 
-            table.add_row(
-                f"{icon} {name}",
-                type_text,
-                f"[dim]{description}[/dim]" if description else "",
-                updated,
+            rows.append(
+                (
+                    f"{icon} {name}",
+                    type_text,
+                    f"[dim]{description}[/dim]" if description else "",
+                    updated,
+                )
             )
+        table.add_rows(rows)
 
     def show_export_view(self, table: DataTable[Any]) -> None:
         """Render export configuration view."""
-        table.add_column("Component", width=26)
-        table.add_column("State", width=20)
-        table.add_column("Details")
+        if not self._reuse_table_columns:
+            table.add_column("Component", width=26)
+            table.add_column("State", width=20)
+            table.add_column("Details")
 
         self.export_row_meta = []
         try:
-            components = collect_context_components()
+            components = self._context_components()
         except Exception as exc:
             components = {}
             self.status_message = f"Export scan failed: {exc}"[:120]
@@ -1423,10 +1963,32 @@ class AgentTUI(App[None]):
         )
         self.export_row_meta.append(("summary", None))
 
+    def _context_components(self) -> Dict[str, Dict[str, Path]]:
+        """Return collect_context_components(), reusing a scan made moments ago.
+
+        Toggling export options re-renders the view, so a result is reused
+        for COMPONENTS_CACHE_TTL seconds unless the .claude directory's mtime
+        changed in the meantime.
+        """
+        claude_dir = self._claude_dir
+        try:
+            dir_mtime = claude_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = 0
+        now = time.monotonic()
+        cached = self._components_cache
+        if (
+            cached is not None
+            and now - cached[0] < self.COMPONENTS_CACHE_TTL
+            and cached[1] == dir_mtime
+        ):
+            return cached[2]
+        components = collect_context_components(claude_dir)
+        self._components_cache = (now, dir_mtime, components)
+        return components
+
     def _build_export_summary(self, components: Dict[str, Dict[str, Path]]) -> str:
         """Create a short summary string for enabled export categories."""
-        from ..token_counter import TokenStats
-
         enabled = []
         total_stats = TokenStats(files=0, chars=0, words=0, tokens=0)
 
@@ -1476,8 +2038,11 @@ class AgentTUI(App[None]):
 
             # Check for active tasks file
             active_tasks_file = tasks_dir / "active_agents.json"
+            self._tasks_payload = None
             if active_tasks_file.is_file():
-                task_data = json.loads(active_tasks_file.read_text(encoding="utf-8"))
+                raw_tasks = active_tasks_file.read_bytes()
+                self._tasks_payload = raw_tasks
+                task_data = _load_json_bytes(raw_tasks)
 
                 for task_id, task_info in task_data.items():
                     tasks.append(
@@ -1502,8 +2067,7 @@ class AgentTUI(App[None]):
         if not tasks and tasks_dir is not None:
             tasks = self._build_workflow_task_fallback(tasks_dir)
 
-        tasks.sort(key=lambda t: t.agent_name.lower())
-        self.agent_tasks = tasks
+        self._set_agent_tasks(tasks)
         if tasks_dir is not None:
             self._tasks_state_signature = self._compute_tasks_state_signature(tasks_dir)
         else:
@@ -1513,10 +2077,11 @@ class AgentTUI(App[None]):
     def load_rules(self) -> None:
         """Load rules from the system."""
         try:
-            rules: List[RuleNode] = []
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             active_rule_slugs = self._active_rule_slugs(claude_dir)
 
+            pending: List[Tuple[Path, str]] = []
+
             # Check active rules
             rules_dir = self._validate_path(claude_dir, claude_dir / "rules")
             if rules_dir.is_dir():
@@ -1525,12 +2090,7 @@ class AgentTUI(App[None]):
                         continue
                     slug = self._relative_slug(path, rules_dir)
                     status = "active" if slug in active_rule_slugs else "inactive"
-                    node = self._parse_rule_file(
-                        path,
-                        status,
-                    )
-                    if node:
-                        rules.append(node)
+                    pending.append((path, status))
 
             # Check disabled rules
             for disabled_dir in _inactive_dir_candidates(claude_dir, "rules"):
@@ -1539,15 +2099,18 @@ class AgentTUI(App[None]):
                     for path in _iter_md_files(valid_dir):
                         slug = self._relative_slug(path, valid_dir)
                         status = "active" if slug in active_rule_slugs else "inactive"
-                        node = self._parse_rule_file(path, status)
-                        if node:
-                            rules.append(node)
+                        pending.append((path, status))
+
+            # Parse concurrently; results keep discovery order
+            parsed = _parallel_map(lambda item: self._parse_rule_file(*item), pending)
+            rules: List[RuleNode] = [node for node in parsed if node]
 
             # Sort by category and name
             rules.sort(key=lambda r: (r.category, r.name.lower()))
 
             self.rules = rules
             active_count = sum(1 for r in rules if r.status == "active")
+            self._status_counts["rules"] = active_count
             self.status_message = f"Loaded {len(rules)} rules ({active_count} active)"
             if hasattr(self, "metrics_collector"):
                 self.metrics_collector.record("rules_active", float(active_count))
@@ -1555,61 +2118,71 @@ class AgentTUI(App[None]):
         except Exception as e:
             self.status_message = f"Error loading rules: {e}"
             self.rules = []
+            self._status_counts["rules"] = 0
 
     def _parse_rule_file(self, path: Path, status: str) -> Optional[RuleNode]:
         """Parse a rule file and return a RuleNode."""
         try:
-            name = path.stem
-
-            # Read the file to extract description and category
-            content = path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            # Extract first heading as name if it exists
-            display_name = name
-            description = ""
-            category = "general"
-
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line.startswith("# "):
-                    display_name = line[2:].strip()
-                elif line.startswith("## ") and not description:
-                    # Use first h2 as description
-                    description = line[3:].strip()
-                elif line and not line.startswith("#") and not description:
-                    # Use first non-empty, non-heading line as description
-                    description = line[:100]  # Limit length
-
-                if display_name and description:
-                    break
-
-            # Determine category from filename or content
-            if "workflow" in name.lower():
-                category = "workflow"
-            elif "quality" in name.lower():
-                category = "quality"
-            elif "parallel" in name.lower() or "execution" in name.lower():
-                category = "execution"
-            elif "efficiency" in name.lower():
-                category = "efficiency"
-
-            return RuleNode(
-                name=display_name,
-                status=status,
-                category=category,
-                description=description or "No description available",
-                path=path,
+            node = _stat_cached(
+                self._rule_cache, path, lambda: self._read_rule_node(path, status)
             )
         except Exception:
             return None
+        return node if node.status == status else replace(node, status=status)
+
+    def _read_rule_node(self, path: Path, status: str) -> RuleNode:
+        name = path.stem
+
+        # Read only the head of the file: the title and description the
+        # loop below looks for sit at the top
+        with path.open(encoding="utf-8") as handle:
+            head = handle.read(_RULE_HEAD_CHARS)
+            if len(head) == _RULE_HEAD_CHARS:
+                # Finish the line the read cut off mid-way
+                head += handle.readline()
+        lines = head.split("\n")
+
+        # Extract first heading as name if it exists
+        display_name = name
+        description = ""
+        category = "general"
+
+        # The first h2 or plain line is the description and ends the scan;
+        # any h1 before it names the rule
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+            if line[:2] == "# ":
+                display_name = line[2:].strip()
+            elif line[:3] == "## ":
+                # Use first h2 as description
+                description = line[3:].strip()
+                break
+            elif line[0] != "#":
+                # Use first non-empty, non-heading line as description
+                description = line[:100]  # Limit length
+                break
+
+        # Determine category from filename
+        match = _RULE_CATEGORY_RE.match(name)
+        if match and match.lastindex:
+            category = _RULE_CATEGORIES[match.lastindex - 1]
+
+        return RuleNode(
+            name=display_name,
+            status=status,
+            category=category,
+            description=description or "No description available",
+            path=path,
+        )
 
     def load_modes(self) -> None:
         """Load behavioral modes from the system."""
         try:
-            modes: List[ModeInfo] = []
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             active_mode_slugs = self._active_mode_slugs(claude_dir)
+            pending: List[Tuple[Path, str]] = []
 
             # Load active modes from modes/ directory
             modes_dir = self._validate_path(claude_dir, claude_dir / "modes")
@@ -1619,9 +2192,7 @@ class AgentTUI(App[None]):
                         continue
                     slug = self._relative_slug(path, modes_dir)
                     status = "active" if slug in active_mode_slugs else "inactive"
-                    node = self._parse_mode_file(path, status)
-                    if node:
-                        modes.append(node)
+                    pending.append((path, status))
 
             # Load inactive modes from inactive/modes/ directory (legacy dirs supported)
             for inactive_dir in _inactive_dir_candidates(claude_dir, "modes"):
@@ -1630,95 +2201,34 @@ class AgentTUI(App[None]):
                     for path in _iter_md_files(valid_dir):
                         slug = self._relative_slug(path, valid_dir)
                         status = "active" if slug in active_mode_slugs else "inactive"
-                        node = self._parse_mode_file(path, status)
-                        if node:
-                            modes.append(node)
+                        pending.append((path, status))
+
+            parsed = _parallel_map(lambda item: self._parse_mode_file(*item), pending)
+            modes: List[ModeInfo] = [node for node in parsed if node]
 
             # Sort by status (active first) and then by name
             modes.sort(key=lambda m: (m.status != "active", m.name.lower()))
 
             self.modes = modes
             active_count = sum(1 for m in modes if m.status == "active")
+            self._status_counts["modes"] = active_count
             self.status_message = f"Loaded {len(modes)} modes ({active_count} active)"
 
-            # Debug logging
-            print(f"[DEBUG] load_modes: Loaded {len(modes)} modes")
-            for mode in modes:
-                print(f"[DEBUG]   - {mode.name} ({mode.status}): {mode.purpose[:50]}...")
-
             if hasattr(self, "metrics_collector"):
                 self.metrics_collector.record("modes_active", float(active_count))
 
         except Exception as e:
-            import traceback
-            error_detail = traceback.format_exc()
             self.status_message = f"Error loading modes: {e}"
             self.modes = []
-            # Log full traceback for debugging
-            print(f"[DEBUG] Mode loading error:\n{error_detail}")
+            self._status_counts["modes"] = 0
 
     def _parse_mode_file(self, path: Path, status: str) -> Optional[ModeInfo]:
         """Parse a mode file and return a ModeInfo."""
         try:
-            name = path.stem
-
-            # Read the file to extract purpose and description
-            content = path.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            # Extract mode information
-            display_name = name
-            purpose = ""
-            description = ""
-            subtitle = ""
-
-            found_title = False
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if line.startswith("# ") and not found_title:
-                    # Extract title (e.g., "# Task Management Mode" -> "Task Management")
-                    # Only use the FIRST h1 heading
-                    title = line[2:].strip()
-                    if title.endswith(" Mode"):
-                        display_name = title[:-5]  # Remove " Mode" suffix
-                    else:
-                        display_name = title
-                    found_title = True
-                elif line.startswith("**Purpose**:"):
-                    # Extract purpose
-                    purpose = line.split("**Purpose**:")[1].strip()
-                elif not subtitle and line.startswith("**") and not line.startswith("**Purpose**") and ":" not in line:
-                    # Extract subtitle/tagline (e.g., "**Universal Visual Excellence Mode**")
-                    subtitle = line.replace("**", "").strip()
-                elif (
-                    line.startswith("## ")
-                    and "Activation" not in line
-                    and not description
-                ):
-                    # Use first non-activation h2 as description fallback
-                    description = line[3:].strip()
-
-            # Build final purpose: prefer explicit Purpose, then subtitle, then description
-            if not purpose:
-                purpose = subtitle or description
-
-            # Use purpose as description if available, otherwise use first description
-            final_description = purpose if purpose else description
-            if not final_description:
-                # Fallback: use first non-empty, non-heading, non-bold line
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.startswith("#") and not line.startswith("**") and not line.startswith(">"):
-                        final_description = line[:100]  # Limit length
-                        break
-
-            return ModeInfo(
-                name=display_name,
-                status=status,
-                purpose=purpose or final_description or "Behavioral mode",
-                description=final_description or "No description available",
-                path=path,
+            mode = _stat_cached(
+                self._mode_cache, path, lambda: self._read_mode_info(path, status)
             )
+            return mode if mode.status == status else replace(mode, status=status)
         except Exception as e:
             # Return a placeholder instead of None so user can see something went wrong
             return ModeInfo(
@@ -1729,46 +2239,108 @@ class AgentTUI(App[None]):
                 path=path,
             )
 
+    def _read_mode_info(self, path: Path, status: str) -> ModeInfo:
+        name = path.stem
+
+        # Extract mode information
+        display_name = name
+        purpose = ""
+        description = ""
+        subtitle = ""
+
+        # Only heading and bold lines can set the fields below, so let the
+        # regex engine skip plain text instead of stripping every line
+        text = path.read_text(encoding="utf-8")
+        found_title = False
+        for marker_line in _MODE_MARKER_LINE_RE.finditer(text):
+            if found_title and purpose:
+                break
+            line = marker_line.group().strip()
+            if line.startswith("# ") and not found_title:
+                # Extract title (e.g., "# Task Management Mode" -> "Task Management")
+                # Only use the FIRST h1 heading
+                title = line[2:].strip()
+                if title.endswith(" Mode"):
+                    display_name = title[:-5]  # Remove " Mode" suffix
+                else:
+                    display_name = title
+                found_title = True
+            elif line.startswith("**Purpose**:"):
+                # Extract purpose
+                purpose = line.split("**Purpose**:")[1].strip()
+            elif not subtitle and line.startswith("**") and not line.startswith("**Purpose**") and ":" not in line:
+                # Extract subtitle/tagline (e.g., "**Universal Visual Excellence Mode**")
+                subtitle = line.replace("**", "").strip()
+            elif (
+                line.startswith("## ")
+                and "Activation" not in line
+                and not description
+            ):
+                # Use first non-activation h2 as description fallback
+                description = line[3:].strip()
+
+        # Build final purpose: prefer explicit Purpose, then subtitle, then description
+        if not purpose:
+            purpose = subtitle or description
+
+        # Use purpose as description if available, otherwise use first description
+        final_description = purpose if purpose else description
+        if not final_description:
+            # Fallback: use first non-empty, non-heading, non-bold line
+            final_description = next(
+                (
+                    stripped[:100]  # Limit length
+                    for stripped in (line.strip() for line in text.split("\n"))
+                    if stripped and not stripped.startswith(("#", "**", ">"))
+                ),
+                "",
+            )
+
+        return ModeInfo(
+            name=display_name,
+            status=status,
+            purpose=purpose or final_description or "Behavioral mode",
+            description=final_description or "No description available",
+            path=path,
+        )
+
     def load_workflows(self) -> None:
         """Load workflows from the workflows directory."""
         workflows: List[WorkflowInfo] = []
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             workflows_dir = self._validate_path(claude_dir, claude_dir / "workflows")
             tasks_dir = self._validate_path(
                 claude_dir, claude_dir / "tasks" / "current"
             )
 
             # Load active workflow status if exists
-            active_workflow_file = tasks_dir / "active_workflow"
-            active_workflow = None
-            if active_workflow_file.is_file():
-                active_workflow = active_workflow_file.read_text(
-                    encoding="utf-8"
-                ).strip()
+            active_workflow = self._read_state_files(
+                tasks_dir, ("active_workflow",)
+            ).get("active_workflow")
 
             if workflows_dir.is_dir():
-                for workflow_file in sorted(workflows_dir.glob("*.yaml")):
-                    if workflow_file.stem == "README":
-                        continue
+                workflow_files = [
+                    workflow_file
+                    for workflow_file in _iter_files(workflows_dir, ".yaml")
+                    if workflow_file.stem != "README"
+                ]
 
+                def parse(
+                    workflow_file: Path,
+                ) -> Optional[Tuple[str, str, List[str], Dict[str, int]]]:
                     try:
-                        content = workflow_file.read_text(encoding="utf-8")
-                        workflow_data = yaml.safe_load(content)
+                        return self._parse_workflow_file(workflow_file)
+                    except Exception:
+                        return None
 
-                        # Validate YAML structure
-                        if not self._validate_workflow_schema(
-                            workflow_data, workflow_file
-                        ):
+                parsed_files = _parallel_map(parse, workflow_files)
+                for workflow_file, parsed in zip(workflow_files, parsed_files):
+                    try:
+                        if parsed is None:
                             # Skip malformed workflows
                             continue
-
-                        name = workflow_data.get("name", workflow_file.stem)
-                        description = workflow_data.get("description", "")
-                        steps = [
-                            step.get("name", "")
-                            for step in workflow_data.get("steps", [])
-                        ]
+                        name, description, steps, step_positions = parsed
 
                         # Determine status
                         status = "pending"
@@ -1777,29 +2349,19 @@ class AgentTUI(App[None]):
                         current_step = None
 
                         if active_workflow == workflow_file.stem:
-                            status_file = tasks_dir / "workflow_status"
-                            if status_file.is_file():
-                                status = status_file.read_text(encoding="utf-8").strip()
-
-                            started_file = tasks_dir / "workflow_started"
-                            if started_file.is_file():
-                                started = float(
-                                    started_file.read_text(encoding="utf-8").strip()
-                                )
-
-                            current_step_file = tasks_dir / "current_step"
-                            if current_step_file.is_file():
-                                current_step = current_step_file.read_text(
-                                    encoding="utf-8"
-                                ).strip()
+                            state = self._read_state_files(
+                                tasks_dir,
+                                ("workflow_status", "workflow_started", "current_step"),
+                            )
+                            status = state.get("workflow_status", status)
+                            if "workflow_started" in state:
+                                started = float(state["workflow_started"])
+                            current_step = state.get("current_step")
 
                             # Calculate progress based on current step
                             if current_step and steps:
-                                try:
-                                    step_index = steps.index(current_step)
-                                    progress = int((step_index / len(steps)) * 100)
-                                except ValueError:
-                                    progress = 0
+                                step_index = step_positions.get(current_step, 0)
+                                progress = int((step_index / len(steps)) * 100)
 
                         workflows.append(
                             WorkflowInfo(
@@ -1808,7 +2370,7 @@ class AgentTUI(App[None]):
                                 status=status,
                                 progress=progress,
                                 started=started,
-                                steps=steps,
+                                steps=list(steps),
                                 current_step=current_step,
                                 file_path=workflow_file,
                             )
@@ -1822,15 +2384,67 @@ class AgentTUI(App[None]):
             self.status_message = f"Error loading workflows: {e}"
 
         self.workflows = workflows
+        running = sum(1 for w in workflows if w.status == "running")
+        self._status_counts["workflows"] = running
         if hasattr(self, "metrics_collector"):
-            running = sum(1 for w in workflows if w.status == "running")
             self.metrics_collector.record("workflows_running", float(running))
 
+    def _read_state_files(
+        self, directory: Path, names: Sequence[str]
+    ) -> Dict[str, str]:
+        """Read small state files from ``directory``, skipping missing ones.
+
+        Files are opened directly rather than probed with ``is_file()`` first,
+        saving a stat per file.
+        """
+        values: Dict[str, str] = {}
+        for name in names:
+            try:
+                values[name] = (directory / name).read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+        return values
+
+    def _parse_workflow_file(
+        self, workflow_file: Path
+    ) -> Optional[Tuple[str, str, List[str], Dict[str, int]]]:
+        """Parse a workflow YAML file into (name, description, steps, positions).
+
+        ``positions`` maps each step name to the index of its first occurrence.
+
+        Results are cached by modification time so unchanged files skip the
+        YAML parse on reload. Returns None for malformed workflows.
+        """
+        mtime_ns = workflow_file.stat().st_mtime_ns
+        cached = self._workflow_cache.get(workflow_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        content = workflow_file.read_text(encoding="utf-8")
+        workflow_data = _yaml_safe_load(content)
+
+        parsed: Optional[Tuple[str, str, List[str], Dict[str, int]]] = None
+        # Validate YAML structure
+        if self._validate_workflow_schema(workflow_data, workflow_file):
+            steps = [step.get("name", "") for step in workflow_data.get("steps", [])]
+            positions: Dict[str, int] = {}
+            for index, step_name in enumerate(steps):
+                positions.setdefault(step_name, index)
+            parsed = (
+                workflow_data.get("name", workflow_file.stem),
+                workflow_data.get("description", ""),
+                steps,
+                positions,
+            )
+
+        self._workflow_cache[workflow_file] = (mtime_ns, parsed)
+        return parsed
+
     def load_scenarios(self) -> None:
         """Load scenario metadata and runtime state."""
         scenarios: List[ScenarioInfo] = []
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             scenarios_dir, state_dir, lock_dir = _ensure_scenarios_dir(claude_dir)
             scenarios_dir = self._validate_path(claude_dir, scenarios_dir)
             state_dir = self._validate_path(claude_dir, state_dir)
@@ -1847,7 +2461,7 @@ class AgentTUI(App[None]):
                 state_files.append((mtime, state_file))
             for _mtime, state_file in sorted(state_files, key=lambda x: x[0], reverse=True):
                 try:
-                    data = json.loads(state_file.read_text(encoding="utf-8"))
+                    data = _load_json_bytes(state_file.read_bytes())
                 except (OSError, json.JSONDecodeError):
                     continue
                 scenario_name = str(data.get("scenario") or state_file.stem)
@@ -1950,7 +2564,7 @@ class AgentTUI(App[None]):
         """Load available profiles (built-in + saved)."""
         try:
             profiles: List[Dict[str, Optional[str]]] = []
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
 
             for name in BUILT_IN_PROFILES:
                 profiles.append(
@@ -1966,24 +2580,35 @@ class AgentTUI(App[None]):
                 )
 
             profiles_dir = claude_dir / "profiles"
-            if profiles_dir.is_dir():
-                for profile_file in sorted(profiles_dir.glob("*.profile")):
-                    modified_iso = None
-                    try:
-                        modified_iso = datetime.fromtimestamp(
-                            profile_file.stat().st_mtime
-                        ).strftime("%Y-%m-%d %H:%M")
-                    except OSError:
-                        modified_iso = None
-                    profiles.append(
-                        {
-                            "name": profile_file.stem,
-                            "type": "saved",
-                            "description": "Saved profile snapshot",
-                            "path": str(profile_file),
-                            "modified": modified_iso,
-                        }
+            try:
+                with os.scandir(profiles_dir) as it:
+                    entries = [
+                        entry
+                        for entry in it
+                        if entry.name.endswith(".profile") and entry.is_file()
+                    ]
+            except OSError:
+                entries = []
+            entries.sort(key=lambda entry: entry.name)
+
+            for entry in entries:
+                modified_iso = None
+                try:
+                    # DirEntry caches its stat result after the first call
+                    modified_iso = time.strftime(
+                        "%Y-%m-%d %H:%M", time.localtime(entry.stat().st_mtime)
                     )
+                except OSError:
+                    modified_iso = None
+                profiles.append(
+                    {
+                        "name": entry.name[: -len(".profile")],
+                        "type": "saved",
+                        "description": "Saved profile snapshot",
+                        "path": entry.path,
+                        "modified": modified_iso,
+                    }
+                )
 
             self.profiles = profiles
         except Exception as exc:
@@ -1995,7 +2620,7 @@ class AgentTUI(App[None]):
         try:
             success, servers, error = discover_servers()
             if success:
-                claude_dir = _resolve_claude_dir()
+                claude_dir = self._claude_dir
                 doc_only = list_doc_only_servers(
                     {server.name for server in servers}, claude_dir
                 )
@@ -2043,8 +2668,6 @@ class AgentTUI(App[None]):
     def load_memory_notes(self) -> None:
         """Load notes from the memory vault."""
         try:
-            from ..memory import list_notes, get_vault_stats, NoteType
-
             notes: List[MemoryNote] = []
             for note_type_enum in NoteType:
                 note_list = list_notes(note_type_enum, recent=50)
@@ -2070,24 +2693,60 @@ class AgentTUI(App[None]):
             self.memory_notes = []
             self.status_message = f"Failed to load memory: {e}"
 
+    def _schedule_update_view(self) -> None:
+        """Render the current view on the next frame, once per burst of switches."""
+        if self._pending_view_timer is not None:
+            return
+        self._pending_view_timer = self.set_timer(1 / 60, self._flush_view_update)
+
+    def _flush_view_update(self) -> None:
+        self._pending_view_timer = None
+        self.update_view()
+
+    def _render_pending_view(self) -> None:
+        """Render a deferred view switch now, before its table is read.
+
+        Actions that switch view and then read the selection would otherwise
+        see the previous view's cursor.
+        """
+        if self._pending_view_timer is not None:
+            self.update_view()
+
     def update_view(self) -> None:
         """Update the table based on current view."""
+        # A direct render supersedes any deferred one
+        if self._pending_view_timer is not None:
+            self._pending_view_timer.stop()
+            self._pending_view_timer = None
+        # Hold repaints until every row of the view has been added
+        with self.batch_update():
+            self._render_current_view()
+
+    def _render_current_view(self) -> None:
         switcher = self.query_one("#view-switcher", ContentSwitcher)
-        table = self.query_one("#main-table", DataTable)
-        table.clear(columns=True)
-        self._apply_view_title(table, self.current_view)
+        table = self._main_table()
+        # Same view as last render: keep its columns and only replace the rows
+        view = self.current_view
+        self._reuse_table_columns = (
+            self._table_schema_for == view and bool(table.columns)
+        )
+        table.clear(columns=not self._reuse_table_columns)
+        self._table_schema_for = view
+        self._render_generation += 1
+        self._apply_view_title(table, view)
 
         if self.current_view == "galaxy":
             switcher.current = "galaxy-view"
             self.show_galaxy_view()
             return
 
-        switcher.current = "main-table"
-
         if self.current_view == "overview":
-            self.show_overview(table)
+            switcher.current = "overview-view"
+            self.show_overview()
             return
 
+        switcher.current = "main-table"
+
         if self.current_view == "agents":
             self.show_agents_view(table)
         elif self.current_view == "rules":
@@ -2134,136 +2793,249 @@ class AgentTUI(App[None]):
 
     def show_agents_view(self, table: AnyDataTable) -> None:
         """Show agents table with enhanced colors and formatting."""
-        table.add_column("Name", key="name", width=35)
-        table.add_column("Status", key="status", width=12)
-        table.add_column("Category", key="category", width=20)
-        table.add_column("Tier", key="tier", width=15)
+        if not self._reuse_table_columns:
+            table.add_column("Name", key="name", width=35)
+            table.add_column("Status", key="status", width=12)
+            table.add_column("Category", key="category", width=20)
+            table.add_column("Tier", key="tier", width=15)
 
-        if not hasattr(self, "agents") or not self.agents:
+        if not self.agents:
             table.add_row("[dim]No agents found[/dim]", "", "", "")
             return
 
-        tier_colors = {
-            "essential": "bold green",
-            "standard": "cyan",
-            "premium": "yellow",
-            "experimental": "magenta",
-        }
+        tier_cache = self._tier_markup_cache
+        rows: List[Tuple[str, str, str, str]] = []
 
         for agent in self.agents:
-            # Color-coded status with icon
-            if agent.status == "active":
-                status_text = f"[bold green]● ACTIVE[/bold green]"
-            else:
-                status_text = f"[dim]○ inactive[/dim]"
-
-            # Color-coded name with icon
-            if agent.status == "active":
-                name = f"[bold]{Icons.CODE} {agent.name}[/bold]"
-            else:
-                name = f"[dim]{Icons.CODE} {agent.name}[/dim]"
+            # Color-coded status and name with icon
+            name, status_text = self._status_cells(Icons.CODE, agent.name, agent.status)
 
             # Color-coded category via palette
             category_text = self._format_category(agent.category)
 
             # Color-coded tier
-            tier_color = tier_colors.get(agent.tier.lower(), "white")
-            tier_text = f"[{tier_color}]{agent.tier}[/{tier_color}]"
+            tier_text = tier_cache.get(agent.tier)
+            if tier_text is None:
+                template = self.TIER_MARKUP.get(
+                    agent.tier.lower(), self.TIER_MARKUP_DEFAULT
+                )
+                tier_text = sys.intern(template.format(tier=agent.tier))
+                tier_cache[agent.tier] = tier_text
 
-            table.add_row(
-                name,
-                status_text,
-                category_text,
-                tier_text,
+            rows.append((name, status_text, category_text, tier_text))
+
+        self._add_rows_progressively(table, rows)
+
+    def _add_rows_progressively(
+        self, table: AnyDataTable, rows: Sequence[Tuple[str, ...]]
+    ) -> None:
+        """Add rows, painting the first screenful before the rest.
+
+        On a fresh view switch only the first batch is added synchronously and
+        the remainder follows in batches after each repaint. Re-renders of the
+        same view add everything at once so cursor restoration keeps working.
+        """
+        batch = self.TABLE_ROW_BATCH
+        if self._reuse_table_columns or len(rows) <= batch:
+            table.add_rows(rows)
+            return
+        table.add_rows(rows[:batch])
+        self.call_after_refresh(
+            self._add_remaining_rows, table, rows, batch, self._render_generation
+        )
+
+    def _add_remaining_rows(
+        self,
+        table: AnyDataTable,
+        rows: Sequence[Tuple[str, ...]],
+        start: int,
+        generation: int,
+    ) -> None:
+        if generation != self._render_generation:
+            return  # The table was re-rendered since this batch was scheduled
+        end = start + self.TABLE_ROW_BATCH * 4
+        table.add_rows(rows[start:end])
+        if end < len(rows):
+            self.call_after_refresh(
+                self._add_remaining_rows, table, rows, end, generation
+            )
+
+    @staticmethod
+    def _item_at_row(items: Sequence[_T], row: Optional[int]) -> Optional[_T]:
+        """Return the item rendered at ``row`` of a list-ordered view, if any."""
+        if row is None or not 0 <= row < len(items):
+            return None
+        return items[row]
+
+    def _category_markup_for(
+        self, categories: Set[str], templates: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Map each category to its markup using a category -> template table."""
+        default = self.CATEGORY_MARKUP_DEFAULT
+        return {
+            category: templates.get(category.lower(), default).format(
+                category=category
+            )
+            for category in categories
+        }
+
+    def _status_cells(self, icon: str, name: str, status: str) -> Tuple[str, str]:
+        """Return the (name, status) cell markup for an activatable item."""
+        if status == "active":
+            return f"[bold]{icon} {name}[/bold]", self.STATUS_ACTIVE_MARKUP
+        return f"[dim]{icon} {name}[/dim]", self.STATUS_INACTIVE_MARKUP
+
+    def _replace_toggled_item(
+        self,
+        items: List[Any],
+        index: int,
+        updated: Any,
+        count_key: str,
+        icon: str,
+    ) -> None:
+        """Swap in an item whose status was toggled and patch its table row.
+
+        Only the name and status cells are rewritten, so the rest of the
+        table and the cursor position are left untouched.
+        """
+        previous = items[index]
+        items[index] = updated
+        delta = (updated.status == "active") - (previous.status == "active")
+        self._status_counts[count_key] = self._status_counts.get(count_key, 0) + delta
+
+        table = self._main_table()
+        if index < table.row_count:
+            name_text, status_text = self._status_cells(
+                icon, updated.name, updated.status
             )
+            table.update_cell_at(Coordinate(index, 0), name_text)
+            table.update_cell_at(Coordinate(index, 1), status_text)
+        self.refresh_status_bar()
+
+    def _apply_agent_toggle(self, agent: AgentGraphNode) -> bool:
+        """Update a just-toggled agent in place.
+
+        Returns False when the change may have touched other agents or the
+        moved file cannot be found, in which case callers reload everything.
+        """
+        activated = agent.status != "active"
+        if activated and agent.requires:
+            # Activation may have pulled in required agents as well
+            return False
+        try:
+            index = self.agents.index(agent)
+        except ValueError:
+            return False
+
+        claude_dir = self._claude_dir
+        if activated:
+            search_dirs = [claude_dir / "agents"]
+        else:
+            search_dirs = _inactive_dir_candidates(claude_dir, "agents")
+        filename = agent.path.name
+        new_path = next(
+            (d / filename for d in search_dirs if (d / filename).is_file()), None
+        )
+        if new_path is None:
+            return False
+
+        node = self._parse_agent_file(new_path, "active" if activated else "disabled")
+        if node is None or node.name != agent.name:
+            return False
+
+        self._replace_toggled_item(self.agents, index, node, "agents", Icons.CODE)
+        self._invalidate_agent_derived()
+        return True
+
+    def _invalidate_agent_derived(self) -> None:
+        """Drop cached values derived from ``self.agents``."""
+        for name in (
+            "_agent_categories",
+            "_agent_graph_fingerprint",
+            "_agent_dependency_graph",
+        ):
+            self.__dict__.pop(name, None)
 
     def show_tasks_view(self, table: AnyDataTable) -> None:
         """Show task management table."""
-        table.add_column("Task", key="task", width=30)
-        table.add_column("Category", key="category", width=16)
-        table.add_column("Workstream", key="workstream", width=16)
-        table.add_column("Status", key="status", width=12)
-        table.add_column("Progress", key="progress", width=12)
-        table.add_column("Started", key="started", width=18)
-        table.add_column("Details", key="details", width=48)
-
-        tasks = getattr(self, "agent_tasks", [])
+        if not self._reuse_table_columns:
+            table.add_column("Task", key="task", width=30)
+            table.add_column("Category", key="category", width=16)
+            table.add_column("Workstream", key="workstream", width=16)
+            table.add_column("Status", key="status", width=12)
+            table.add_column("Progress", key="progress", width=12)
+            table.add_column("Started", key="started", width=18)
+            table.add_column("Details", key="details", width=48)
+
+        tasks = self.agent_tasks
         if not tasks:
             table.add_row("[dim]No tasks yet[/dim]", "", "", "", "", "", "")
             table.add_row("[dim]Press A to add a task[/dim]", "", "", "", "", "", "")
             return
 
-        for task in tasks:
-            status_icon = StatusIcon.running()
-            if task.status == "complete":
-                status_icon = StatusIcon.active()
-            elif task.status == "error":
-                status_icon = StatusIcon.error()
-            elif task.status in ("pending", "paused"):
-                status_icon = StatusIcon.pending()
+        table.add_rows([self._task_row(task) for task in tasks])
 
-            progress_bar = ProgressBar.simple_bar(task.progress, 100, width=12)
+    def _task_row(self, task: AgentTask) -> Tuple[str, ...]:
+        """Return the Tasks view cells for one task."""
+        status_icon = StatusIcon.running()
+        if task.status == "complete":
+            status_icon = StatusIcon.active()
+        elif task.status == "error":
+            status_icon = StatusIcon.error()
+        elif task.status in ("pending", "paused"):
+            status_icon = StatusIcon.pending()
 
-            started_text = "-"
-            if task.started:
-                started_dt = datetime.fromtimestamp(task.started)
-                started_text = Format.time_ago(started_dt)
-
-            details_text = (
-                Format.truncate(task.description, 90)
-                if task.description
-                else "[dim]No details[/dim]"
-            )
+        progress_bar = _progress_bar(task.progress, 12)
 
-            table.add_row(
-                f"{Icons.CODE} {task.agent_name}",
-                self._format_category(task.category or task.workstream),
-                task.workstream,
-                status_icon,
-                progress_bar,
-                started_text,
-                details_text,
-            )
+        started_text = "-"
+        if task.started:
+            started_text = _time_ago(task.started)
+
+        details_text = (
+            Format.truncate(task.description, 90)
+            if task.description
+            else "[dim]No details[/dim]"
+        )
+
+        return (
+            f"{Icons.CODE} {task.agent_name}",
+            self._format_category(task.category or task.workstream),
+            task.workstream,
+            status_icon,
+            progress_bar,
+            started_text,
+            details_text,
+        )
 
     def show_rules_view(self, table: AnyDataTable) -> None:
         """Show rules table with enhanced colors."""
-        table.add_column("Name", key="name", width=25)
-        table.add_column("Status", key="status", width=12)
-        table.add_column("Category", key="category", width=15)
-        table.add_column("Description", key="description")
-        table.add_column("Source", key="source", width=36)
-
-        if not hasattr(self, "rules") or not self.rules:
+        if not self._reuse_table_columns:
+            table.add_column("Name", key="name", width=25)
+            table.add_column("Status", key="status", width=12)
+            table.add_column("Category", key="category", width=15)
+            table.add_column("Description", key="description")
+            table.add_column("Source", key="source", width=36)
+
+        if not self.rules:
             table.add_row("[dim]No rules found[/dim]", "", "", "", "")
             return
 
-        category_colors = {
-            "execution": "cyan",
-            "quality": "green",
-            "workflow": "yellow",
-            "parallel": "magenta",
-            "efficiency": "blue",
-        }
-
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         def _relpath(path: Path) -> str:
             try:
                 return path.relative_to(claude_dir).as_posix()
             except ValueError:
                 return path.as_posix()
 
+        # Color-coded category markup, built once per distinct category
+        category_markup = self._category_markup_for(
+            {rule.category for rule in self.rules}, self.RULE_CATEGORY_MARKUP
+        )
+
+        rows: List[Tuple[str, str, str, str, str]] = []
         for rule in self.rules:
             # Color-coded status
-            if rule.status == "active":
-                status_text = f"[bold green]● ACTIVE[/bold green]"
-                name = f"[bold]{Icons.DOC} {rule.name}[/bold]"
-            else:
-                status_text = f"[dim]○ inactive[/dim]"
-                name = f"[dim]{Icons.DOC} {rule.name}[/dim]"
-
-            # Color-coded category
-            cat_color = category_colors.get(rule.category.lower(), "white")
-            category_text = f"[{cat_color}]{rule.category}[/{cat_color}]"
+            name, status_text = self._status_cells(Icons.DOC, rule.name, rule.status)
 
             # Truncate description but show more characters - escape Rich markup
             desc_text = Format.truncate(rule.description, 120).replace("[", "\\[")
@@ -2271,46 +3043,40 @@ class AgentTUI(App[None]):
 
             source = f"[dim]{Format.truncate(_relpath(rule.path), 60)}[/dim]"
 
-            table.add_row(
-                name,
-                status_text,
-                category_text,
-                description,
-                source,
+            rows.append(
+                (
+                    name,
+                    status_text,
+                    category_markup[rule.category],
+                    description,
+                    source,
+                )
             )
+        table.add_rows(rows)
 
     def show_modes_view(self, table: AnyDataTable) -> None:
         """Show modes table with enhanced colors."""
-        table.add_column("Name", key="name", width=30)
-        table.add_column("Status", key="status", width=12)
-        table.add_column("Purpose", key="purpose")
-        table.add_column("Source", key="source", width=36)
-
-        # Debug logging
-        has_modes_attr = hasattr(self, "modes")
-        modes_value = getattr(self, "modes", None)
-        modes_count = len(modes_value) if modes_value else 0
-        print(f"[DEBUG] show_modes_view: has_attr={has_modes_attr}, modes={modes_value is not None}, count={modes_count}")
-
-        if not hasattr(self, "modes") or not self.modes:
+        if not self._reuse_table_columns:
+            table.add_column("Name", key="name", width=30)
+            table.add_column("Status", key="status", width=12)
+            table.add_column("Purpose", key="purpose")
+            table.add_column("Source", key="source", width=36)
+
+        if not self.modes:
             table.add_row("[dim]No modes found[/dim]", "", "", "")
             return
 
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         def _relpath(path: Path) -> str:
             try:
                 return path.relative_to(claude_dir).as_posix()
             except ValueError:
                 return path.as_posix()
 
+        rows: List[Tuple[str, str, str, str]] = []
         for mode in self.modes:
             # Color-coded status (match rules view styling)
-            if mode.status == "active":
-                status_text = f"[bold green]● ACTIVE[/bold green]"
-                name = f"[bold]{Icons.FILTER} {mode.name}[/bold]"
-            else:
-                status_text = f"[dim]○ inactive[/dim]"
-                name = f"[dim]{Icons.FILTER} {mode.name}[/dim]"
+            name, status_text = self._status_cells(Icons.FILTER, mode.name, mode.status)
 
             # Show more of the purpose - escape Rich markup characters
             purpose_text = Format.truncate(mode.purpose, 150).replace("[", "\\[")
@@ -2318,85 +3084,78 @@ class AgentTUI(App[None]):
 
             source = f"[dim]{Format.truncate(_relpath(mode.path), 60)}[/dim]"
 
-            table.add_row(
-                name,
-                status_text,
-                purpose,
-                source,
-            )
-
-    def show_overview(self, table: AnyDataTable) -> None:
-        """Show overview with high-energy ASCII dashboard."""
-        table.add_column("Dashboard", key="dashboard")
-
-        active_agents = sum(
-            1 for a in getattr(self, "agents", []) if a.status == "active"
-        )
-        total_agents = len(getattr(self, "agents", []))
-        active_modes = sum(
-            1 for m in getattr(self, "modes", []) if m.status == "active"
-        )
-        total_modes = len(getattr(self, "modes", []))
-        active_rules = sum(
-            1 for r in getattr(self, "rules", []) if r.status == "active"
-        )
-        total_rules = len(getattr(self, "rules", []))
-        total_skills = len(getattr(self, "skills", []))
-        running_workflows = sum(
-            1 for w in getattr(self, "workflows", []) if w.status == "running"
-        )
-
-        def add_multiline(content: str) -> None:
-            for line in content.split("\n"):
-                table.add_row(line)
-
-        hero = EnhancedOverview.create_hero_banner(active_agents, total_agents)
-        add_multiline(hero)
-        claude_home = getattr(self, "claude_home", _resolve_claude_dir())
-        table.add_row(f"[bold cyan]CLAUDE_CTX_HOME[/bold cyan]: [dim]{claude_home}[/dim]")
-        table.add_row("")
-
-        metrics_grid = EnhancedOverview.create_status_grid(
-            active_agents,
-            total_agents,
-            active_modes,
-            total_modes,
-            active_rules,
-            total_rules,
-            total_skills,
-            running_workflows,
-        )
-        add_multiline(metrics_grid)
-        table.add_row("")
+            rows.append((name, status_text, purpose, source))
+        table.add_rows(rows)
 
-        timeline = EnhancedOverview.create_activity_timeline()
-        add_multiline(timeline)
-        table.add_row("")
+    def show_overview(self) -> None:
+        """Show overview with high-energy ASCII dashboard.
 
-        health = EnhancedOverview.create_system_health()
-        add_multiline(health)
+        The dashboard is assembled into one markup string and rendered by a
+        single Static widget rather than one table row per line.
+        """
+        container = self.query_one("#overview-view", VerticalScroll)
+        panel = self.query_one("#overview-panel", Static)
+        container.border_title = VIEW_TITLES.get("overview", "Overview")
+
+        # Counts are maintained by the loaders, so no list scans are needed here
+        counts = self._status_counts
+        active_agents = counts.get("agents", 0)
+        total_agents = len(self.agents)
+        active_modes = counts.get("modes", 0)
+        total_modes = len(self.modes)
+        active_rules = counts.get("rules", 0)
+        total_rules = len(self.rules)
+        total_skills = len(self.skills)
+        running_workflows = counts.get("workflows", 0)
+
+        sections: List[str] = [
+            EnhancedOverview.create_hero_banner(active_agents, total_agents),
+            f"[bold cyan]CLAUDE_CTX_HOME[/bold cyan]: [dim]{self.claude_home}[/dim]",
+            "",
+            EnhancedOverview.create_status_grid(
+                active_agents,
+                total_agents,
+                active_modes,
+                total_modes,
+                active_rules,
+                total_rules,
+                total_skills,
+                running_workflows,
+            ),
+            "",
+            EnhancedOverview.create_activity_timeline(),
+            "",
+            EnhancedOverview.create_system_health(),
+        ]
 
         if hasattr(self, "performance_monitor"):
-            table.add_row("")
-            table.add_row("[bold cyan]⚡ Performance Monitor[/bold cyan]")
-            table.add_row(self.performance_monitor.get_status_bar(compact=False))
+            sections.extend(
+                [
+                    "",
+                    "[bold cyan]⚡ Performance Monitor[/bold cyan]",
+                    self.performance_monitor.get_status_bar(compact=False),
+                ]
+            )
 
         # Token usage section
         try:
             category_stats, total_stats = get_active_context_tokens()
-            table.add_row("")
-            token_display = EnhancedOverview.create_token_usage(category_stats, total_stats)
-            add_multiline(token_display)
+            sections.append("")
+            sections.append(
+                EnhancedOverview.create_token_usage(category_stats, total_stats)
+            )
         except Exception:
             pass  # Silently skip if token counting fails
 
+        panel.update("\n".join(sections))
+
     def _normalize_agent_dependency(self, value: str) -> Optional[str]:
         if not value:
             return None
         key = value.strip().lower()
         if key.endswith(".md"):
             key = key[:-3]
-        lookup = getattr(self, "agent_slug_lookup", {})
+        lookup = self.agent_slug_lookup
         return lookup.get(key)
 
     def _tasks_dir(self) -> Path:
@@ -2411,49 +3170,21 @@ class AgentTUI(App[None]):
         (active_agents.json, active_workflow, workflow_status, workflow_started)
         wins. If none exist, we create the primary directory under CLAUDE_CTX_HOME.
         """
-
-        def candidates() -> list[Path]:
-            roots: list[Path] = []
-            env_root = os.environ.get("CLAUDE_TASKS_HOME")
-            if env_root:
-                roots.append(Path(env_root).expanduser())
-            roots.append(_resolve_claude_dir())
-            roots.append(Path.cwd() / ".claude")
-            seen: set[Path] = set()
-            uniq: list[Path] = []
-            for root in roots:
-                if root in seen:
-                    continue
-                seen.add(root)
-                uniq.append(root)
-            return [root / "tasks" / "current" for root in uniq]
-
-        task_files = {
-            "active_agents.json",
-            "active_workflow",
-            "workflow_status",
-            "workflow_started",
-        }
-
         viable: list[tuple[float, Path]] = []
-        for candidate in candidates():
-            try:
-                validated = self._validate_path(candidate.parents[1], candidate)
-            except Exception:
-                continue
-            if validated.exists():
+        for validated in self._tasks_dir_candidates():
+            # One stat per state file; a missing file simply raises
+            mtimes: list[float] = []
+            for name in _TASK_STATE_FILES:
                 try:
-                    if any((validated / name).exists() for name in task_files):
-                        mtime = max(
-                            (validated / name).stat().st_mtime
-                            for name in task_files
-                            if (validated / name).exists()
-                        )
-                    else:
-                        mtime = validated.stat().st_mtime
-                    viable.append((mtime, validated))
+                    mtimes.append(os.stat(os.path.join(validated, name)).st_mtime)
                 except OSError:
                     continue
+            if not mtimes:
+                try:
+                    mtimes.append(validated.stat().st_mtime)
+                except OSError:
+                    continue
+            viable.append((max(mtimes), validated))
 
         if viable:
             # newest wins
@@ -2461,10 +3192,40 @@ class AgentTUI(App[None]):
             return viable[0][1]
 
         # fallback: create primary under CLAUDE_CTX_HOME
-        primary = _resolve_claude_dir() / "tasks" / "current"
+        primary = self._claude_dir / "tasks" / "current"
         primary.mkdir(parents=True, exist_ok=True)
         return self._validate_path(primary.parents[1], primary)
 
+    def _tasks_dir_candidates(self) -> List[Path]:
+        """Validated tasks/current candidates for _tasks_dir, in preference order.
+
+        Only the candidate roots are cached, keyed by CLAUDE_TASKS_HOME and the
+        working directory; each candidate is validated on every call so a
+        retargeted tasks/current symlink is caught.
+        """
+        env_root = os.environ.get("CLAUDE_TASKS_HOME")
+        cwd = os.getcwd()
+        cached = self._tasks_dir_candidates_cache
+        if cached is not None and cached[0] == (env_root, cwd):
+            roots = cached[1]
+        else:
+            candidate_roots: List[Path] = []
+            if env_root:
+                candidate_roots.append(Path(env_root).expanduser())
+            candidate_roots.append(self._claude_dir)
+            candidate_roots.append(Path(cwd) / ".claude")
+            roots = list(dict.fromkeys(candidate_roots))
+            self._tasks_dir_candidates_cache = ((env_root, cwd), roots)
+
+        validated_dirs: List[Path] = []
+        for root in roots:
+            candidate = root / "tasks" / "current"
+            try:
+                validated_dirs.append(self._validate_path(root, candidate))
+            except Exception:
+                continue
+        return validated_dirs
+
     def _tasks_file_path(self) -> Path:
         return self._tasks_dir() / "active_agents.json"
 
@@ -2520,8 +3281,7 @@ class AgentTUI(App[None]):
         if current_step:
             description_bits.append(f"Current step: {current_step}")
         if started:
-            started_dt = datetime.fromtimestamp(started)
-            description_bits.append(f"Started {Format.time_ago(started_dt)}")
+            description_bits.append(f"Started {_time_ago(started)}")
         description_text = " • ".join(description_bits)
 
         fallback.append(
@@ -2551,7 +3311,7 @@ class AgentTUI(App[None]):
 
     def _collect_project_agent_tasks(self) -> List[AgentTask]:
         """Read recent agent launch logs to synthesize tasks for active projects."""
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         projects_root = claude_dir / "projects"
         if not projects_root.is_dir():
             return []
@@ -2656,7 +3416,7 @@ class AgentTUI(App[None]):
                 status = "pending"
 
             progress = 60 if status == "running" else 15
-            agent_slug = re.sub(r"[^a-z0-9]+", "-", f"{agent_label}-{name}".lower()).strip("-")
+            agent_slug = _SLUG_RE.sub("-", f"{agent_label}-{name}".lower()).strip("-")
             agent_id = f"project::{agent_file.stem}::{agent_slug or 'agent'}"
 
             tasks.append(
@@ -2677,7 +3437,7 @@ class AgentTUI(App[None]):
         return tasks
 
     def _project_agent_signature(self) -> str:
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         projects_root = claude_dir / "projects"
         if not projects_root.is_dir():
             return "no-projects"
@@ -2740,49 +3500,60 @@ class AgentTUI(App[None]):
     def _get_agent_category(self, identifier: Optional[str]) -> Optional[str]:
         if not identifier:
             return None
-        lookup = getattr(self, "agent_category_lookup", {})
+        lookup = self.agent_category_lookup
         return lookup.get(identifier.lower())
 
     def _format_category(self, category: Optional[str]) -> str:
         if not category:
             return "[dim]unknown[/dim]"
 
+        cached = self._category_markup_cache.get(category)
+        if cached is not None:
+            return cached
+
         key = category.lower()
-        palette = getattr(self, "_dynamic_category_palette", {})
-        if key not in palette:
-            base_color = self.CATEGORY_PALETTE.get(key)
-            if base_color is None:
-                fallback_index = getattr(self, "_fallback_category_index", 0)
-                if self.CATEGORY_FALLBACK_COLORS:
-                    base_color = self.CATEGORY_FALLBACK_COLORS[
-                        fallback_index % len(self.CATEGORY_FALLBACK_COLORS)
-                    ]
-                    self._fallback_category_index = fallback_index + 1
-                else:
-                    base_color = "white"
-            palette[key] = base_color
-            self._dynamic_category_palette = palette
+        color = self._dynamic_category_palette.get(key)
+        if color is None:
+            color = self._assign_category_color(key)
+
+        markup = sys.intern(f"[{color}]{category}[/{color}]")
+        self._category_markup_cache[category] = markup
+        return markup
+
+    def _assign_category_color(self, key: str) -> str:
+        """Pick and record the colour for a lower-cased category key."""
+        color = self.CATEGORY_PALETTE.get(key)
+        if color is None:
+            if self.CATEGORY_FALLBACK_COLORS:
+                color = self.CATEGORY_FALLBACK_COLORS[
+                    self._fallback_category_index % len(self.CATEGORY_FALLBACK_COLORS)
+                ]
+                self._fallback_category_index += 1
+            else:
+                color = "white"
+        self._dynamic_category_palette[key] = color
+        return color
 
-        color = palette.get(key, "white")
-        return f"[{color}]{category}[/{color}]"
+    @functools.cached_property
+    def _agent_categories(self) -> List[str]:
+        """Sorted distinct agent categories; reset by _invalidate_agent_derived."""
+        return sorted(set(self.agent_category_lookup.values()))
 
     def _category_badges(self) -> List[str]:
-        lookup = getattr(self, "agent_category_lookup", {})
-        categories = sorted(set(lookup.values())) if lookup else []
+        categories = self._agent_categories
         if not categories:
             return ["[dim]n/a[/dim]"]
         return [self._format_category(cat) for cat in categories[:6]]
 
     def _generate_task_id(self, name: str) -> str:
-        base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "task"
+        base = _SLUG_RE.sub("-", name.lower()).strip("-") or "task"
         timestamp = int(time.time())
         return f"{base}-{timestamp}"
 
     def _save_tasks(self, tasks: List[AgentTask]) -> None:
         tasks_file = self._tasks_file_path()
-        payload = {}
-        for task in tasks:
-            payload[task.agent_id] = {
+        payload = {
+            task.agent_id: {
                 "name": task.agent_name,
                 "workstream": task.workstream,
                 "status": task.status,
@@ -2794,10 +3565,23 @@ class AgentTUI(App[None]):
                 "raw_notes": task.raw_notes,
                 "source_path": task.source_path,
             }
-        tasks_file.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            for task in tasks
+        }
+        # Serialized straight to bytes (orjson when installed), no str step
+        content = _dump_json_bytes(payload)
+        # Byte comparison rather than a hash: a collision would drop a save
+        if content == self._tasks_payload and tasks_file.is_file():
+            return
+
+        # Write to a sibling temp file and rename so readers never see a
+        # partially written payload.
+        tmp_file = tasks_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(content)
+        os.replace(tmp_file, tasks_file)
+        self._tasks_payload = content
 
     def _upsert_task(self, agent_id: Optional[str], payload: Dict[str, Any]) -> None:
-        tasks = list(getattr(self, "agent_tasks", []))
+        tasks = list(self.agent_tasks)
         name = payload.get("name", "").strip()
         if not name:
             raise ValueError("Task name is required")
@@ -2824,37 +3608,35 @@ class AgentTUI(App[None]):
                 if status in ("pending", "paused"):
                     existing.completed = None
 
+        existing: Optional[AgentTask] = None
         if agent_id:
-            updated = False
-            for task in tasks:
-                if task.agent_id == agent_id:
-                    task.agent_name = name
-                    task.workstream = workstream
-                    task.status = status
-                    task.progress = progress
-                    task.category = category
-                    task.description = description
-                    task.raw_notes = raw_notes
-                    adjust_times(task)
-                    updated = True
-                    break
-            if not updated:
+            existing = self._tasks_by_id.get(agent_id)
+            if existing is not None:
+                existing.agent_name = name
+                existing.workstream = workstream
+                existing.status = status
+                existing.progress = progress
+                existing.category = category
+                existing.description = description
+                existing.raw_notes = raw_notes
+                adjust_times(existing)
+            else:
                 tasks.append(
-                AgentTask(
-                    agent_id=agent_id,
-                    agent_name=name,
-                    workstream=workstream,
-                    status=status,
-                    progress=progress,
-                    category=category,
-                    started=(
-                        time.time() if status in ("running", "complete") else None
-                    ),
-                    completed=time.time() if status == "complete" else None,
-                    description=description,
-                    raw_notes=raw_notes,
+                    AgentTask(
+                        agent_id=agent_id,
+                        agent_name=name,
+                        workstream=workstream,
+                        status=status,
+                        progress=progress,
+                        category=category,
+                        started=(
+                            time.time() if status in ("running", "complete") else None
+                        ),
+                        completed=time.time() if status == "complete" else None,
+                        description=description,
+                        raw_notes=raw_notes,
+                    )
                 )
-            )
         else:
             new_id = self._generate_task_id(name)
             tasks.append(
@@ -2872,30 +3654,76 @@ class AgentTUI(App[None]):
                 )
             )
 
+        # Match by identity: tasks with equal fields would fool list.index
+        previous_index = next(
+            (i for i, task in enumerate(tasks) if task is existing), -1
+        )
         self._save_tasks(tasks)
-        self.load_agent_tasks()
-        self.update_view()
+        self._adopt_saved_tasks(tasks)
+        if not self._patch_task_row(existing, previous_index):
+            self.update_view()
+
+    def _patch_task_row(self, task: Optional[AgentTask], index: int) -> bool:
+        """Rewrite an edited task's row in place in the Tasks view.
+
+        Returns False when the table needs a full rebuild instead: the task is
+        new, its edit moved it in the sort order, or another view is showing.
+        """
+        if task is None or self.current_view != "tasks":
+            return False
+        tasks = self.agent_tasks
+        if not 0 <= index < len(tasks) or tasks[index] is not task:
+            return False
+        table = self._main_table()
+        if index >= table.row_count:
+            return False
+        for column, value in enumerate(self._task_row(task)):
+            table.update_cell_at(Coordinate(index, column), value)
+        return True
 
     def _remove_task(self, agent_id: str) -> None:
-        tasks = [t for t in getattr(self, "agent_tasks", []) if t.agent_id != agent_id]
+        remaining = dict(self._tasks_by_id)
+        if remaining.pop(agent_id, None) is None:
+            return
+        tasks = list(remaining.values())
         self._save_tasks(tasks)
-        self.load_agent_tasks()
+        self._adopt_saved_tasks(tasks)
         self.update_view()
 
+    def _adopt_saved_tasks(self, tasks: List[AgentTask]) -> None:
+        """Use a task list that was just saved without re-reading it from disk."""
+        if not tasks:
+            # An empty file means the workflow fallback applies; let the loader decide.
+            self.load_agent_tasks()
+            return
+        self._set_agent_tasks(tasks)
+        self._tasks_state_signature = self._compute_tasks_state_signature(
+            self._tasks_dir()
+        )
+        self.refresh_status_bar()
+
+    def _set_agent_tasks(self, tasks: List[AgentTask]) -> None:
+        """Install a task list, rebuilding its id index and running count."""
+        tasks.sort(key=lambda t: t.agent_name.lower())
+        self.agent_tasks = tasks
+        self._tasks_by_id = {t.agent_id: t for t in tasks}
+        self._status_counts["tasks"] = sum(1 for t in tasks if t.status == "running")
+
     def _selected_task_index(self) -> Optional[int]:
         if self.current_view != "tasks":
             return None
-        tasks = getattr(self, "agent_tasks", [])
+        tasks = self.agent_tasks
         if not tasks:
             return None
-        table = self.query_one(DataTable)
+        self._render_pending_view()
+        table = self._main_table()
         row_value = getattr(table, "cursor_row", None)
         if not isinstance(row_value, int):
             return None
         return min(row_value, len(tasks) - 1)
 
     def _build_agent_nodes(self) -> List[WorkflowNode]:
-        agents = getattr(self, "agents", [])
+        agents = self.agents
         if not agents:
             return []
 
@@ -2917,13 +3745,39 @@ class AgentTUI(App[None]):
             nodes.append(node)
         return nodes
 
-    def _render_agent_constellation_preview(self, max_lines: int = 18) -> str:
+    @functools.cached_property
+    def _agent_graph_fingerprint(self) -> int:
+        """Hash of the agent fields that feed the dependency graph renders.
+
+        Reset by _invalidate_agent_derived whenever the agent list changes.
+        """
+        return hash(
+            tuple(
+                (a.slug, a.name, a.status, a.category, tuple(a.requires or ()))
+                for a in self.agents
+            )
+        )
+
+    @functools.cached_property
+    def _agent_dependency_graph(
+        self,
+    ) -> Tuple[List[WorkflowNode], List[str], List[List[str]]]:
+        """Agent nodes with their rendered tree and detected cycles.
+
+        Shared by the constellation preview and the galaxy view; reset by
+        _invalidate_agent_derived whenever the agent list changes.
+        """
         nodes = self._build_agent_nodes()
+        if not nodes:
+            return [], [], []
+        viz = DependencyVisualizer(nodes)
+        return nodes, viz.render_tree(), viz.detect_cycles()
+
+    def _render_agent_constellation_preview(self, max_lines: int = 18) -> str:
+        nodes, tree_lines, _ = self._agent_dependency_graph
         if not nodes:
             return "[dim]Constellation data unavailable (no agents loaded)[/dim]"
 
-        viz = DependencyVisualizer(nodes)
-        tree_lines = viz.render_tree()
         preview = tree_lines[:max_lines]
         if len(tree_lines) > max_lines:
             preview.append("[dim]…expand with 9 to view full galaxy[/dim]")
@@ -2936,22 +3790,29 @@ class AgentTUI(App[None]):
         graph_widget = self.query_one("#galaxy-graph", Static)
 
         header.update("[bold magenta]🌌 Agent Galaxy[/bold magenta]")
-        nodes = self._build_agent_nodes()
+
+        fingerprint = self._agent_graph_fingerprint
+        cached = self._galaxy_render_cache
+        if cached is not None and cached[0] == fingerprint:
+            graph_widget.update(cached[1])
+            stats_widget.update(cached[2])
+            return
+
+        nodes, tree_lines, cycles = self._agent_dependency_graph
 
         if not nodes:
             stats_widget.update("[dim]Load agents to visualize dependencies[/dim]")
             graph_widget.update("[dim]No nodes available[/dim]")
             return
 
-        viz = DependencyVisualizer(nodes)
-        tree_lines = viz.render_tree()
         max_lines = 220
         if len(tree_lines) > max_lines:
             tree_lines = tree_lines[:max_lines] + ["[dim]…truncated[/dim]"]
-        graph_widget.update("\n".join(tree_lines))
+        graph_text = "\n".join(tree_lines)
+        graph_widget.update(graph_text)
 
         active_agents = sum(
-            1 for a in getattr(self, "agents", []) if a.status == "active"
+            1 for a in self.agents if a.status == "active"
         )
         dependency_edges = sum(len(node.dependencies) for node in nodes)
         stats_lines = [
@@ -2961,7 +3822,6 @@ class AgentTUI(App[None]):
             "[cyan]Categories:[/cyan] " + ", ".join(self._category_badges()),
         ]
 
-        cycles = viz.detect_cycles()
         if cycles:
             stats_lines.append("[red]Cycles detected[/red]")
             for cycle in cycles[:3]:
@@ -2971,42 +3831,40 @@ class AgentTUI(App[None]):
         else:
             stats_lines.append("[green]No dependency cycles detected[/green]")
 
-        stats_widget.update("\n".join(stats_lines))
+        stats_text = "\n".join(stats_lines)
+        stats_widget.update(stats_text)
+        self._galaxy_render_cache = (fingerprint, graph_text, stats_text)
 
     def show_workflows_view(self, table: AnyDataTable) -> None:
         """Show workflows table."""
-        table.add_column("Name", key="name")
-        table.add_column("Status", key="status")
-        table.add_column("Progress", key="progress")
-        table.add_column("Started", key="started")
-        table.add_column("Description", key="description")
-
-        if not hasattr(self, "workflows") or not self.workflows:
+        if not self._reuse_table_columns:
+            table.add_column("Name", key="name")
+            table.add_column("Status", key="status")
+            table.add_column("Progress", key="progress")
+            table.add_column("Started", key="started")
+            table.add_column("Description", key="description")
+
+        if not self.workflows:
             table.add_row("No workflows found", "", "", "", "")
             return
 
+        status_icons = self.STATUS_ICON_MARKUP
+        pending_icon = self.STATUS_ICON_DEFAULT
+        play_icon = Icons.PLAY
+        rows: List[Tuple[str, ...]] = []
         for workflow in self.workflows:
-            # Use StatusIcon for better visual representation
-            if workflow.status == "complete":
-                status_text = StatusIcon.active()  # Reuse success icon
-            elif workflow.status == "running":
-                status_text = StatusIcon.running()
-            elif workflow.status == "error":
-                status_text = StatusIcon.error()
-            else:
-                status_text = StatusIcon.pending()
+            status_text = status_icons.get(workflow.status, pending_icon)
 
             # Use ProgressBar utility for consistent visualization
             progress_text = "-"
             if workflow.status in ("running", "paused", "complete"):
-                progress_text = ProgressBar.simple_bar(workflow.progress, 100, width=10)
+                progress_text = _progress_bar(workflow.progress, 10)
 
             # Use Format.time_ago if timestamp is datetime
             started_text = "-"
             if workflow.started:
                 # Assuming started is a timestamp
-                started_dt = datetime.fromtimestamp(workflow.started)
-                started_text = Format.time_ago(started_dt)
+                started_text = _time_ago(workflow.started)
 
             # Use Format.truncate for description
             description = (
@@ -3016,27 +3874,32 @@ class AgentTUI(App[None]):
             )
 
             # Add icon to name
-            name = f"{Icons.PLAY} {workflow.name}"
+            name = f"{play_icon} {workflow.name}"
 
-            table.add_row(
-                name,
-                status_text,
-                progress_text,
-                started_text,
-                description,
+            rows.append(
+                (
+                    name,
+                    status_text,
+                    progress_text,
+                    started_text,
+                    description,
+                )
             )
 
+        table.add_rows(rows)
+
     def show_scenarios_view(self, table: AnyDataTable) -> None:
         """Show scenario catalog."""
-        table.add_column("Scenario", key="scenario", width=32)
-        table.add_column("Status", key="status", width=14)
-        table.add_column("Priority", key="priority", width=12)
-        table.add_column("Phases", key="phases", width=18)
-        table.add_column("Agents", key="agents", width=24)
-        table.add_column("Last Run", key="last_run", width=14)
-        table.add_column("Description", key="description")
-
-        scenarios = getattr(self, "scenarios", [])
+        if not self._reuse_table_columns:
+            table.add_column("Scenario", key="scenario", width=32)
+            table.add_column("Status", key="status", width=14)
+            table.add_column("Priority", key="priority", width=12)
+            table.add_column("Phases", key="phases", width=18)
+            table.add_column("Agents", key="agents", width=24)
+            table.add_column("Last Run", key="last_run", width=14)
+            table.add_column("Description", key="description")
+
+        scenarios = self.scenarios
         if not scenarios:
             table.add_row("[dim]No scenarios found[/dim]", "", "", "", "", "", "")
             table.add_row(
@@ -3058,6 +3921,7 @@ class AgentTUI(App[None]):
             "low": "cyan",
         }
 
+        rows: List[Tuple[str, str, str, str, str, str, str]] = []
         for scenario in scenarios:
             icon = Icons.PLAY if scenario.status != "invalid" else Icons.WARNING
             name = f"{icon} {scenario.name}"
@@ -3103,25 +3967,30 @@ class AgentTUI(App[None]):
             description = scenario.description or scenario.error or ""
             description = Format.truncate(description, 60) if description else ""
 
-            table.add_row(
-                name,
-                status_text,
-                priority_text,
-                phases_text,
-                agents_text,
-                last_run_text,
-                description,
+            rows.append(
+                (
+                    name,
+                    status_text,
+                    priority_text,
+                    phases_text,
+                    agents_text,
+                    last_run_text,
+                    description,
+                )
             )
+        table.add_rows(rows)
 
     def show_orchestrate_view(self, table: AnyDataTable) -> None:
         """Show orchestration dashboard with active agents and metrics."""
-        table.add_column("Agent", key="agent")
-        table.add_column("Category", key="category", width=16)
-        table.add_column("Workstream", key="workstream")
-        table.add_column("Status", key="status")
-        table.add_column("Progress", key="progress")
+        if not self._reuse_table_columns:
+            table.add_column("Agent", key="agent")
+            table.add_column("Category", key="category", width=16)
+            table.add_column("Workstream", key="workstream")
+            table.add_column("Status", key="status")
+            table.add_column("Progress", key="progress")
 
-        tasks = getattr(self, "agent_tasks", [])
+        tasks = self.agent_tasks
+        rows: List[Tuple[str, ...]] = []
 
         if not tasks:
             # Show example/placeholder data with enhanced visuals
@@ -3156,39 +4025,35 @@ class AgentTUI(App[None]):
                 ),
             ]
             for name, category, workstream, status_icon, progress in placeholder_rows:
-                table.add_row(
-                    name,
-                    self._format_category(category),
-                    workstream,
-                    status_icon,
-                    ProgressBar.simple_bar(progress, 100, width=15),
+                rows.append(
+                    (
+                        name,
+                        self._format_category(category),
+                        workstream,
+                        status_icon,
+                        _progress_bar(progress, 15),
+                    )
                 )
 
             # Add metrics section
-            table.add_row("", "", "", "", "")
-            table.add_row("METRICS:", "", "", "", "")
-            table.add_row("Parallel Efficiency:", "", "87%", "", "")
-            table.add_row("Overall Progress:", "", "78%", "", "")
-            table.add_row("Active Agents:", "", "2/4", "", "")
-            table.add_row("Estimated Completion:", "", "2m 30s", "", "")
+            rows.append(("", "", "", "", ""))
+            rows.append(("METRICS:", "", "", "", ""))
+            rows.append(("Parallel Efficiency:", "", "87%", "", ""))
+            rows.append(("Overall Progress:", "", "78%", "", ""))
+            rows.append(("Active Agents:", "", "2/4", "", ""))
+            rows.append(("Estimated Completion:", "", "2m 30s", "", ""))
         else:
             # Show real task data with enhanced visuals
+            status_icons = self.STATUS_ICON_MARKUP
+            pending_icon = self.STATUS_ICON_DEFAULT
+            code_icon = Icons.CODE
             for task in tasks:
                 # Use ProgressBar utility
-                progress_bar = ProgressBar.simple_bar(task.progress, 100, width=15)
-
-                # Use StatusIcon based on task status
-                if task.status == "complete":
-                    status_text = StatusIcon.active()
-                elif task.status == "running":
-                    status_text = StatusIcon.running()
-                elif task.status == "error":
-                    status_text = StatusIcon.error()
-                else:
-                    status_text = StatusIcon.pending()
+                progress_bar = _progress_bar(task.progress, 15)
+                status_text = status_icons.get(task.status, pending_icon)
 
                 # Add icon to agent name
-                agent_display = f"{Icons.CODE} [{task.agent_id}] {task.agent_name}"
+                agent_display = f"{code_icon} [{task.agent_id}] {task.agent_name}"
 
                 category_guess = (
                     self._get_agent_category(task.agent_id)
@@ -3196,12 +4061,14 @@ class AgentTUI(App[None]):
                     or task.workstream
                 )
 
-                table.add_row(
-                    agent_display,
-                    self._format_category(category_guess),
-                    task.workstream,
-                    status_text,
-                    progress_bar,
+                rows.append(
+                    (
+                        agent_display,
+                        self._format_category(category_guess),
+                        task.workstream,
+                        status_text,
+                        progress_bar,
+                    )
                 )
 
             # Calculate and display metrics
@@ -3215,29 +4082,32 @@ class AgentTUI(App[None]):
             )
 
             # Add metrics section
-            table.add_row("", "", "", "", "")
-            table.add_row("METRICS:", "", "", "", "")
-            table.add_row("Parallel Efficiency:", "", f"{parallel_efficiency}%", "", "")
-            table.add_row("Overall Progress:", "", f"{total_progress}%", "", "")
-            table.add_row("Active Agents:", "", f"{running_count}/{len(tasks)}", "", "")
-            table.add_row("Completed:", "", f"{complete_count}/{len(tasks)}", "", "")
+            rows.append(("", "", "", "", ""))
+            rows.append(("METRICS:", "", "", "", ""))
+            rows.append(("Parallel Efficiency:", "", f"{parallel_efficiency}%", "", ""))
+            rows.append(("Overall Progress:", "", f"{total_progress}%", "", ""))
+            rows.append(("Active Agents:", "", f"{running_count}/{len(tasks)}", "", ""))
+            rows.append(("Completed:", "", f"{complete_count}/{len(tasks)}", "", ""))
 
             # Estimate completion time
             if running_count > 0 and total_progress > 0:
                 estimated_minutes = int((100 - total_progress) * 0.5)
-                table.add_row(
-                    "Estimated Completion:", "", f"{estimated_minutes}m", "", ""
+                rows.append(
+                    ("Estimated Completion:", "", f"{estimated_minutes}m", "", "")
                 )
             else:
-                table.add_row("Estimated Completion:", "", "TBD", "", "")
+                rows.append(("Estimated Completion:", "", "TBD", "", ""))
+
+        table.add_rows(rows)
 
     def show_mcp_view(self, table: AnyDataTable) -> None:
         """Show MCP server overview with validation status."""
-        table.add_column("Server", width=24)
-        table.add_column("Command", width=30)
-        table.add_column("Docs", width=6)
-        table.add_column("Status", width=18)
-        table.add_column("Notes")
+        if not self._reuse_table_columns:
+            table.add_column("Server", width=24)
+            table.add_column("Command", width=30)
+            table.add_column("Docs", width=6)
+            table.add_column("Status", width=18)
+            table.add_column("Notes")
 
         if self.mcp_error:
             table.add_row(
@@ -3245,11 +4115,12 @@ class AgentTUI(App[None]):
             )
             return
 
-        servers = getattr(self, "mcp_servers", [])
+        servers = self.mcp_servers
         if not servers:
             table.add_row("[dim]No MCP servers configured[/dim]", "", "", "", "")
             return
 
+        rows: List[Tuple[str, str, str, str, str]] = []
         for server in servers:
             args = " ".join(server.args) if server.args else ""
             docs_text = "[green]✓[/green]" if server.docs_path else "[dim]-[/dim]"
@@ -3263,7 +4134,9 @@ class AgentTUI(App[None]):
                     f"{server.command} {args}".strip(), 30
                 )
                 try:
-                    is_valid, errors, warnings = validate_server_config(server.name)
+                    is_valid, errors, warnings = self._cached_server_validation(
+                        server.name
+                    )
                 except Exception as exc:
                     is_valid = False
                     errors = [str(exc)]
@@ -3282,22 +4155,44 @@ class AgentTUI(App[None]):
                 elif warnings:
                     note = warnings[0]
 
-            table.add_row(
-                f"{Icons.CODE} {server.name}",
-                command_text,
-                docs_text,
-                status_text,
-                Format.truncate(note, 60),
+            rows.append(
+                (
+                    f"{Icons.CODE} {server.name}",
+                    command_text,
+                    docs_text,
+                    status_text,
+                    Format.truncate(note, 60),
+                )
             )
+        table.add_rows(rows)
+
+    def _cached_server_validation(
+        self, name: str
+    ) -> Tuple[bool, List[str], List[str]]:
+        """Run validate_server_config, reusing results while the config is unchanged.
+
+        Every validation re-reads the whole Claude Desktop config, so the MCP
+        view would otherwise parse it once per listed server on each render.
+        """
+        config_path = _get_claude_config_path()
+        if not config_path.is_file():
+            return validate_server_config(name)
+        return _stat_cached(
+            self._mcp_validation_cache,
+            config_path,
+            lambda: validate_server_config(name),
+            key=name,
+        )
 
     def show_ai_assistant_view(self, table: AnyDataTable) -> None:
         """Show AI assistant recommendations and predictions."""
-        table.add_column("Type", key="type", width=18)
-        table.add_column("Recommendation", key="recommendation", width=25)
-        table.add_column("Confidence", key="confidence", width=10)
-        table.add_column("Reason", width=50)
+        if not self._reuse_table_columns:
+            table.add_column("Type", key="type", width=18)
+            table.add_column("Recommendation", key="recommendation", width=25)
+            table.add_column("Confidence", key="confidence", width=10)
+            table.add_column("Reason", width=50)
 
-        if not hasattr(self, "intelligent_agent"):
+        if self.intelligent_agent is None:
             table.add_row(
                 "[dim]System[/dim]",
                 "[yellow]AI Assistant not initialized[/yellow]",
@@ -3306,74 +4201,139 @@ class AgentTUI(App[None]):
             )
             return
 
-        # Get recommendations
-        agent_recommendations = self.intelligent_agent.get_recommendations()
+        agent_recommendations, workflow = self._ai_insights()
+        session_context: Optional[SessionContext] = (
+            self.intelligent_agent.current_context
+        )
 
-        # Show header
-        table.add_row(
-            "[bold cyan]🤖 AI Recommendations[/bold cyan]", "", "", ""
+        # Rebuild the agent and workflow rows only when their inputs change;
+        # the skill rows depend on the project tree and are always rebuilt
+        signature = self._ai_view_signature(
+            agent_recommendations, workflow, session_context
         )
-        table.add_row(
-            "[dim]━━━━━━━━━━━━━━━━━━━[/dim]",
-            "",
-            "",
-            "",
+        cached = self._ai_view_cache
+        if cached is not None and cached[0] == signature:
+            agent_rows, workflow_rows = cached[1], cached[2]
+        else:
+            agent_rows = _rows_with_heights(
+                self._build_ai_agent_rows(agent_recommendations)
+            )
+            workflow_rows = _rows_with_heights(
+                self._build_ai_workflow_rows(workflow, session_context)
+            )
+            self._ai_view_cache = (signature, agent_rows, workflow_rows)
+
+        skill_rows = _rows_with_heights(self._build_ai_skill_rows())
+        for row, height in itertools.chain(agent_rows, skill_rows, workflow_rows):
+            table.add_row(*row, height=height)
+
+    def _analyze_ai_context(self) -> None:
+        """Re-analyze the session context and invalidate cached AI results."""
+        if self.intelligent_agent is None:
+            return
+        self.intelligent_agent.analyze_context()
+        self._ai_generation += 1
+
+    def _ai_insights(
+        self,
+    ) -> Tuple[List[AgentRecommendation], Optional[WorkflowPrediction]]:
+        """Return recommendations and workflow prediction for the current context.
+
+        Both are computed once per context analysis and reused until the next one.
+        """
+        if self.intelligent_agent is None:
+            return [], None
+        cached = self._ai_insights_cache
+        if cached is not None and cached[0] == self._ai_generation:
+            return cached[1], cached[2]
+        recommendations = self.intelligent_agent.get_recommendations()
+        workflow = self.intelligent_agent.predict_workflow()
+        self._ai_insights_cache = (self._ai_generation, recommendations, workflow)
+        return recommendations, workflow
+
+    def _ai_confidence_style(self, confidence: float) -> Tuple[str, str]:
+        """Return (confidence template, skill type cell) for a confidence score."""
+        for threshold, template, skill_label in self.AI_CONFIDENCE_TIERS:
+            if confidence >= threshold:
+                return template, skill_label
+        _, template, skill_label = self.AI_CONFIDENCE_TIERS[-1]
+        return template, skill_label
+
+    def _ai_view_signature(
+        self,
+        agent_recommendations: Sequence[AgentRecommendation],
+        workflow: Optional[WorkflowPrediction],
+        session_context: Optional[SessionContext],
+    ) -> Tuple[Any, ...]:
+        """Summarize the inputs of the cached AI agent and workflow rows."""
+        recs_key = tuple(
+            (rec.agent_name, rec.confidence, rec.urgency, rec.auto_activate, rec.reason)
+            for rec in agent_recommendations[:10]
         )
-        table.add_row("", "", "", "")
+        workflow_key = (
+            (
+                workflow.workflow_name,
+                tuple(workflow.agents_sequence),
+                workflow.confidence,
+                workflow.estimated_duration,
+                workflow.success_probability,
+                workflow.based_on_pattern,
+            )
+            if workflow
+            else None
+        )
+        context_key = (
+            (
+                len(session_context.files_changed),
+                session_context.flags,
+                session_context.errors_count,
+                session_context.test_failures,
+            )
+            if session_context
+            else None
+        )
+        return (recs_key, workflow_key, context_key)
+
+    def _build_ai_agent_rows(
+        self, agent_recommendations: Sequence[AgentRecommendation]
+    ) -> List[Tuple[str, str, str, str]]:
+        """Build the agent recommendation rows of the AI assistant view."""
+        # Show header
+        rows: List[Tuple[str, str, str, str]] = list(_AI_RECOMMENDATIONS_HEADER)
 
         if not agent_recommendations:
-            table.add_row(
-                "[dim]Agent[/dim]",
-                "[dim]No recommendations[/dim]",
-                "",
-                "[dim]Context analysis found no suggestions[/dim]",
+            rows.append(
+                (
+                    "[dim]Agent[/dim]",
+                    "[dim]No recommendations[/dim]",
+                    "",
+                    "[dim]Context analysis found no suggestions[/dim]",
+                )
             )
         else:
             # Show agent recommendations
+            urgency_labels = self.AI_URGENCY_LABELS
+            urgency_default = self.AI_URGENCY_DEFAULT_LABEL
             for rec in agent_recommendations[:10]:  # Top 10
-                # Color by urgency
-                if rec.urgency == "critical":
-                    urgency_color = "red"
-                    urgency_icon = "🔴"
-                elif rec.urgency == "high":
-                    urgency_color = "yellow"
-                    urgency_icon = "🟡"
-                elif rec.urgency == "medium":
-                    urgency_color = "cyan"
-                    urgency_icon = "🔵"
-                else:
-                    urgency_color = "dim"
-                    urgency_icon = "⚪"
-
-                # Color by confidence
-                confidence_pct = int(rec.confidence * 100)
-                if rec.confidence >= 0.8:
-                    confidence_text = f"[bold green]{confidence_pct}%[/bold green]"
-                elif rec.confidence >= 0.6:
-                    confidence_text = f"[yellow]{confidence_pct}%[/yellow]"
-                else:
-                    confidence_text = f"[dim]{confidence_pct}%[/dim]"
-
-                # Auto-activate indicator
-                auto_text = " [bold cyan]AUTO[/bold cyan]" if rec.auto_activate else ""
-
-                table.add_row(
-                    f"[{urgency_color}]{urgency_icon} Agent[/{urgency_color}]",
-                    f"[bold]{rec.agent_name}[/bold]{auto_text}",
-                    confidence_text,
-                    f"[dim italic]{rec.reason}[/dim italic]",
+                confidence_template, _ = self._ai_confidence_style(rec.confidence)
+                auto_text = self.AI_AUTO_BADGE if rec.auto_activate else ""
+                rows.append(
+                    (
+                        urgency_labels.get(rec.urgency, urgency_default),
+                        f"[bold]{rec.agent_name}[/bold]{auto_text}",
+                        confidence_template.format(int(rec.confidence * 100)),
+                        f"[dim italic]{rec.reason}[/dim italic]",
+                    )
                 )
+        return rows
 
-        # Show skill recommendations
-        table.add_row("", "", "", "")
-        table.add_row("[bold green]✨ Skills[/bold green]", "", "", "")
-        table.add_row(
-            "[dim]━━━━━━━━━━[/dim]",
-            "",
-            "",
-            "",
-        )
-        table.add_row("", "", "", "")
+    def _build_ai_skill_rows(self) -> List[Tuple[str, str, str, str]]:
+        """Build the skill recommendation rows of the AI assistant view.
+
+        The recommender reads the project tree and its own history, so these
+        rows are rebuilt on every render rather than cached.
+        """
+        rows: List[Tuple[str, str, str, str]] = list(_AI_SKILLS_HEADER)
 
         # Get skill recommendations using the recommender directly
         try:
@@ -3381,7 +4341,8 @@ class AgentTUI(App[None]):
 
             # Create context from current project
             cwd = Path.cwd()
-            python_files = list(cwd.glob("**/*.py"))[:20]
+            # Stop the scan once the 20 files that are used have been found
+            python_files = list(itertools.islice(cwd.glob("**/*.py"), 20))
 
             context = SessionContext(
                 files_changed=[str(f.relative_to(cwd)) for f in python_files] if python_files else [],
@@ -3409,138 +4370,114 @@ class AgentTUI(App[None]):
             if skill_recommendations:
                 # Show top 5 skill recommendations
                 for skill_rec in skill_recommendations[:5]:
-                    confidence_pct = int(skill_rec.confidence * 100)
-
-                    # Color by confidence
-                    if skill_rec.confidence >= 0.8:
-                        confidence_text = f"[bold green]{confidence_pct}%[/bold green]"
-                        skill_icon = "✓"
-                        skill_color = "green"
-                    elif skill_rec.confidence >= 0.6:
-                        confidence_text = f"[yellow]{confidence_pct}%[/yellow]"
-                        skill_icon = "•"
-                        skill_color = "yellow"
-                    else:
-                        confidence_text = f"[dim]{confidence_pct}%[/dim]"
-                        skill_icon = "○"
-                        skill_color = "dim"
-
-                    # Auto-activate indicator
-                    auto_text = (
-                        " [bold cyan]AUTO[/bold cyan]"
-                        if skill_rec.auto_activate
-                        else ""
+                    confidence_template, skill_label = self._ai_confidence_style(
+                        skill_rec.confidence
                     )
-
-                    table.add_row(
-                        f"[{skill_color}]{skill_icon} Skill[/{skill_color}]",
-                        f"[bold]{skill_rec.skill_name}[/bold]{auto_text}",
-                        confidence_text,
-                        f"[dim italic]{skill_rec.reason}[/dim italic]",
+                    auto_text = self.AI_AUTO_BADGE if skill_rec.auto_activate else ""
+                    rows.append(
+                        (
+                            skill_label,
+                            f"[bold]{skill_rec.skill_name}[/bold]{auto_text}",
+                            confidence_template.format(int(skill_rec.confidence * 100)),
+                            f"[dim italic]{skill_rec.reason}[/dim italic]",
+                        )
                     )
             else:
-                table.add_row(
+                rows.append(
+                    (
+                        "[dim]Skills[/dim]",
+                        "[dim]No recommendations[/dim]",
+                        "",
+                        "[dim]Skills will be recommended based on project context[/dim]",
+                    )
+                )
+        except Exception as e:
+            rows.append(
+                (
                     "[dim]Skills[/dim]",
-                    "[dim]No recommendations[/dim]",
+                    f"[red]Error: {str(e)[:30]}[/red]",
                     "",
-                    "[dim]Skills will be recommended based on project context[/dim]",
+                    f"[dim]{type(e).__name__}[/dim]",
                 )
-        except Exception as e:
-            table.add_row(
-                "[dim]Skills[/dim]",
-                f"[red]Error: {str(e)[:30]}[/red]",
-                "",
-                f"[dim]{type(e).__name__}[/dim]",
             )
+        return rows
 
+    def _build_ai_workflow_rows(
+        self,
+        workflow: Optional[WorkflowPrediction],
+        session_context: Optional[SessionContext],
+    ) -> List[Tuple[str, str, str, str]]:
+        """Build the workflow, context and quick action rows of the AI view."""
         # Show workflow prediction if available
-        table.add_row("", "", "", "")
-        table.add_row("[bold magenta]🎯 WORKFLOW PREDICTION[/bold magenta]", "", "", "")
-        table.add_row(
-            "[dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]",
-            "",
-            "",
-            "",
-        )
-        table.add_row("", "", "", "")
-
-        workflow = self.intelligent_agent.predict_workflow()
+        rows: List[Tuple[str, str, str, str]] = list(_AI_WORKFLOW_HEADER)
 
         if workflow:
             confidence_pct = int(workflow.confidence * 100)
             success_pct = int(workflow.success_probability * 100)
 
-            table.add_row(
-                "[cyan]Workflow[/cyan]",
-                f"[bold]{workflow.workflow_name}[/bold]",
-                f"[green]{confidence_pct}%[/green]",
-                f"[dim]Based on {workflow.based_on_pattern} pattern[/dim]",
+            rows.append(
+                (
+                    "[cyan]Workflow[/cyan]",
+                    f"[bold]{workflow.workflow_name}[/bold]",
+                    f"[green]{confidence_pct}%[/green]",
+                    f"[dim]Based on {workflow.based_on_pattern} pattern[/dim]",
+                )
             )
 
-            table.add_row(
-                "[cyan]Est. Duration[/cyan]",
-                f"[yellow]{workflow.estimated_duration // 60}m {workflow.estimated_duration % 60}s[/yellow]",
-                "",
-                "",
+            rows.append(
+                (
+                    "[cyan]Est. Duration[/cyan]",
+                    f"[yellow]{workflow.estimated_duration // 60}m {workflow.estimated_duration % 60}s[/yellow]",
+                    "",
+                    "",
+                )
             )
 
-            table.add_row(
-                "[cyan]Success Rate[/cyan]", f"[green]{success_pct}%[/green]", "", ""
+            rows.append(
+                ("[cyan]Success Rate[/cyan]", f"[green]{success_pct}%[/green]", "", "")
             )
 
-            table.add_row("", "", "", "")
-            table.add_row("[cyan]Agent Sequence:[/cyan]", "", "", "")
+            rows.append(("\n[cyan]Agent Sequence:[/cyan]", "", "", ""))
 
-            for i, agent in enumerate(workflow.agents_sequence, 1):
-                table.add_row("", f"[dim]{i}.[/dim] {Icons.CODE} {agent}", "", "")
+            # One multi-line row for the whole sequence
+            if workflow.agents_sequence:
+                sequence_text = "\n".join(
+                    f"[dim]{i}.[/dim] {Icons.CODE} {agent}"
+                    for i, agent in enumerate(workflow.agents_sequence, 1)
+                )
+                rows.append(("", sequence_text, "", ""))
         else:
-            table.add_row(
-                "[dim]Workflow[/dim]",
-                "[dim]Not enough data[/dim]",
-                "",
-                "[dim italic]Need 3+ similar sessions for prediction[/dim italic]",
+            rows.append(
+                (
+                    "[dim]Workflow[/dim]",
+                    "[dim]Not enough data[/dim]",
+                    "",
+                    "[dim italic]Need 3+ similar sessions for prediction[/dim italic]",
+                )
             )
 
         # Show context info
-        table.add_row("", "", "", "")
-        table.add_row("[bold yellow]📊 CONTEXT ANALYSIS[/bold yellow]", "", "", "")
-        table.add_row(
-            "[dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]",
-            "",
-            "",
-            "",
-        )
-        table.add_row("", "", "", "")
+        rows.extend(_AI_CONTEXT_HEADER)
 
-        session_context: Optional[SessionContext] = (
-            self.intelligent_agent.current_context
-        )
         if session_context:
-            table.add_row(
-                "[cyan]Files Changed[/cyan]",
-                f"{len(session_context.files_changed)}",
-                "",
-                "",
+            rows.append(
+                (
+                    "[cyan]Files Changed[/cyan]",
+                    f"{len(session_context.files_changed)}",
+                    "",
+                    "",
+                )
             )
 
             # Show detected contexts
-            contexts_detected = []
-            if session_context.has_frontend:
-                contexts_detected.append("[blue]Frontend[/blue]")
-            if session_context.has_backend:
-                contexts_detected.append("[green]Backend[/green]")
-            if session_context.has_database:
-                contexts_detected.append("[magenta]Database[/magenta]")
-            if session_context.has_tests:
-                contexts_detected.append("[yellow]Tests[/yellow]")
-            if session_context.has_auth:
-                contexts_detected.append("[red]Auth[/red]")
-            if session_context.has_api:
-                contexts_detected.append("[cyan]API[/cyan]")
+            flags = session_context.flags
+            contexts_detected = [
+                label for mask, label in _AI_CONTEXT_LABELS if flags & mask
+            ]
 
             if contexts_detected:
-                table.add_row(
-                    "[cyan]Detected:[/cyan]", ", ".join(contexts_detected), "", ""
+                rows.append(
+                    ("[cyan]Detected:[/cyan]", ", ".join(contexts_detected), "", "")
                 )
 
             # Show errors if any
@@ -3548,42 +4485,26 @@ class AgentTUI(App[None]):
                 session_context.errors_count > 0
                 or session_context.test_failures > 0
             ):
-                table.add_row(
-                    "[red]Issues:[/red]",
-                    f"[red]{session_context.errors_count} errors, {session_context.test_failures} test failures[/red]",
-                    "",
-                    "",
+                rows.append(
+                    (
+                        "[red]Issues:[/red]",
+                        f"[red]{session_context.errors_count} errors, {session_context.test_failures} test failures[/red]",
+                        "",
+                        "",
+                    )
                 )
 
         # Show actions
-        table.add_row("", "", "", "")
-        table.add_row("[bold green]⚡ QUICK ACTIONS[/bold green]", "", "", "")
-        table.add_row(
-            "[dim]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/dim]",
-            "",
-            "",
-            "",
-        )
-        table.add_row("", "", "", "")
-        table.add_row(
-            "",
-            "[dim cyan]Press [white]A[/white] → Auto-activate recommended agents[/dim cyan]",
-            "",
-            "",
-        )
-        table.add_row(
-            "",
-            "[dim cyan]Press [white]R[/white] → Refresh recommendations[/dim cyan]",
-            "",
-            "",
-        )
+        rows.extend(_AI_QUICK_ACTIONS)
+        return rows
 
     def show_assets_view(self, table: AnyDataTable) -> None:
         """Show available assets for installation."""
-        table.add_column("Category", key="category", width=12)
-        table.add_column("Name", key="name", width=30)
-        table.add_column("Status", key="status", width=15)
-        table.add_column("Description", key="description")
+        if not self._reuse_table_columns:
+            table.add_column("Category", key="category", width=12)
+            table.add_column("Name", key="name", width=30)
+            table.add_column("Status", key="status", width=15)
+            table.add_column("Description", key="description")
 
         if not self.available_assets:
             table.add_row("[dim]No assets found[/dim]", "", "", "")
@@ -3613,6 +4534,7 @@ class AgentTUI(App[None]):
         }
 
         # Render assets by category
+        rows: List[Tuple[str, str, str, str]] = []
         for category_name in ["hooks", "commands", "agents", "skills", "modes", "workflows"]:
             assets = self.available_assets.get(category_name, [])
             if not assets:
@@ -3642,19 +4564,23 @@ class AgentTUI(App[None]):
                 # Truncate description
                 desc = Format.truncate(asset.description, 60).replace("[", "\\[")
 
-                table.add_row(
-                    f"[{color}]{category_name}[/{color}]",
-                    name_text,
-                    status_text,
-                    f"[dim]{desc}[/dim]",
+                rows.append(
+                    (
+                        f"[{color}]{category_name}[/{color}]",
+                        name_text,
+                        status_text,
+                        f"[dim]{desc}[/dim]",
+                    )
                 )
+        table.add_rows(rows)
 
     def show_memory_view(self, table: AnyDataTable) -> None:
         """Show memory vault notes."""
-        table.add_column("Type", key="type", width=12)
-        table.add_column("Title", key="title", width=35)
-        table.add_column("Modified", key="modified", width=12)
-        table.add_column("Tags", key="tags")
+        if not self._reuse_table_columns:
+            table.add_column("Type", key="type", width=12)
+            table.add_column("Title", key="title", width=35)
+            table.add_column("Modified", key="modified", width=12)
+            table.add_column("Tags", key="tags")
 
         if not self.memory_notes:
             table.add_row("[dim]No notes found[/dim]", "", "", "")
@@ -3671,11 +4597,12 @@ class AgentTUI(App[None]):
             "fixes": ("🔧", "magenta"),
         }
 
+        now = datetime.now()
+        rows: List[Tuple[str, str, str, str]] = []
         for note in self.memory_notes:
             icon, color = type_config.get(note.note_type, ("📄", "white"))
 
             # Format modified time
-            now = datetime.now()
             diff = now - note.modified
             if diff.days > 0:
                 modified_text = f"{diff.days}d ago"
@@ -3691,117 +4618,135 @@ class AgentTUI(App[None]):
             if len(note.tags) > 3:
                 tags_text += f" [dim]+{len(note.tags) - 3}[/dim]"
 
-            table.add_row(
-                f"[{color}]{icon} {note.note_type}[/{color}]",
-                f"{note.title}",
-                f"[dim]{modified_text}[/dim]",
-                tags_text,
+            rows.append(
+                (
+                    f"[{color}]{icon} {note.note_type}[/{color}]",
+                    f"{note.title}",
+                    f"[dim]{modified_text}[/dim]",
+                    tags_text,
+                )
             )
+        table.add_rows(rows)
+
+    def _notify_coalesced(
+        self, message: str, severity: SeverityLevel = "information", timeout: float = 1
+    ) -> None:
+        """Show a transient toast unless the same one was just requested.
+
+        Holding a view or refresh key repeats the same message many times per
+        second; only the first toast of such a burst is queued.
+        """
+        now = time.monotonic()
+        last_message, last_time = self._last_notification
+        self._last_notification = (message, now)
+        if message == last_message and now - last_time < self.NOTIFY_COALESCE_WINDOW:
+            return
+        self.notify(message, severity=severity, timeout=timeout)
 
     def action_view_overview(self) -> None:
         """Switch to overview."""
         self.current_view = "overview"
         self.status_message = "Switched to Overview"
-        self.notify("📊 Overview", severity="information", timeout=1)
+        self._notify_coalesced("📊 Overview")
 
     def action_view_agents(self) -> None:
         """Switch to agents view."""
         self.current_view = "agents"
         self.status_message = "Switched to Agents"
-        self.notify("🤖 Agents", severity="information", timeout=1)
+        self._notify_coalesced("🤖 Agents")
 
     def action_view_modes(self) -> None:
         """Switch to modes view."""
         self.current_view = "modes"
         self.status_message = "Switched to Modes"
-        self.notify("🎨 Modes", severity="information", timeout=1)
+        self._notify_coalesced("🎨 Modes")
 
     def action_view_rules(self) -> None:
         """Switch to rules view."""
         self.current_view = "rules"
         self.status_message = "Switched to Rules"
-        self.notify("📜 Rules", severity="information", timeout=1)
+        self._notify_coalesced("📜 Rules")
 
     def action_view_skills(self) -> None:
         """Switch to skills view."""
         self.current_view = "skills"
         self.status_message = "Switched to Skills"
-        self.notify("💎 Skills", severity="information", timeout=1)
+        self._notify_coalesced("💎 Skills")
 
     def action_view_commands(self) -> None:
         """Switch to slash commands view."""
         self.current_view = "commands"
         self.load_slash_commands()
         self.status_message = "Switched to Slash Commands"
-        self.notify("⌘ Slash Commands", severity="information", timeout=1)
+        self._notify_coalesced("⌘ Slash Commands")
 
     def action_view_workflows(self) -> None:
         """Switch to workflows view."""
         self.current_view = "workflows"
         self.status_message = "Switched to Workflows"
-        self.notify("🔄 Workflows", severity="information", timeout=1)
+        self._notify_coalesced("🔄 Workflows")
 
     def action_view_scenarios(self) -> None:
         """Switch to scenarios view."""
         self.current_view = "scenarios"
         self.load_scenarios()
         self.status_message = "Switched to Scenarios"
-        self.notify("🗺 Scenarios", severity="information", timeout=1)
+        self._notify_coalesced("🗺 Scenarios")
 
     def action_view_orchestrate(self) -> None:
         """Switch to orchestrate view."""
         self.current_view = "orchestrate"
         self.status_message = "Switched to Orchestrate"
-        self.notify("🎯 Orchestrate", severity="information", timeout=1)
+        self._notify_coalesced("🎯 Orchestrate")
 
     def action_view_mcp(self) -> None:
         """Switch to MCP servers view."""
         self.current_view = "mcp"
         self.load_mcp_servers()
         self.status_message = "Switched to MCP"
-        self.notify("🛰 MCP Servers", severity="information", timeout=1)
+        self._notify_coalesced("🛰 MCP Servers")
 
     def action_view_profiles(self) -> None:
         """Switch to profiles view."""
         self.current_view = "profiles"
         self.load_profiles()
         self.status_message = "Switched to Profiles"
-        self.notify("👤 Profiles", severity="information", timeout=1)
+        self._notify_coalesced("👤 Profiles")
 
     def action_view_export(self) -> None:
         """Switch to export view."""
         self.current_view = "export"
         self.status_message = "Configure context export"
-        self.notify("📤 Export", severity="information", timeout=1)
+        self._notify_coalesced("📤 Export")
 
     def action_view_ai_assistant(self) -> None:
         """Switch to AI assistant view."""
         self.current_view = "ai_assistant"
         self.status_message = "Switched to AI Assistant"
-        self.notify("🤖 AI Assistant", severity="information", timeout=1)
+        self._notify_coalesced("🤖 AI Assistant")
         # Refresh recommendations when entering view
-        if hasattr(self, "intelligent_agent"):
-            self.intelligent_agent.analyze_context()
+        if self.intelligent_agent is not None:
+            self._analyze_ai_context()
 
     def action_view_assets(self) -> None:
         """Switch to assets view."""
         self.load_assets()
         self.current_view = "assets"
         self.status_message = "Switched to Asset Manager"
-        self.notify("📦 Asset Manager", severity="information", timeout=1)
+        self._notify_coalesced("📦 Asset Manager")
 
     def action_view_memory(self) -> None:
         """Switch to memory view."""
         self.load_memory_notes()
         self.current_view = "memory"
         self.status_message = "Switched to Memory Vault"
-        self.notify("🧠 Memory Vault", severity="information", timeout=1)
+        self._notify_coalesced("🧠 Memory Vault")
 
     def action_view_watch_mode(self) -> None:
         """Switch to watch mode view."""
         self.current_view = "watch_mode"
         self.status_message = "Switched to Watch Mode"
-        self.notify("🔍 Watch Mode", severity="information", timeout=1)
+        self._notify_coalesced("🔍 Watch Mode")
 
     # ─────────────────────────────────────────────────────────────────────
     # Watch Mode Actions
@@ -3976,11 +4921,11 @@ class AgentTUI(App[None]):
 
     def _render_watch_mode_view(self) -> None:
         """Render watch mode control panel."""
-        table = self.query_one(DataTable)
-        table.clear(columns=True)
-        table.add_column("Setting", width=22)
-        table.add_column("Value", width=48)
-        table.add_column("Action", width=20)
+        table = self._main_table()
+        if not self._reuse_table_columns:
+            table.add_column("Setting", width=22)
+            table.add_column("Value", width=48)
+            table.add_column("Action", width=20)
         # Get current state
         state = self._get_watch_mode_state()
         # Status row
@@ -4021,7 +4966,8 @@ class AgentTUI(App[None]):
         if self.current_view != "assets":
             return None
 
-        table = self.query_one("#main-table", DataTable)
+        self._render_pending_view()
+        table = self._main_table()
         if table.cursor_row is None:
             return None
 
@@ -4098,6 +5044,8 @@ class AgentTUI(App[None]):
 
     def _handle_asset_detail_action(self, action: Optional[str]) -> None:
         """Handle action from asset detail dialog."""
+        from ..core.asset_installer import install_asset
+
         try:
             if not action or not hasattr(self, "_current_asset"):
                 return
@@ -4136,6 +5084,8 @@ class AgentTUI(App[None]):
 
     def _handle_uninstall_confirm(self, confirmed: bool) -> None:
         """Handle uninstall confirmation callback."""
+        from ..core.asset_installer import uninstall_asset
+
         try:
             if not confirmed or not hasattr(self, "_uninstall_asset_pending"):
                 return
@@ -4154,6 +5104,8 @@ class AgentTUI(App[None]):
 
     def _show_asset_diff_sync(self, asset: Asset) -> None:
         """Show diff between source and installed asset (sync version)."""
+        from ..core.asset_installer import get_asset_diff
+
         if not self.selected_target_dir:
             self.notify("Select a target directory first", severity="warning", timeout=2)
             return
@@ -4171,6 +5123,8 @@ class AgentTUI(App[None]):
 
     def _handle_diff_action(self, action: Optional[str]) -> None:
         """Handle diff viewer action callback."""
+        from ..core.asset_installer import install_asset
+
         try:
             if action != "apply" or not hasattr(self, "_diff_asset_pending"):
                 return
@@ -4238,6 +5192,8 @@ class AgentTUI(App[None]):
 
     def _handle_bulk_install(self, selected: Optional[List[str]]) -> None:
         """Handle bulk install dialog callback."""
+        from ..core.asset_installer import install_asset
+
         try:
             if not selected:
                 return
@@ -4299,6 +5255,8 @@ class AgentTUI(App[None]):
 
     def _handle_update_all_confirm(self, confirmed: bool) -> None:
         """Handle update all confirmation callback."""
+        from ..core.asset_installer import install_asset
+
         try:
             if not confirmed or not hasattr(self, "_assets_to_update"):
                 return
@@ -4335,7 +5293,8 @@ class AgentTUI(App[None]):
         if self.current_view != "memory":
             return None
 
-        table = self.query_one("#main-table", DataTable)
+        self._render_pending_view()
+        table = self._main_table()
         if table.cursor_row is None:
             return None
 
@@ -4357,7 +5316,6 @@ class AgentTUI(App[None]):
 
         # Read the note content
         try:
-            from ..memory import read_note, NoteType
             note_type = NoteType(note.note_type)
             content = read_note(note_type, note.title)
             if content:
@@ -4370,7 +5328,6 @@ class AgentTUI(App[None]):
 
     def _show_memory_note_dialog(self, note: MemoryNote, content: str) -> None:
         """Show a dialog with memory note content."""
-        from .dialogs import MemoryNoteDialog
         self._current_memory_note = note
         dialog = MemoryNoteDialog(note, content)
         self.push_screen(dialog, callback=self._handle_memory_note_action)
@@ -4384,8 +5341,6 @@ class AgentTUI(App[None]):
 
         if action == "open":
             try:
-                import subprocess
-                import os
                 editor = os.environ.get("EDITOR", "open" if os.name == "darwin" else "xdg-open")
                 subprocess.Popen([editor, note.path])
                 self.notify(f"Opened {note.title}", severity="information", timeout=2)
@@ -4410,9 +5365,6 @@ class AgentTUI(App[None]):
             return
 
         try:
-            import subprocess
-            import os
-
             editor = os.environ.get("EDITOR", "open" if os.name == "darwin" else "xdg-open")
             subprocess.Popen([editor, note.path])
             self.notify(f"Opened {note.title}", severity="information", timeout=2)
@@ -4489,7 +5441,7 @@ class AgentTUI(App[None]):
         """Preview the selected scenario definition."""
         if self.current_view != "scenarios":
             return
-        scenario = self._selected_scenario()
+        scenario = self._selected(self.scenarios)
         if not scenario:
             self.notify("Select a scenario to preview", severity="warning", timeout=2)
             return
@@ -4513,7 +5465,7 @@ class AgentTUI(App[None]):
         """Run the selected scenario in automatic mode."""
         if self.current_view != "scenarios":
             return
-        scenario = self._selected_scenario()
+        scenario = self._selected(self.scenarios)
         if not scenario:
             self.notify("Select a scenario to run", severity="warning", timeout=2)
             return
@@ -4561,7 +5513,7 @@ class AgentTUI(App[None]):
 
     async def _run_selected_workflow(self) -> None:
         """Run the highlighted workflow and stream output in a log viewer."""
-        workflow = self._selected_workflow()
+        workflow = self._selected(self.workflows)
         if not workflow:
             self.notify("Select a workflow to run", severity="warning", timeout=2)
             return
@@ -4593,7 +5545,7 @@ class AgentTUI(App[None]):
         self.update_view()
 
     async def _stop_selected_workflow(self) -> None:
-        workflow = self._selected_workflow()
+        workflow = self._selected(self.workflows)
         if not workflow:
             self.notify("Select a workflow to stop", severity="warning", timeout=2)
             return
@@ -4614,7 +5566,7 @@ class AgentTUI(App[None]):
         self.update_view()
 
     async def _stop_selected_scenario(self) -> None:
-        scenario = self._selected_scenario()
+        scenario = self._selected(self.scenarios)
         if not scenario:
             self.notify("Select a scenario to stop", severity="warning", timeout=2)
             return
@@ -4637,7 +5589,7 @@ class AgentTUI(App[None]):
         """Validate the selected scenario against the schema."""
         if self.current_view != "scenarios":
             return
-        scenario = self._selected_scenario()
+        scenario = self._selected(self.scenarios)
         if not scenario:
             self.notify("Select a scenario to validate", severity="warning", timeout=2)
             return
@@ -4674,14 +5626,14 @@ class AgentTUI(App[None]):
         """Switch to the agent galaxy visualization."""
         self.current_view = "galaxy"
         self.status_message = "Switched to Galaxy"
-        self.notify("🌌 Galaxy", severity="information", timeout=1)
+        self._notify_coalesced("🌌 Galaxy")
 
     def action_view_tasks(self) -> None:
         """Switch to tasks view."""
         self.load_agent_tasks()
         self.current_view = "tasks"
         self.status_message = "Switched to Tasks"
-        self.notify("🗂 Tasks", severity="information", timeout=1)
+        self._notify_coalesced("🗂 Tasks")
 
     def action_agent_view(self) -> None:
         """View the selected agent's definition (Enter key in agents view)."""
@@ -4695,7 +5647,7 @@ class AgentTUI(App[None]):
         if self.current_view != "profiles":
             return
 
-        profile = self._selected_profile()
+        profile = self._selected(self.profiles)
         if not profile:
             self.notify("Select a profile", severity="warning", timeout=2)
             return
@@ -4753,7 +5705,7 @@ class AgentTUI(App[None]):
         if self.current_view != "profiles":
             return
 
-        profile = self._selected_profile()
+        profile = self._selected(self.profiles)
         if not profile or profile.get("type") != "saved":
             self.notify(
                 "Select a saved profile to delete", severity="warning", timeout=2
@@ -4784,7 +5736,7 @@ class AgentTUI(App[None]):
         if self.current_view != "profiles":
             return
 
-        profile = self._selected_profile()
+        profile = self._selected(self.profiles)
         if not profile:
             self.notify("Select a profile first", severity="warning", timeout=2)
             return
@@ -5053,7 +6005,7 @@ class AgentTUI(App[None]):
         if self.current_view != "skills":
             self.action_view_skills()
 
-        skill = self._selected_skill()
+        skill = self._selected(self.skills)
         if not skill:
             self.notify("Select a skill to rate", severity="warning", timeout=2)
             return
@@ -5133,7 +6085,7 @@ class AgentTUI(App[None]):
         if self.current_view != "skills":
             self.action_view_skills()
 
-        skill = self._selected_skill()
+        skill = self._selected(self.skills)
         if not skill:
             self.notify("Select a skill to validate", severity="warning", timeout=2)
             return
@@ -5159,7 +6111,7 @@ class AgentTUI(App[None]):
         if self.current_view != "skills":
             self.action_view_skills()
 
-        skill = self._selected_skill()
+        skill = self._selected(self.skills)
         if not skill:
             self.notify("Select a skill to view metrics", severity="warning", timeout=2)
             return
@@ -5252,7 +6204,7 @@ class AgentTUI(App[None]):
 
     async def _show_selected_agent_definition(self) -> None:
         """Open the full agent definition for the selected agent."""
-        agent = self._selected_agent()
+        agent = self._selected(self.agents)
         if not agent:
             self.notify(
                 "Select an agent to view its definition",
@@ -5262,7 +6214,7 @@ class AgentTUI(App[None]):
             return
 
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             agent_path = self._validate_path(claude_dir, agent.path)
         except ValueError:
             agent_path = agent.path
@@ -5283,7 +6235,7 @@ class AgentTUI(App[None]):
 
     async def _show_selected_command_definition(self) -> None:
         """Open the selected slash command for review."""
-        command = self._selected_command()
+        command = self._selected(self.slash_commands)
         if not command:
             self.notify(
                 "Select a slash command to view details",
@@ -5293,7 +6245,7 @@ class AgentTUI(App[None]):
             return
 
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             command_path = self._validate_path(claude_dir, command.path)
         except ValueError:
             command_path = command.path
@@ -5351,7 +6303,7 @@ class AgentTUI(App[None]):
 
     async def _copy_agent_definition(self) -> None:
         """Copy the selected agent's definition to clipboard."""
-        agent = self._selected_agent()
+        agent = self._selected(self.agents)
         if not agent:
             self.notify(
                 "Select an agent to copy",
@@ -5361,7 +6313,7 @@ class AgentTUI(App[None]):
             return
 
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             agent_path = self._validate_path(claude_dir, agent.path)
         except ValueError:
             agent_path = agent.path
@@ -5406,7 +6358,7 @@ class AgentTUI(App[None]):
 
         mode = self.modes[index]
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             mode_path = self._validate_path(claude_dir, mode.path)
         except ValueError:
             mode_path = mode.path
@@ -5451,7 +6403,7 @@ class AgentTUI(App[None]):
 
         rule = self.rules[index]
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             rule_path = self._validate_path(claude_dir, rule.path)
         except ValueError:
             rule_path = rule.path
@@ -5482,7 +6434,7 @@ class AgentTUI(App[None]):
 
     async def _copy_skill_definition(self) -> None:
         """Copy the selected skill's definition to clipboard."""
-        skill = self._selected_skill()
+        skill = self._selected(self.skills)
         if not skill:
             self.notify(
                 "Select a skill to copy",
@@ -5518,7 +6470,7 @@ class AgentTUI(App[None]):
 
     async def _copy_command_definition(self) -> None:
         """Copy the selected command's definition to clipboard."""
-        command = self._selected_command()
+        command = self._selected(self.slash_commands)
         if not command:
             self.notify(
                 "Select a command to copy",
@@ -5528,7 +6480,7 @@ class AgentTUI(App[None]):
             return
 
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             command_path = self._validate_path(claude_dir, command.path)
         except ValueError:
             command_path = command.path
@@ -5575,7 +6527,7 @@ class AgentTUI(App[None]):
         if index is None:
             self.notify("Select a task to view details", severity="warning", timeout=2)
             return
-        tasks = getattr(self, "agent_tasks", [])
+        tasks = self.agent_tasks
         if not tasks or index >= len(tasks):
             self.notify("No task details available", severity="warning", timeout=2)
             return
@@ -5618,7 +6570,7 @@ class AgentTUI(App[None]):
         if index is None:
             self.notify("Select a task to open its log", severity="warning", timeout=2)
             return
-        tasks = getattr(self, "agent_tasks", [])
+        tasks = self.agent_tasks
         if not tasks or index >= len(tasks):
             self.notify("No task selected", severity="warning", timeout=2)
             return
@@ -5629,7 +6581,7 @@ class AgentTUI(App[None]):
 
         path = Path(task.source_path)
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             path = self._validate_path(claude_dir, path)
         except ValueError:
             path = Path(task.source_path)
@@ -5660,7 +6612,7 @@ class AgentTUI(App[None]):
         if index is None:
             self.notify("Select a task to open its log", severity="warning", timeout=2)
             return
-        tasks = getattr(self, "agent_tasks", [])
+        tasks = self.agent_tasks
         if not tasks or index >= len(tasks):
             self.notify("No task selected", severity="warning", timeout=2)
             return
@@ -5671,7 +6623,7 @@ class AgentTUI(App[None]):
 
         path = Path(task.source_path)
         try:
-            claude_dir = _resolve_claude_dir()
+            claude_dir = self._claude_dir
             path = self._validate_path(claude_dir, path)
         except ValueError:
             path = Path(task.source_path)
@@ -5775,7 +6727,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -5800,7 +6752,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -5821,7 +6773,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -5857,7 +6809,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -5880,7 +6832,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -5975,7 +6927,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -6012,7 +6964,7 @@ class AgentTUI(App[None]):
         if self.current_view != "mcp":
             self.action_view_mcp()
 
-        server = self._selected_mcp_server()
+        server = self._selected(self.mcp_servers)
         if not server:
             self.notify("Select an MCP server", severity="warning", timeout=2)
             return
@@ -6037,18 +6989,19 @@ class AgentTUI(App[None]):
             else:
                 self.notify(message, severity="error", timeout=3)
 
-    def action_auto_activate(self) -> None:
+    async def action_auto_activate(self) -> None:
         """Auto-activate agents or add task when in Tasks view."""
         if self.current_view == "tasks":
             dialog = TaskEditorDialog("Add Task")
             self.push_screen(dialog, callback=self._handle_add_task)
             return
 
-        if not hasattr(self, "intelligent_agent"):
+        intelligent_agent = self.intelligent_agent
+        if intelligent_agent is None:
             self.notify("AI Assistant not initialized", severity="error", timeout=2)
             return
 
-        auto_agents = self.intelligent_agent.get_auto_activations()
+        auto_agents = intelligent_agent.get_auto_activations()
 
         if not auto_agents:
             self.notify(
@@ -6056,15 +7009,12 @@ class AgentTUI(App[None]):
             )
             return
 
-        activated_count = 0
-        for agent_name in auto_agents:
-            try:
-                exit_code, message = agent_activate(agent_name)
-                if exit_code == 0:
-                    self.intelligent_agent.mark_auto_activated(agent_name)
-                    activated_count += 1
-            except Exception:
-                pass
+        # Activation moves files and rewrites the dependency map, so the batch
+        # runs sequentially, but off the event loop
+        activated = await asyncio.to_thread(self._activate_agents, auto_agents)
+        for agent_name in activated:
+            intelligent_agent.mark_auto_activated(agent_name)
+        activated_count = len(activated)
 
         if activated_count > 0:
             self.notify(
@@ -6077,9 +7027,22 @@ class AgentTUI(App[None]):
         else:
             self.notify("Failed to auto-activate agents", severity="error", timeout=2)
 
+    @staticmethod
+    def _activate_agents(agent_names: Sequence[str]) -> List[str]:
+        """Activate each agent in turn and return the names that succeeded."""
+        activated: List[str] = []
+        for agent_name in agent_names:
+            try:
+                exit_code, _message = agent_activate(agent_name)
+            except Exception:
+                continue
+            if exit_code == 0:
+                activated.append(agent_name)
+        return activated
+
     def _check_auto_activations(self) -> None:
         """Check for high-confidence auto-activations on startup."""
-        if not hasattr(self, "intelligent_agent"):
+        if self.intelligent_agent is None:
             return
 
         auto_agents = self.intelligent_agent.get_auto_activations()
@@ -6168,6 +7131,8 @@ class AgentTUI(App[None]):
 
     def action_toggle(self) -> None:  # type: ignore[override]
         """Toggle selected item."""
+        # The branches below read the table cursor directly
+        self._render_pending_view()
         if self.current_view == "profiles":
             self.action_profile_apply()
             return
@@ -6181,7 +7146,7 @@ class AgentTUI(App[None]):
             return
 
         if self.current_view == "export":
-            meta = self._selected_export_meta()
+            meta = self._selected(self.export_row_meta)
             if not meta:
                 self.notify("Select an export option", severity="warning", timeout=2)
                 return
@@ -6202,220 +7167,219 @@ class AgentTUI(App[None]):
             return
 
         if self.current_view == "agents":
-            table = self.query_one(DataTable)
+            table = self._main_table()
             if table.cursor_row is not None:
                 # Save current cursor position
                 saved_cursor_row = table.cursor_row
 
-                row_key = table.get_row_at(table.cursor_row)
-                if row_key and len(row_key) > 0:
-                    # Get plain text from first column (strip Rich markup and icons)
-                    from rich.text import Text
-
-                    raw_name = str(row_key[0])
-                    # Use Rich to strip markup, then remove icon emoji
-                    plain_text = Text.from_markup(raw_name).plain
-                    # Remove the icon (first character if it's an emoji)
-                    agent_name = plain_text.strip()
-                    if agent_name and len(agent_name) > 0 and ord(agent_name[0]) > 127:
-                        agent_name = agent_name[1:].strip()
-
-                    agent = next((a for a in self.agents if a.name == agent_name), None)
-                    if agent:
-                        try:
-                            if agent.status == "active":
-                                exit_code, message = agent_deactivate(agent.name)
-                            else:
-                                exit_code, message = agent_activate(agent.name)
-
-                            # Remove ANSI codes
-                            import re
+                # Rows are rendered in list order, so the cursor row indexes the list
+                agent = self._item_at_row(self.agents, table.cursor_row)
+                if agent:
+                    try:
+                        if agent.status == "active":
+                            exit_code, message = agent_deactivate(agent.name)
+                        else:
+                            exit_code, message = agent_activate(agent.name)
 
-                            clean_message = re.sub(r"\x1b\[[0-9;]*m", "", message)
-                            self.status_message = clean_message.split("\n")[0]
+                        # Only the first line is shown; strip ANSI codes from it alone
+                        first_line = message.split("\n", 1)[0]
+                        self.status_message = _ANSI_RE.sub("", first_line)
 
-                            if exit_code == 0:
-                                if agent.status == "active":
-                                    self.notify(
-                                        f"✓ Deactivated {agent.name}",
-                                        severity="information",
-                                        timeout=2,
-                                    )
-                                else:
-                                    self.notify(
-                                        f"✓ Activated {agent.name}",
-                                        severity="information",
-                                        timeout=2,
-                                    )
+                        if exit_code == 0:
+                            if agent.status == "active":
+                                self.notify(
+                                    f"✓ Deactivated {agent.name}",
+                                    severity="information",
+                                    timeout=2,
+                                )
+                            else:
+                                self.notify(
+                                    f"✓ Activated {agent.name}",
+                                    severity="information",
+                                    timeout=2,
+                                )
+                            if not self._apply_agent_toggle(agent):
                                 self.load_agents()
                                 self.update_view()
 
                                 # Restore cursor to same position (showing next agent)
-                                table = self.query_one(DataTable)
+                                table = self._main_table()
                                 if table.row_count > 0:
                                     # Keep at same index, or last row if we were at the end
                                     new_cursor_row = min(
                                         saved_cursor_row, table.row_count - 1
                                     )
                                     table.move_cursor(row=new_cursor_row)
-                            else:
-                                self.notify(
-                                    f"✗ Failed to toggle {agent.name}",
-                                    severity="error",
-                                    timeout=3,
-                                )
-                        except Exception as e:
-                            self.status_message = f"Error: {e}"
+                        else:
                             self.notify(
-                                f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                                f"✗ Failed to toggle {agent.name}",
+                                severity="error",
+                                timeout=3,
                             )
+                    except Exception as e:
+                        self.status_message = f"Error: {e}"
+                        self.notify(
+                            f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                        )
 
         elif self.current_view == "rules":
-            table = self.query_one(DataTable)
+            table = self._main_table()
             if table.cursor_row is not None:
                 # Save current cursor position
                 saved_cursor_row = table.cursor_row
 
-                row_key = table.get_row_at(table.cursor_row)
-                if row_key and len(row_key) > 0:
-                    # Get plain text from first column (strip Rich markup and icons)
-                    from rich.text import Text
-
-                    raw_name = str(row_key[0])
-                    # Use Rich to strip markup, then remove icon emoji
-                    plain_text = Text.from_markup(raw_name).plain
-                    # Remove the icon (first character if it's an emoji)
-                    rule_name = plain_text.strip()
-                    if rule_name and len(rule_name) > 0 and ord(rule_name[0]) > 127:
-                        rule_name = rule_name[1:].strip()
-
-                    rule = next((r for r in self.rules if r.name == rule_name), None)
-                    if rule:
-                        try:
-                            if rule.status == "active":
-                                message = rules_deactivate(rule.path.stem)
-                            else:
-                                message = rules_activate(rule.path.stem)
+                # Rows are rendered in list order, so the cursor row indexes the list
+                rule = self._item_at_row(self.rules, table.cursor_row)
+                if rule:
+                    try:
+                        # Call the component helpers directly for their exit code
+                        if rule.status == "active":
+                            exit_code, message = component_deactivate(
+                                "rules", rule.path.stem
+                            )
+                        else:
+                            exit_code, message = component_activate(
+                                "rules", rule.path.stem
+                            )
 
-                            # Remove ANSI codes
-                            import re
+                        # Only the first line is shown; strip ANSI codes from it alone
+                        first_line = message.split("\n", 1)[0]
+                        self.status_message = _ANSI_RE.sub("", first_line)
 
-                            clean_message = re.sub(r"\x1b\[[0-9;]*m", "", message)
-                            self.status_message = clean_message.split("\n")[0]
+                        if exit_code != 0:
+                            self.notify(
+                                f"✗ {_ANSI_RE.sub('', message)}",
+                                severity="error",
+                                timeout=5,
+                            )
+                            return
 
-                            if rule.status == "active":
-                                self.notify(
-                                    f"✓ Deactivated {rule.name}",
-                                    severity="information",
-                                    timeout=2,
-                                )
-                            else:
-                                self.notify(
-                                    f"✓ Activated {rule.name}",
-                                    severity="information",
-                                    timeout=2,
-                                )
+                        if rule.status == "active":
+                            self.notify(
+                                f"✓ Deactivated {rule.name}",
+                                severity="information",
+                                timeout=2,
+                            )
+                        else:
+                            self.notify(
+                                f"✓ Activated {rule.name}",
+                                severity="information",
+                                timeout=2,
+                            )
 
+                        # Rule state lives in CLAUDE.md, so only this row changes
+                        try:
+                            index = self.rules.index(rule)
+                        except ValueError:
                             self.load_rules()
                             self.update_view()
-
-                            # Restore cursor to same position (showing next rule)
-                            table = self.query_one(DataTable)
-                            if table.row_count > 0:
-                                new_cursor_row = min(
-                                    saved_cursor_row, table.row_count - 1
-                                )
-                                table.move_cursor(row=new_cursor_row)
-                        except Exception as e:
-                            self.status_message = f"Error: {e}"
-                            self.notify(
-                                f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                        else:
+                            new_status = (
+                                "inactive" if rule.status == "active" else "active"
+                            )
+                            self._replace_toggled_item(
+                                self.rules,
+                                index,
+                                replace(rule, status=new_status),
+                                "rules",
+                                Icons.DOC,
                             )
+                    except Exception as e:
+                        self.status_message = f"Error: {e}"
+                        self.notify(
+                            f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                        )
 
         elif self.current_view == "modes":
-            table = self.query_one(DataTable)
+            table = self._main_table()
             if table.cursor_row is not None:
                 # Save current cursor position
                 saved_cursor_row = table.cursor_row
 
-                row_key = table.get_row_at(table.cursor_row)
-                if row_key and len(row_key) > 0:
-                    # Get plain text from first column (strip Rich markup and icons)
-                    from rich.text import Text
-
-                    raw_name = str(row_key[0])
-                    # Use Rich to strip markup, then remove icon emoji
-                    plain_text = Text.from_markup(raw_name).plain
-                    # Remove the icon (first character if it's an emoji)
-                    mode_name = plain_text.strip()
-                    if mode_name and len(mode_name) > 0 and ord(mode_name[0]) > 127:
-                        mode_name = mode_name[1:].strip()
-
-                    mode = next((m for m in self.modes if m.name == mode_name), None)
-                    if mode:
-                        try:
+                # Rows are rendered in list order, so the cursor row indexes the list
+                mode = self._item_at_row(self.modes, table.cursor_row)
+                if mode:
+                    try:
+                        if mode.status == "active":
+                            # Use intelligent deactivation
+                            exit_code, message, affected_modes = mode_deactivate_intelligent(
+                                mode.path.stem
+                            )
+                        else:
+                            # Use intelligent activation
+                            exit_code, message, deactivated_modes = mode_activate_intelligent(
+                                mode.path.stem
+                            )
+
+                        # Only the first line is shown; strip ANSI codes from it alone
+                        first_line = message.split("\n", 1)[0]
+                        self.status_message = _ANSI_RE.sub("", first_line)
+
+                        if exit_code == 0:
+                            others_changed = (
+                                affected_modes
+                                if mode.status == "active"
+                                else deactivated_modes
+                            )
                             if mode.status == "active":
-                                # Use intelligent deactivation
-                                exit_code, message, affected_modes = mode_deactivate_intelligent(
-                                    mode.path.stem
+                                # Deactivation successful
+                                notify_msg = f"✓ Deactivated {mode.name}"
+                                if affected_modes:
+                                    notify_msg += f" (affects: {', '.join(affected_modes)})"
+                                self.notify(
+                                    notify_msg,
+                                    severity="warning"
+                                    if affected_modes
+                                    else "information",
+                                    timeout=3 if affected_modes else 2,
                                 )
                             else:
-                                # Use intelligent activation
-                                exit_code, message, deactivated_modes = mode_activate_intelligent(
-                                    mode.path.stem
+                                # Activation successful
+                                notify_msg = f"✓ Activated {mode.name}"
+                                if deactivated_modes:
+                                    notify_msg += f" (auto-deactivated: {', '.join(deactivated_modes)})"
+                                self.notify(
+                                    notify_msg,
+                                    severity="information",
+                                    timeout=3 if deactivated_modes else 2,
                                 )
-
-                            # Remove ANSI codes
-                            import re
-
-                            clean_message = re.sub(r"\x1b\[[0-9;]*m", "", message)
-                            self.status_message = clean_message.split("\n")[0]
-
-                            if exit_code == 0:
-                                if mode.status == "active":
-                                    # Deactivation successful
-                                    notify_msg = f"✓ Deactivated {mode.name}"
-                                    if affected_modes:
-                                        notify_msg += f" (affects: {', '.join(affected_modes)})"
-                                    self.notify(
-                                        notify_msg,
-                                        severity="warning"
-                                        if affected_modes
-                                        else "information",
-                                        timeout=3 if affected_modes else 2,
-                                    )
-                                else:
-                                    # Activation successful
-                                    notify_msg = f"✓ Activated {mode.name}"
-                                    if deactivated_modes:
-                                        notify_msg += f" (auto-deactivated: {', '.join(deactivated_modes)})"
-                                    self.notify(
-                                        notify_msg,
-                                        severity="information",
-                                        timeout=3 if deactivated_modes else 2,
-                                    )
+                            if not others_changed and mode in self.modes:
+                                # Only this mode changed; patch its row in place
+                                new_status = (
+                                    "inactive"
+                                    if mode.status == "active"
+                                    else "active"
+                                )
+                                self._replace_toggled_item(
+                                    self.modes,
+                                    self.modes.index(mode),
+                                    replace(mode, status=new_status),
+                                    "modes",
+                                    Icons.FILTER,
+                                )
+                            else:
                                 self.load_modes()
                                 self.update_view()
 
                                 # Restore cursor to same position (showing next mode)
-                                table = self.query_one(DataTable)
+                                table = self._main_table()
                                 if table.row_count > 0:
                                     new_cursor_row = min(
                                         saved_cursor_row, table.row_count - 1
                                     )
                                     table.move_cursor(row=new_cursor_row)
-                            else:
-                                # Show error message
-                                self.notify(
-                                    f"✗ {clean_message}",
-                                    severity="error",
-                                    timeout=5,
-                                )
-                        except Exception as e:
-                            self.status_message = f"Error: {e}"
+                        else:
+                            # Show error message
                             self.notify(
-                                f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                                f"✗ {_ANSI_RE.sub('', message)}",
+                                severity="error",
+                                timeout=5,
                             )
+                    except Exception as e:
+                        self.status_message = f"Error: {e}"
+                        self.notify(
+                            f"✗ Error: {str(e)[:50]}", severity="error", timeout=3
+                        )
 
     def action_refresh(self) -> None:
         """Refresh current view."""
@@ -6438,15 +7402,18 @@ class AgentTUI(App[None]):
         elif self.current_view == "tasks":
             self.load_agent_tasks()
         elif self.current_view == "mcp":
+            # Revalidate so doc and executable changes the config mtime misses show up
+            self._mcp_validation_cache.clear()
             self.load_mcp_servers()
         elif self.current_view == "profiles":
             self.load_profiles()
+        elif self.current_view == "ai_assistant":
+            self._ai_insights_cache = None
+            self._ai_view_cache = None
 
         self.update_view()
         self.status_message = f"Refreshed {self.current_view}"
-        self.notify(
-            f"🔄 Refreshed {self.current_view}", severity="information", timeout=1
-        )
+        self._notify_coalesced(f"🔄 Refreshed {self.current_view}")
 
     def action_help(self) -> None:
         """Show comprehensive keyboard shortcuts help."""
@@ -6466,7 +7433,7 @@ class AgentTUI(App[None]):
         content = generate_claude_md(config)
 
         # Write to file
-        claude_dir = _resolve_claude_dir()
+        claude_dir = self._claude_dir
         claude_md_path = claude_dir / "CLAUDE.md"
 
         try:
@@ -6522,6 +7489,14 @@ class AgentTUI(App[None]):
             self._on_command_selected,
         )
 
+    def _command_handler(self, command_action: str) -> Optional[Callable[[], Any]]:
+        """Resolve a palette action name to its bound action method, once."""
+        handlers = self._command_handlers
+        if command_action not in handlers:
+            method = getattr(self, f"action_{command_action}", None)
+            handlers[command_action] = method if callable(method) else None
+        return handlers[command_action]
+
     def _on_command_selected(self, command_action: Optional[str]) -> None:
         """Handle command selection from palette.
 
@@ -6531,9 +7506,12 @@ class AgentTUI(App[None]):
         if command_action:
             # Execute the action by name
             try:
-                action_method = getattr(self, f"action_{command_action}", None)
-                if action_method and callable(action_method):
-                    action_method()
+                action_method = self._command_handler(command_action)
+                if action_method is not None:
+                    result = action_method()
+                    # Async actions must be scheduled or they never run
+                    if asyncio.iscoroutine(result):
+                        self.run_worker(result)
                 else:
                     self.notify(
                         f"Unknown command action: {command_action}",
@@ -1,15 +1,21 @@
 """Enhanced Overview Dashboard - KAMEHAMEHA EDITION!"""
 
 from __future__ import annotations
+import functools
 from typing import Dict, List, Optional
 from .tui_icons import Icons
 from .token_counter import TokenStats
 
 
 class EnhancedOverview:
-    """Enhanced overview dashboard with MAXIMUM visual impact."""
+    """Enhanced overview dashboard with MAXIMUM visual impact.
+
+    Sections built only from counts (or nothing at all) are memoized, since the
+    overview re-renders them on every refresh with mostly unchanged inputs.
+    """
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def create_hero_banner(active_agents: int, total_agents: int) -> str:
         """Create a hero banner with large metrics."""
         pct = (active_agents / total_agents * 100) if total_agents > 0 else 0
@@ -66,6 +72,7 @@ class EnhancedOverview:
         return card.strip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def create_status_grid(
         agents_active: int,
         agents_total: int,
@@ -138,6 +145,7 @@ class EnhancedOverview:
         return grid.strip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_activity_timeline() -> str:
         """Create a visual activity timeline."""
         timeline = f"""
@@ -152,6 +160,7 @@ class EnhancedOverview:
         return timeline.strip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def create_system_health() -> str:
         """Create a system health indicator."""
         health = f"""
@@ -14,6 +14,12 @@ from claude_ctx_py.intelligence import (
     ContextDetector,
     IntelligentAgent,
 )
+from claude_ctx_py.intelligence.base import (
+    CONTEXT_API,
+    CONTEXT_BACKEND,
+    CONTEXT_FRONTEND,
+    CONTEXT_TESTS,
+)
 
 
 class TestSessionContext:
@@ -81,6 +87,32 @@ class TestSessionContext:
         assert result["session_start"] == now.isoformat()
         assert "active_agents" in result
 
+    def test_session_context_flags(self):
+        """Test packing detected contexts into bit flags."""
+        now = datetime.now()
+        context = SessionContext(
+            files_changed=[],
+            file_types=set(),
+            directories=set(),
+            has_tests=True,
+            has_auth=False,
+            has_api=True,
+            has_frontend=False,
+            has_backend=True,
+            has_database=False,
+            errors_count=0,
+            test_failures=0,
+            build_failures=0,
+            session_start=now,
+            last_activity=now,
+            active_agents=[],
+            active_modes=[],
+            active_rules=[],
+        )
+
+        assert context.flags == CONTEXT_TESTS | CONTEXT_API | CONTEXT_BACKEND
+        assert not context.flags & CONTEXT_FRONTEND
+
 
 class TestAgentRecommendation:
     """Tests for AgentRecommendation dataclass."""
@@ -600,6 +632,32 @@ class TestIntelligentAgent:
         # Should get security recommendation for auth files
         assert any(r.agent_name == "security-auditor" for r in recommendations)
 
+    def test_recommendations_reused_from_disk_cache(self, tmp_path):
+        """Test that a new agent reuses persisted predictions for the same context."""
+        data_dir = tmp_path / "intelligence"
+        files = [Path("auth/login.py")]
+
+        first = IntelligentAgent(data_dir)
+        first.analyze_context(files)
+        expected = first.get_recommendations()
+        assert (data_dir / "prediction_cache.json").exists()
+
+        second = IntelligentAgent(data_dir)
+        second.analyze_context(files)
+        with patch.object(second.learner, "predict_agents") as mock_predict:
+            recommendations = second.get_recommendations()
+
+        mock_predict.assert_not_called()
+        assert recommendations == expected
+
+        # A different context invalidates the cached predictions
+        second.analyze_context([Path("src/app.py")])
+        with patch.object(
+            second.learner, "predict_agents", return_value=[]
+        ) as mock_predict:
+            assert second.get_recommendations() == []
+        mock_predict.assert_called_once()
+
     def test_get_auto_activations(self, tmp_path):
         """Test getting auto-activations."""
         data_dir = tmp_path / "intelligence"
@@ -613,6 +671,24 @@ class TestIntelligentAgent:
         assert isinstance(auto_activations, list)
         assert "security-auditor" in auto_activations
 
+    def test_get_auto_activations_reused_until_reanalyzed(self, tmp_path):
+        """Test that auto-activations are computed once per context analysis."""
+        data_dir = tmp_path / "intelligence"
+        agent = IntelligentAgent(data_dir)
+        agent.analyze_context([Path("auth/login.py")])
+
+        first = agent.get_auto_activations()
+        with patch.object(agent, "get_recommendations") as mock_recs:
+            assert agent.get_auto_activations() == first
+        mock_recs.assert_not_called()
+
+        agent.analyze_context([Path("src/app.py")])
+        with patch.object(
+            agent, "get_recommendations", return_value=[]
+        ) as mock_recs:
+            assert agent.get_auto_activations() == []
+        mock_recs.assert_called_once()
+
     def test_mark_auto_activated(self, tmp_path):
         """Test marking agent as auto-activated."""
         data_dir = tmp_path / "intelligence"
@@ -0,0 +1,56 @@
+"""Tests for toggling rules from the TUI rules view."""
+
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+# Skip entire module if textual (tui dependency) is not available in the test env
+pytest.importorskip("textual")
+
+
+def test_failed_rule_activation_keeps_row_inactive(tmp_path, monkeypatch):
+    """A toggle that fails in CLAUDE.md must not mark the rule active."""
+    # Imported here so CLI tests that stub claude_ctx_py.tui are not shadowed
+    from claude_ctx_py.tui.main import AgentTUI
+
+    claude_dir = tmp_path / ".claude"
+    rules_dir = claude_dir / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "quality-rules.md").write_text(
+        "# Quality Rules\n\nKeep it tidy.\n", encoding="utf-8"
+    )
+    # No CLAUDE.md, so component_activate reports a failure
+    monkeypatch.setenv("CLAUDE_CTX_HOME", str(claude_dir))
+
+    notifications: List[Tuple[str, str]] = []
+
+    async def run() -> None:
+        app = AgentTUI()
+        async with app.run_test() as pilot:
+            app.current_view = "rules"
+            await pilot.pause()
+            app.load_rules()
+            app.update_view()
+            await pilot.pause()
+            assert [rule.status for rule in app.rules] == ["inactive"]
+
+            monkeypatch.setattr(
+                app,
+                "notify",
+                lambda message, **kwargs: notifications.append(
+                    (message, kwargs.get("severity", "information"))
+                ),
+            )
+            app.action_toggle()
+
+            assert [rule.status for rule in app.rules] == ["inactive"]
+            assert app._status_counts["rules"] == 0
+            assert "CLAUDE.md not found" in app.status_message
+
+    asyncio.run(run())
+
+    assert notifications
+    message, severity = notifications[-1]
+    assert severity == "error"
+    assert not message.startswith("✓")
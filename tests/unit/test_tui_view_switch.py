@@ -0,0 +1,51 @@
+"""Tests for actions that switch TUI view and then read the selection."""
+
+import asyncio
+
+import pytest
+
+# Skip entire module if textual (tui dependency) is not available in the test env
+pytest.importorskip("textual")
+
+
+def _write_fixture_tree(claude_dir):
+    agents_dir = claude_dir / "agents"
+    agents_dir.mkdir(parents=True)
+    for index in range(1, 5):
+        (agents_dir / f"agent-{index}.md").write_text(
+            f"---\nname: agent-{index}\ncategory: general\n---\n\nAgent {index}.\n",
+            encoding="utf-8",
+        )
+        skill_dir = claude_dir / "skills" / f"skill-{index}"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: skill-{index}\ndescription: Skill {index}\n---\n\nBody.\n",
+            encoding="utf-8",
+        )
+
+
+def test_view_switch_then_select_reads_the_new_view(tmp_path, monkeypatch):
+    """Switching view must not leave the previous view's cursor in place."""
+    # Imported here so CLI tests that stub claude_ctx_py.tui are not shadowed
+    from claude_ctx_py.tui.main import AgentTUI
+
+    claude_dir = tmp_path / ".claude"
+    _write_fixture_tree(claude_dir)
+    monkeypatch.setenv("CLAUDE_CTX_HOME", str(claude_dir))
+
+    async def run() -> None:
+        app = AgentTUI()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert app.current_view == "agents"
+            assert len(app.agents) == 4
+            app._main_table().move_cursor(row=3)
+            await pilot.pause()
+
+            app.action_view_skills()
+            selected = app._selected(app.skills)
+
+            assert len(app.skills) == 4
+            assert selected is app.skills[0]
+
+    asyncio.run(run())